@@ -0,0 +1,50 @@
+"""Add indexes for hot lookup columns
+
+Revision ID: 3f1c9a7e2b64
+Revises: 702d4d7ca5c4
+Create Date: 2026-10-19 09:12:44.120391
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c9a7e2b64'
+down_revision: Union[str, Sequence[str], None] = '702d4d7ca5c4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Dashboard trends and "recent activity" filter/sort on creation time
+    op.create_index('ix_resume_data_created_at', 'resume_data', ['created_at'], unique=False)
+
+    # Foreign keys used when loading a resume with its children.
+    # resume_analysis.resume_id is already covered by its unique constraint.
+    op.create_index('ix_experiences_resume_id', 'experiences', ['resume_id'], unique=False)
+    op.create_index('ix_education_resume_id', 'education', ['resume_id'], unique=False)
+    op.create_index('ix_projects_resume_id', 'projects', ['resume_id'], unique=False)
+    op.create_index('ix_resume_skills_resume_id', 'resume_skills', ['resume_id'], unique=False)
+
+    # Admin logs are always read newest first; id breaks timestamp ties
+    op.create_index('ix_admin_logs_timestamp_id', 'admin_logs', ['timestamp', 'id'], unique=False)
+
+    # Range scans over expired reset tokens.
+    # Token lookups already use the unique index on password_reset_tokens.token,
+    # and users.email is covered by its unique constraint.
+    op.create_index('ix_password_reset_tokens_expires_at', 'password_reset_tokens', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_password_reset_tokens_expires_at', table_name='password_reset_tokens')
+    op.drop_index('ix_admin_logs_timestamp_id', table_name='admin_logs')
+    op.drop_index('ix_resume_skills_resume_id', table_name='resume_skills')
+    op.drop_index('ix_projects_resume_id', table_name='projects')
+    op.drop_index('ix_education_resume_id', table_name='education')
+    op.drop_index('ix_experiences_resume_id', table_name='experiences')
+    op.drop_index('ix_resume_data_created_at', table_name='resume_data')
@@ -0,0 +1,32 @@
+"""Add admin_logs index for per-admin pagination
+
+Revision ID: 8b2e4d61c0f7
+Revises: 3f1c9a7e2b64
+Create Date: 2026-10-19 10:03:17.482915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b2e4d61c0f7'
+down_revision: Union[str, Sequence[str], None] = '3f1c9a7e2b64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keyset pagination of the admin log filtered by admin
+    op.create_index(
+        'ix_admin_logs_admin_email_timestamp', 'admin_logs',
+        ['admin_email', 'timestamp', 'id'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_admin_logs_admin_email_timestamp', table_name='admin_logs')
@@ -0,0 +1,32 @@
+"""Add resume_data fingerprint for deduplicating saves
+
+Revision ID: c5d81f3a9e27
+Revises: 8b2e4d61c0f7
+Create Date: 2026-10-19 15:41:08.273164
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5d81f3a9e27'
+down_revision: Union[str, Sequence[str], None] = '8b2e4d61c0f7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing rows keep a NULL fingerprint: the resume dicts they were saved
+    # from are gone, and NULLs do not collide in a unique index.
+    op.add_column('resume_data', sa.Column('fingerprint', sa.String(length=64), nullable=True))
+    op.create_index('ix_resume_data_fingerprint', 'resume_data', ['fingerprint'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_resume_data_fingerprint', table_name='resume_data')
+    op.drop_column('resume_data', 'fingerprint')
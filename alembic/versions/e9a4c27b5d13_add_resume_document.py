@@ -0,0 +1,144 @@
+"""Add resume_data JSONB document with a GIN index on its skills
+
+Revision ID: e9a4c27b5d13
+Revises: c5d81f3a9e27
+Create Date: 2026-10-19 16:22:51.904718
+
+"""
+import ast
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e9a4c27b5d13'
+down_revision: Union[str, Sequence[str], None] = 'c5d81f3a9e27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 500
+
+resume_data = sa.table(
+    'resume_data',
+    sa.column('id', sa.Integer), sa.column('name', sa.Text), sa.column('email', sa.Text),
+    sa.column('phone', sa.Text), sa.column('linkedin', sa.Text), sa.column('github', sa.Text),
+    sa.column('portfolio', sa.Text), sa.column('summary', sa.Text), sa.column('target_role', sa.Text),
+    sa.column('target_category', sa.Text), sa.column('skills', sa.Text), sa.column('template', sa.Text),
+    sa.column('document', postgresql.JSONB)
+)
+
+# Child tables and the columns copied into each document section
+CHILDREN = {
+    'experience': ('experiences', ('company', 'position', 'start_date', 'end_date', 'description')),
+    'education': ('education', ('school', 'degree', 'field', 'graduation_date', 'gpa')),
+    'projects': ('projects', ('name', 'technologies', 'description', 'link')),
+}
+
+
+# Frozen copy of config.resume_document as of this revision, so the backfill
+# keeps producing the same documents if the application's normalization changes
+EMPTY = (None, '', [], {})
+
+
+def _canonical(value):
+    """Whitespace-normalized copy of a resume value, without empty fields"""
+    if isinstance(value, str):
+        return ' '.join(value.split())
+    if isinstance(value, dict):
+        items = ((str(key), _canonical(item)) for key, item in value.items())
+        return {key: item for key, item in items if item not in EMPTY}
+    if isinstance(value, (list, tuple)):
+        return [item for item in map(_canonical, value) if item not in EMPTY]
+    return value
+
+
+def _skill_tags(skills):
+    """Sorted, lowercased, de-duplicated skill names from a dict, list or comma-separated string"""
+    if isinstance(skills, dict):
+        skills = [skill for values in skills.values() for skill in (values if isinstance(values, list) else [values])]
+    elif isinstance(skills, str):
+        skills = skills.split(',')
+    return sorted({' '.join(str(skill).split()).lower() for skill in skills or [] if str(skill).strip()})
+
+
+def _resume_document(data):
+    """The canonical resume with the email lowercased and skill_tags added"""
+    document = _canonical(data)
+    personal_info = document.get('personal_info')
+    if isinstance(personal_info, dict) and isinstance(personal_info.get('email'), str):
+        personal_info['email'] = personal_info['email'].lower()
+    tags = _skill_tags(data.get('skills'))
+    if tags:
+        document['skill_tags'] = tags
+    return json.loads(json.dumps(document, default=str))
+
+
+def _parse_skills(value):
+    """skills was saved as str(list) or str(dict); fall back to a comma-separated string"""
+    try:
+        return ast.literal_eval(value) if value else []
+    except (ValueError, SyntaxError):
+        return value
+
+
+def _backfill(conn):
+    """Build documents for existing rows from their columns and child rows, in id order"""
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            sa.select(resume_data)
+            .where(resume_data.c.id > last_id, resume_data.c.document.is_(None))
+            .order_by(resume_data.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).mappings().all()
+        if not rows:
+            return
+        ids = [row['id'] for row in rows]
+        sections = {row_id: {key: [] for key in CHILDREN} for row_id in ids}
+        for key, (table_name, columns) in CHILDREN.items():
+            child = sa.table(table_name, sa.column('id', sa.Integer), sa.column('resume_id', sa.Integer),
+                             *(sa.column(c, sa.Text) for c in columns))
+            for child_row in conn.execute(
+                sa.select(child).where(child.c.resume_id.in_(ids)).order_by(child.c.id)
+            ).mappings():
+                sections[child_row['resume_id']][key].append({c: child_row[c] for c in columns})
+
+        for row in rows:
+            data = {
+                'personal_info': {
+                    'full_name': row['name'], 'email': row['email'], 'phone': row['phone'],
+                    'linkedin': row['linkedin'], 'github': row['github'], 'portfolio': row['portfolio'],
+                },
+                'summary': row['summary'],
+                'target_role': row['target_role'],
+                'target_category': row['target_category'],
+                'skills': _parse_skills(row['skills']),
+                'template': row['template'],
+                **sections[row['id']],
+            }
+            conn.execute(
+                resume_data.update().where(resume_data.c.id == row['id']).values(document=_resume_document(data))
+            )
+        last_id = ids[-1]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('resume_data', sa.Column('document', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+    _backfill(op.get_bind())
+    # jsonb_path_ops keeps the index small; it supports the @> containment operator only
+    op.create_index(
+        'ix_resume_data_skill_tags', 'resume_data',
+        [sa.text("(document -> 'skill_tags') jsonb_path_ops")],
+        unique=False, postgresql_using='gin'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_resume_data_skill_tags', table_name='resume_data', postgresql_using='gin')
+    op.drop_column('resume_data', 'document')
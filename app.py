@@ -12,36 +12,25 @@ st.set_page_config(
 )
 
 import uuid
-import requests
 from utils.logger import setup_logger
-from utils.resume_analyzer import ResumeAnalyzer as OldResumeAnalyzer
-
-from utils.resume_builder import ResumeBuilder
-from config.database import (
-    verify_admin, log_admin_action
+from utils.assets import get_asset_manager, FALLBACK_LOTTIE
+from utils.metrics import start_metrics_server
+from ui_components import render_sidebar
+from views.registry import import_module, lazy_callable
+from services.container import (
+    RESET_PASSWORD_PAGE, get_router, get_dashboard_manager,
+    get_old_analyzer, get_resume_builder
 )
-from config.job_roles import JOB_ROLES
-from dashboard.dashboard import DashboardManager
-from ui_components import render_sidebar, clean_page_name
-
-# Import Views
-from views.home import render_home
 
-from views.builder import render_builder
-from views.dashboard_view import render_dashboard
-from views.job_search import render_job_search
-from views.feedback import render_feedback_page
-from views.about import render_about
-from views.cover_letter import render_cover_letter_page
-from views.portfolio import render_portfolio_page
-from views.signup import render_signup
-from views.signin import render_signin
-from views.forgot_password import render_forgot_password
-from views.reset_password import render_reset_password
-from views.ats_optimizer import render_ats_optimizer
+# config.database connects on import, so it is only loaded when an admin action needs it
+verify_admin = lazy_callable("config.database", "verify_admin")
+log_admin_action = lazy_callable("config.database", "log_admin_action")
 
 logger = setup_logger(__name__)
 
+# Prometheus endpoint, only when METRICS_PORT is set; started once per process
+start_metrics_server()
+
 class ResumeApp:
     def __init__(self):
         """Initialize the application"""
@@ -82,35 +71,15 @@ class ResumeApp:
         if 'user_email' not in st.session_state:
             st.session_state.user_email = None
         
-        # Initialize managers
-        self.dashboard_manager = DashboardManager()
-        self.old_analyzer = OldResumeAnalyzer()
-
-        self.builder = ResumeBuilder()
-        self.job_roles = JOB_ROLES
-        
-        # Define pages with their rendering functions
-        self.pages = {
-            "🏠 HOME": render_home,
-
-            "📝 RESUME BUILDER": lambda: render_builder(self.builder),
-            "🎯 ATS RESUME OPTIMIZER": render_ats_optimizer,
-            "✉️ COVER LETTER GENERATOR": render_cover_letter_page,
-            "🌐 PORTFOLIO VIEWER": render_portfolio_page,
-            "📊 DASHBOARD": lambda: render_dashboard(self.dashboard_manager),
-            "🎯 JOB SEARCH": render_job_search,
-            "💬 FEEDBACK": render_feedback_page,
-            "ℹ️ ABOUT": render_about,
-            "🔑 SIGN IN": render_signin,
-            "📝 SIGN UP": render_signup,
-            "🔑 FORGOT PASSWORD": render_forgot_password,
-        }
+        # Managers and routing tables are built once per process and shared
+        self.router = get_router()
+        self.pages = self.router.pages
         
         # Initialize session state
         if 'user_id' not in st.session_state:
             # Generate a unique user ID for this session
             st.session_state.user_id = str(uuid.uuid4())
-            logger.info(f"New session started with User ID: {st.session_state.user_id}")
+            logger.info("New session started with User ID: %s", st.session_state.user_id)
             
         if 'selected_role' not in st.session_state:
             st.session_state.selected_role = None
@@ -118,9 +87,9 @@ class ResumeApp:
         # Database is now managed by Alembic, no init needed here.
         # init_database()
         
-        # Load external CSS
-        with open('style/style.css') as f:
-            st.markdown(f'<style>{f.read()}</style>', unsafe_allow_html=True)
+        # Load external CSS (read once per process)
+        self.assets = get_asset_manager()
+        st.markdown(self.assets.get_css('style.css'), unsafe_allow_html=True)
         
         # Load Google Fonts
         st.markdown("""
@@ -128,49 +97,25 @@ class ResumeApp:
             <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/5.15.4/css/all.min.css">
         """, unsafe_allow_html=True)
 
-    def load_lottie_url(self, url: str):
-        """Load Lottie animation from URL with fallback"""
-        try:
-            r = requests.get(url, timeout=5)  # Add timeout
-            if r.status_code == 200:
-                return r.json()
-        except (requests.RequestException, ValueError):
-            pass
-        
-        # Fallback: return a simple loading animation
-        return {
-            "v": "5.7.4",
-            "fr": 60,
-            "ip": 0,
-            "op": 120,
-            "w": 200,
-            "h": 200,
-            "assets": [],
-            "layers": [{
-                "ddd": 0,
-                "ind": 1,
-                "ty": 4,
-                "nm": "Circle",
-                "sr": 1,
-                "ks": {
-                    "o": {"a": 0, "k": 100},
-                    "r": {
-                        "a": 1,
-                        "k": [{"t": 0, "s": [0]}, {"t": 120, "s": [360]}],
-                        "ix": 10
-                    },
-                    "p": {"a": 0, "k": [100, 100, 0]},
-                    "a": {"a": 0, "k": [0, 0, 0]},
-                    "s": {"a": 0, "k": [100, 100, 100]}
-                },
-                "shapes": [{
-                    "ty": "el",
-                    "p": {"a": 0, "k": [0, 0]},
-                    "s": {"a": 0, "k": [60, 60]},
-                    "c": {"a": 0, "k": [0, 0.6, 1]}
-                }]
-            }]
-        }
+    @property
+    def dashboard_manager(self):
+        return get_dashboard_manager()
+
+    @property
+    def old_analyzer(self):
+        return get_old_analyzer()
+
+    @property
+    def builder(self):
+        return get_resume_builder()
+
+    @property
+    def job_roles(self):
+        return import_module("config.job_roles").JOB_ROLES
+
+    def load_lottie_url(self, url: str, name: str = None):
+        """Load Lottie animation from the bundled assets, fetching it only if it is not bundled"""
+        return self.assets.get_lottie(url, name) or FALLBACK_LOTTIE
 
     def main(self):
         """Main application entry point"""
@@ -178,7 +123,7 @@ class ResumeApp:
         # Handle page routing from query parameters
         query_params = st.query_params
         if "page" in query_params and query_params["page"] == "reset_password":
-            render_reset_password()
+            self.router.render(RESET_PASSWORD_PAGE)
             return
 
         # Admin login/logout in sidebar
@@ -203,29 +148,8 @@ class ResumeApp:
         # Get current page and render it
         current_page = st.session_state.get('page', 'home')
         
-        # Create a mapping of cleaned page names to original names
-        page_mapping = {clean_page_name(name): name for name in self.pages.keys()}
-        
-        # Handle aliases and normalization
-        aliases = {
-
-            'builder': 'resume_builder',
-            'insights': 'dashboard',
-            'forgot_password': 'forgot_password'
-        }
-        
-        # Normalize current_page to ensure it matches page_mapping keys
-        # 1. Check aliases first (e.g. 'builder' -> 'resume_builder')
-        # 2. If not in aliases, try cleaning the name (e.g. "Resume Analyzer" -> "resume_analyzer")
-        current_page_lower = str(current_page).lower().strip()
-        target_page = aliases.get(current_page_lower, clean_page_name(str(current_page)))
-        
-        # Render the appropriate page
-        if target_page in page_mapping:
-            self.pages[page_mapping[target_page]]()
-        else:
-            # Default to home page if invalid page
-            render_home()
+        # Render the appropriate page, defaulting to home for unknown pages
+        self.router.render(self.router.resolve(current_page))
     
 if __name__ == "__main__":
     app = ResumeApp()
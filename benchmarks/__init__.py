@@ -0,0 +1 @@
+# Benchmark entry points for Smart Resume AI (run with `python -m benchmarks.<name>`)
@@ -0,0 +1,157 @@
+"""
+Stand-in for the streamlit module, so pages can be imported and rendered
+outside a Streamlit server.
+
+Widgets return their default value (buttons are never clicked, inputs are
+empty, select boxes hold their first option), layout helpers return
+elements that work as context managers, and st.rerun()/st.stop() raise
+ScriptControl so a render ends where Streamlit would end the script run.
+"""
+import datetime
+import sys
+import types
+
+
+class ScriptControl(Exception):
+    """Raised by st.rerun() and st.stop()."""
+
+
+class AttrDict(dict):
+    """dict with attribute access, like st.session_state and st.secrets"""
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def __setattr__(self, name, value):
+        self[name] = value
+
+    def __delattr__(self, name):
+        self.pop(name, None)
+
+
+class Element:
+    """Return value of display and layout calls; supports `with` and chained calls."""
+
+    def __init__(self, module):
+        self._module = module
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def __call__(self, *args, **kwargs):
+        return self
+
+    def __iter__(self):
+        return iter(())
+
+    def __bool__(self):
+        return False
+
+    def __getattr__(self, name):
+        return getattr(self._module, name)
+
+
+def _cache_decorator(func=None, **kwargs):
+    def wrap(f):
+        cache = {}
+
+        def cached(*args, **kw):
+            key = (args, tuple(sorted(kw.items())))
+            if key not in cache:
+                cache[key] = f(*args, **kw)
+            return cache[key]
+        cached.clear = cache.clear
+        cached.__wrapped__ = f
+        return cached
+    return wrap(func) if callable(func) else wrap
+
+
+class MockStreamlit(types.ModuleType):
+    def __init__(self, secrets=None):
+        super().__init__("streamlit")
+        self.session_state = AttrDict()
+        self.secrets = AttrDict(secrets or {})
+        self.query_params = AttrDict()
+        self.sidebar = Element(self)
+        self.cache_resource = _cache_decorator
+        self.cache_data = _cache_decorator
+        self.calls = 0
+
+    def __getattr__(self, name):
+        # Any display call not listed below (markdown, title, plotly_chart, ...)
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return self._element
+
+    def _element(self, *args, **kwargs):
+        self.calls += 1
+        return Element(self)
+
+    def _count(self, n):
+        return len(n) if isinstance(n, (list, tuple)) else int(n)
+
+    def columns(self, spec, **kwargs):
+        return [Element(self) for _ in range(self._count(spec))]
+
+    def tabs(self, labels, **kwargs):
+        return [Element(self) for _ in labels]
+
+    def button(self, *args, **kwargs):
+        return False
+
+    form_submit_button = download_button = checkbox = toggle = button
+
+    def text_input(self, *args, value="", **kwargs):
+        return value
+
+    text_area = text_input
+
+    def number_input(self, *args, value=None, min_value=None, **kwargs):
+        return value if value is not None else (min_value or 0)
+
+    def slider(self, *args, value=None, min_value=0, **kwargs):
+        return value if value is not None else min_value
+
+    select_slider = slider
+
+    def selectbox(self, label, options=(), index=0, **kwargs):
+        options = list(options)
+        return options[index] if options and index is not None else None
+
+    radio = selectbox
+
+    def multiselect(self, *args, default=None, **kwargs):
+        return list(default or [])
+
+    def file_uploader(self, *args, **kwargs):
+        return None
+
+    camera_input = file_uploader
+
+    def date_input(self, *args, value=None, **kwargs):
+        return value or datetime.date.today()
+
+    def rerun(self, *args, **kwargs):
+        raise ScriptControl("rerun")
+
+    def stop(self):
+        raise ScriptControl("stop")
+
+    def set_page_config(self, *args, **kwargs):
+        pass
+
+
+def install(secrets=None) -> MockStreamlit:
+    """Replace streamlit (and streamlit_lottie) in sys.modules with the mock"""
+    st = MockStreamlit(secrets)
+    sys.modules["streamlit"] = st
+    lottie = types.ModuleType("streamlit_lottie")
+    lottie.st_lottie = st._element
+    sys.modules["streamlit_lottie"] = lottie
+    return st
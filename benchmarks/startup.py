@@ -0,0 +1,278 @@
+"""
+Measure cold-start costs: module import times, database engine creation,
+the job role data load and the first render of every page.
+
+Each measurement runs in a fresh interpreter, so it includes everything the
+module pulls in that was not already loaded. Streamlit is replaced by
+benchmarks.mock_streamlit (the real streamlit import is measured on its
+own), and the database is a scratch SQLite file in a temporary working
+directory. Page timings start from a booted app: "import" is the cost of
+the modules the page adds and "render" is its first render.
+
+Usage:
+    python -m benchmarks.startup --output startup.json
+    python -m benchmarks.startup --repeat 5 --compare previous-release.json
+"""
+import argparse
+import json
+import os
+import pkgutil
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPORT_VERSION = 1
+BREAKDOWN_SIZE = 20
+
+
+def _package_modules(package):
+    path = os.path.join(ROOT, package)
+    return [f"{package}.{m.name}" for m in pkgutil.iter_modules([path]) if not m.name.startswith("_")]
+
+
+def import_targets():
+    return ["streamlit", "app", "config.database"] + _package_modules("views") + _package_modules("utils")
+
+
+def _ms(start):
+    return round((time.perf_counter() - start) * 1000, 3)
+
+
+# Worker side: runs in the child interpreter and prints one JSON object
+
+def _install_mock():
+    from benchmarks import mock_streamlit
+    return mock_streamlit.install(secrets={
+        "supabase": {"url": os.environ["STARTUP_BENCH_DB_URL"]},
+        "GROQ_API_KEY": "benchmark-key"
+    })
+
+
+def worker_import(target):
+    if target != "streamlit":
+        _install_mock()
+    start = time.perf_counter()
+    __import__(target)
+    return {"ms": _ms(start)}
+
+
+def worker_engine():
+    _install_mock()
+    import config.database as database
+    database.get_engine.clear()
+    start = time.perf_counter()
+    engine = database.get_engine()
+    create_ms = _ms(start)
+    start = time.perf_counter()
+    with engine.connect():
+        pass
+    return {"create_ms": create_ms, "first_connect_ms": _ms(start)}
+
+
+def worker_job_roles():
+    import config.job_config as job_config
+    job_config._job_roles = None
+    start = time.perf_counter()
+    roles = job_config.load_job_roles()
+    return {"ms": _ms(start), "roles": sum(len(r) for r in roles.values()) if roles else 0}
+
+
+def worker_page(name):
+    st = _install_mock()
+    from benchmarks.mock_streamlit import ScriptControl
+    from sqlalchemy import create_engine
+    from config.models import Base
+    Base.metadata.create_all(create_engine(os.environ["STARTUP_BENCH_DB_URL"]))
+
+    # Start from a booted app, so session state holds ResumeApp's defaults and
+    # the page import only counts modules the page itself adds
+    import app
+    registry = app.ResumeApp().router.registry
+    start = time.perf_counter()
+    registry.resolve(name)
+    import_ms = _ms(start)
+
+    status = "ok"
+    st.calls = 0
+    start = time.perf_counter()
+    try:
+        registry.render(name)
+    except ScriptControl as e:
+        status = f"ok ({e})"
+    except Exception as e:
+        status = f"error: {type(e).__name__}: {e}"
+    return {"import_ms": import_ms, "render_ms": _ms(start), "elements": st.calls, "status": status}
+
+
+def worker_page_names():
+    _install_mock()
+    from services.container import build_page_registry
+    return {"pages": build_page_registry().names()}
+
+
+WORKERS = {
+    "import": worker_import,
+    "engine": worker_engine,
+    "job_roles": worker_job_roles,
+    "page": worker_page,
+    "page_names": worker_page_names,
+}
+
+
+# Parent side
+
+def run_worker(workdir, kind, target=None):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = ROOT + os.pathsep + env.get("PYTHONPATH", "")
+    env["STARTUP_BENCH_DB_URL"] = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+    cmd = [sys.executable, "-m", "benchmarks.startup", "--worker", kind]
+    if target is not None:
+        cmd += ["--target", target]
+    result = subprocess.run(cmd, cwd=workdir, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        return {"error": result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "failed"}
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def summarize(samples):
+    """Median of every numeric field over repeated runs; other fields from the first run"""
+    if any("error" in s for s in samples):
+        return next(s for s in samples if "error" in s)
+    summary = dict(samples[0])
+    for key, value in samples[0].items():
+        if isinstance(value, (int, float)) and key.endswith("ms"):
+            values = [s[key] for s in samples]
+            summary[key] = round(statistics.median(values), 3)
+            summary[f"{key}_samples"] = values
+    return summary
+
+
+def measure(workdir, kind, target=None, repeat=1):
+    return summarize([run_worker(workdir, kind, target) for _ in range(repeat)])
+
+
+def import_breakdown(workdir):
+    """Slowest modules (cumulative) when importing app, from python -X importtime"""
+    code = "from benchmarks import mock_streamlit; mock_streamlit.install(); import app"
+    env = dict(os.environ, PYTHONPATH=ROOT, STARTUP_BENCH_DB_URL="sqlite://")
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            cwd=workdir, env=env, capture_output=True, text=True)
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append({
+            "module": name.strip(),
+            "self_ms": int(self_us) / 1000,
+            "cumulative_ms": int(cumulative_us) / 1000
+        })
+    return sorted(rows, key=lambda r: -r["cumulative_ms"])[:BREAKDOWN_SIZE]
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def run(repeat=1, pages=True):
+    with tempfile.TemporaryDirectory() as workdir:
+        # The app reads its stylesheet and bundled assets relative to the working directory
+        shutil.copytree(os.path.join(ROOT, "style"), os.path.join(workdir, "style"))
+        report = {
+            "version": REPORT_VERSION,
+            "generated_at": datetime.now().isoformat(timespec="seconds"),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": repeat,
+            "streamlit": "mocked",
+            "imports": {t: measure(workdir, "import", t, repeat) for t in import_targets()},
+            "app_import_breakdown": import_breakdown(workdir),
+            "engine": measure(workdir, "engine", repeat=repeat),
+            "job_roles": measure(workdir, "job_roles", repeat=repeat),
+            "pages": {}
+        }
+        if pages:
+            for name in run_worker(workdir, "page_names").get("pages", []):
+                report["pages"][name] = measure(workdir, "page", name, repeat)
+    return report
+
+
+def flatten(report):
+    """{metric name: milliseconds} for comparing two reports"""
+    metrics = {}
+    for module, result in report.get("imports", {}).items():
+        if "ms" in result:
+            metrics[f"import {module}"] = result["ms"]
+    for key in ("create_ms", "first_connect_ms"):
+        if key in report.get("engine", {}):
+            metrics[f"engine {key[:-3]}"] = report["engine"][key]
+    if "ms" in report.get("job_roles", {}):
+        metrics["job roles load"] = report["job_roles"]["ms"]
+    for page, result in report.get("pages", {}).items():
+        for key in ("import_ms", "render_ms"):
+            if key in result:
+                metrics[f"page {page} {key[:-3]}"] = result[key]
+    return metrics
+
+
+def print_report(report, baseline=None):
+    current = flatten(report)
+    previous = flatten(baseline) if baseline else {}
+    header = f"{'metric':<48}{'ms':>10}"
+    if baseline:
+        header += f"{'baseline':>10}{'change':>9}"
+    print(header)
+    for name, value in current.items():
+        line = f"{name:<48}{value:>10.1f}"
+        if name in previous:
+            before = previous[name]
+            change = f"{(value - before) / before * 100:+.0f}%" if before else "n/a"
+            line += f"{before:>10.1f}{change:>9}"
+        print(line)
+
+    failures = {k: v for k, v in {**report.get("imports", {}), **report.get("pages", {})}.items()
+                if "error" in v or str(v.get("status", "")).startswith("error")}
+    for name, result in failures.items():
+        print(f"\n[{name}] {result.get('error') or result.get('status')}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", help="Write the JSON report to this file (default: stdout summary only)")
+    parser.add_argument("--compare", help="Earlier JSON report to compare against")
+    parser.add_argument("--repeat", type=int, default=3, help="Cold runs per measurement")
+    parser.add_argument("--skip-pages", action="store_true", help="Do not render pages")
+    parser.add_argument("--worker", choices=sorted(WORKERS), help=argparse.SUPPRESS)
+    parser.add_argument("--target", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        func = WORKERS[args.worker]
+        result = func(args.target) if args.target is not None else func()
+        print(json.dumps(result))
+        return
+
+    report = run(repeat=args.repeat, pages=not args.skip_pages)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,7 @@
+from types import MappingProxyType
+
+from utils.readonly import freeze
+
 # Course recommendations organized by job categories
 COURSES_BY_CATEGORY = {
     "Software Development and Engineering": {
@@ -166,16 +170,27 @@ INTERVIEW_VIDEOS = {
     ]
 }
 
+# Shared by every caller, so frozen: lists become tuples and dicts read-only mappings
+COURSES_BY_CATEGORY = freeze(COURSES_BY_CATEGORY)
+RESUME_VIDEOS = freeze(RESUME_VIDEOS)
+INTERVIEW_VIDEOS = freeze(INTERVIEW_VIDEOS)
+
+def _build_role_indexes():
+    """Map each role to its courses and category; the first category listing a role wins"""
+    courses_by_role, category_by_role = {}, {}
+    for category, roles in COURSES_BY_CATEGORY.items():
+        for role, courses in roles.items():
+            courses_by_role.setdefault(role, courses)
+            category_by_role.setdefault(role, category)
+    return MappingProxyType(courses_by_role), MappingProxyType(category_by_role)
+
+# Built once at import so role lookups are O(1); read-only like the data above
+_COURSES_BY_ROLE, _CATEGORY_BY_ROLE = _build_role_indexes()
+
 def get_courses_for_role(role_name):
     """Helper function to get courses for a specific role"""
-    for category, roles in COURSES_BY_CATEGORY.items():
-        if role_name in roles:
-            return roles[role_name]
-    return None
+    return _COURSES_BY_ROLE.get(role_name)
 
 def get_category_for_role(role_name):
     """Helper function to get the category for a specific role"""
-    for category, roles in COURSES_BY_CATEGORY.items():
-        if role_name in roles:
-            return category
-    return None
\ No newline at end of file
+    return _CATEGORY_BY_ROLE.get(role_name)
@@ -1,15 +1,21 @@
 import os
+import json
 import logging
+import threading
+import time
 from contextlib import contextmanager
 from datetime import datetime, timedelta
 
-import bcrypt
 import streamlit as st
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, func
+from sqlalchemy import create_engine, func, and_, or_, cast, literal_column, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy.exc import IntegrityError, OperationalError
 
+from services.auth_service import get_auth_service
+from utils.metrics import timed
+from .resume_document import resume_document, resume_fingerprint, skill_tags
 from .models import (
     Admin, AdminLog, User, PasswordResetToken,
     ResumeData, Experience, Education, Project, ResumeAnalysis
@@ -17,6 +23,32 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# Number of admin log rows shown per dashboard page
+ADMIN_LOG_PAGE_SIZE = 50
+
+# Lifetime of a password reset token
+RESET_TOKEN_TTL = timedelta(hours=1)
+
+# Maximum number of expired reset tokens deleted per sweep batch
+TOKEN_SWEEP_BATCH_SIZE = 500
+
+# Seconds the read replica may trail the primary before reads go back to the primary
+REPLICA_MAX_LAG = float(os.getenv("DB_REPLICA_MAX_LAG", "30"))
+
+# Seconds between replica lag checks
+REPLICA_CHECK_INTERVAL = float(os.getenv("DB_REPLICA_CHECK_INTERVAL", "10"))
+
+# Seconds to wait for a replica connection before reading from the primary
+REPLICA_CONNECT_TIMEOUT = int(os.getenv("DB_REPLICA_CONNECT_TIMEOUT", "3"))
+
+# Replay lag of a PostgreSQL standby; 0 once it has replayed everything it received
+REPLICA_LAG_SQL = """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+"""
+
 # --- SQLAlchemy Engine and Session Setup ---
 
 @st.cache_resource
@@ -34,7 +66,7 @@ def get_engine():
                 db_url = "postgresql" + db_url[len("postgres"):]
             logger.info("Connecting to DB using Streamlit secrets (Supabase).")
     except Exception as e:
-        logger.warning(f"Could not connect using Streamlit secrets, falling back to env vars. Error: {e}")
+        logger.warning("Could not connect using Streamlit secrets, falling back to env vars. Error: %s", e)
 
     # Fallback to environment variables if secrets are not available
     if not db_url:
@@ -50,19 +82,110 @@ def get_engine():
             return None
         
         db_url = f"postgresql://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
-        logger.info(f"Connecting to DB using environment variables.")
+        logger.info("Connecting to DB using environment variables.")
 
     try:
         engine = create_engine(db_url)
         return engine
     except Exception as e:
         st.error(f"Database connection failed. Please check your configuration. Error: {e}")
-        logger.error(f"Could not create SQLAlchemy engine: {e}", exc_info=True)
+        logger.error("Could not create SQLAlchemy engine: %s", e, exc_info=True)
+        return None
+
+@st.cache_resource
+def get_read_engine():
+    """
+    Create and cache the engine for the read replica, or None without one.
+
+    The replica URL comes from st.secrets["supabase"]["replica_url"] or the
+    DB_REPLICA_URL environment variable.
+    """
+    db_url = None
+    try:
+        if "supabase" in st.secrets and "replica_url" in st.secrets["supabase"]:
+            db_url = st.secrets["supabase"]["replica_url"]
+    except Exception as e:
+        logger.warning("Could not read the replica URL from Streamlit secrets: %s", e)
+    db_url = db_url or os.getenv("DB_REPLICA_URL")
+    if not db_url:
         return None
+    if db_url.startswith("postgres://"):
+        db_url = "postgresql" + db_url[len("postgres"):]
+
+    try:
+        # Bound the connect so a lag check or read cannot hang on a dead replica
+        timeout_arg = "timeout" if db_url.startswith("sqlite") else "connect_timeout"
+        engine = create_engine(db_url, pool_pre_ping=True, connect_args={timeout_arg: REPLICA_CONNECT_TIMEOUT})
+        logger.info("Routing read-only queries to the read replica.")
+        return engine
+    except Exception as e:
+        logger.error("Could not create read replica engine, reading from the primary: %s", e, exc_info=True)
+        return None
+
+class ReplicaMonitor:
+    """
+    Decides whether reads may go to the replica.
+
+    The replica's lag is measured at most once per `check_interval` seconds.
+    It is used while the lag is within `max_lag`; when it falls behind, or
+    cannot be reached, reads go to the primary until the next check.
+    """
+
+    def __init__(self, engine, max_lag=REPLICA_MAX_LAG, check_interval=REPLICA_CHECK_INTERVAL, clock=time.monotonic):
+        self.engine = engine
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self.clock = clock
+        self.lag = None
+        self._usable = False
+        self._checked_at = None
+        self._lock = threading.Lock()
+
+    def measure_lag(self):
+        """Replica lag in seconds; databases without replication stats report 0"""
+        with self.engine.connect() as conn:
+            if conn.dialect.name == 'postgresql':
+                return float(conn.execute(text(REPLICA_LAG_SQL)).scalar() or 0)
+            conn.execute(text("SELECT 1"))
+            return 0.0
+
+    def is_usable(self):
+        if self.engine is None:
+            return False
+        now = self.clock()
+        with self._lock:
+            if self._checked_at is not None and now - self._checked_at < self.check_interval:
+                return self._usable
+            # Claim the check so concurrent readers use the last result meanwhile
+            self._checked_at = now
+
+        try:
+            self.lag = self.measure_lag()
+            usable = self.lag <= self.max_lag
+            if not usable:
+                logger.warning("Read replica is %.1fs behind (max %.1fs), reading from the primary", self.lag, self.max_lag)
+        except Exception as e:
+            self.lag = None
+            usable = False
+            logger.warning("Read replica unavailable, reading from the primary: %s", e)
+        self._usable = usable
+        return usable
+
+    def mark_unusable(self, error):
+        """Send reads to the primary until the next lag check, after a failed replica read"""
+        with self._lock:
+            self.lag = None
+            self._usable = False
+            self._checked_at = self.clock()
+        logger.warning("Read replica query failed, reading from the primary: %s", error)
 
 engine = get_engine()
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+read_engine = get_read_engine()
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine) if read_engine is not None else None
+replica_monitor = ReplicaMonitor(read_engine)
+
 @contextmanager
 def get_db():
     """Provide a transactional scope around a series of operations."""
@@ -72,70 +195,115 @@ def get_db():
     finally:
         db.close()
 
+def read_with_fallback(query):
+    """
+    Run `query(db)` for a read-only query that tolerates replica lag.
+
+    Uses the read replica when one is configured and within REPLICA_MAX_LAG,
+    otherwise the primary. If the replica fails mid-read with an
+    OperationalError, it is marked unusable until the next lag check and the
+    query is rerun on the primary. Reads that must see the caller's own
+    writes (sign-in, reset tokens, duplicate checks) use get_db() instead.
+    """
+    if ReadSessionLocal is not None and replica_monitor.is_usable():
+        db = ReadSessionLocal()
+        try:
+            return query(db)
+        except OperationalError as e:
+            replica_monitor.mark_unusable(e)
+        finally:
+            db.close()
+    with get_db() as db:
+        return query(db)
+
 # --- ORM-based Data Functions ---
 
 def add_user(email, password):
     """Add a new user with a hashed password to the users table."""
-    hashed_password = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
-    new_user = User(email=email, password=hashed_password)
-    
     with get_db() as db:
         try:
+            # Inside the try: the hash can time out waiting for the bcrypt pool
+            hashed_password = get_auth_service().hash_password(password)
+            new_user = User(email=email, password=hashed_password)
             db.add(new_user)
             db.commit()
             return True
         except IntegrityError:
             db.rollback()
-            logger.warning(f"Attempted to add existing user: {email}")
+            logger.warning("Attempted to add existing user: %s", email)
             return False
         except Exception as e:
             db.rollback()
-            logger.error(f"Error adding user: {e}", exc_info=True)
+            logger.error("Error adding user: %s", e, exc_info=True)
             return False
 
 def verify_user(email, password):
-    """Verify user credentials using bcrypt from the users table."""
+    """
+    Verify user credentials using bcrypt from the users table.
+
+    The hash check runs on the auth service pool after the session is closed,
+    so no database connection is held for the duration of the hash. Hashes
+    made with an outdated work factor are upgraded on successful sign-in.
+    """
     with get_db() as db:
         try:
-            user = db.query(User).filter(User.email == email).first()
-            if user and bcrypt.checkpw(password.encode('utf-8'), user.password.encode('utf-8')):
-                return True
-            return False
+            stored_hash = db.query(User.password).filter(User.email == email).scalar()
         except Exception as e:
-            logger.error(f"Error verifying user: {e}", exc_info=True)
+            logger.error("Error verifying user: %s", e, exc_info=True)
             return False
 
+    if not stored_hash:
+        return False
+
+    auth_service = get_auth_service()
+    try:
+        if not auth_service.check_password(password, stored_hash):
+            return False
+    except Exception as e:
+        logger.error("Error verifying user: %s", e, exc_info=True)
+        return False
+
+    if auth_service.needs_rehash(stored_hash):
+        update_user_password(email, password)
+    return True
+
 def add_admin(email, password):
     """Add a new admin with a hashed password."""
-    hashed_password = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
-    new_admin = Admin(email=email, password=hashed_password)
-    
     with get_db() as db:
         try:
+            # Inside the try: the hash can time out waiting for the bcrypt pool
+            hashed_password = get_auth_service().hash_password(password)
+            new_admin = Admin(email=email, password=hashed_password)
             db.add(new_admin)
             db.commit()
             return True
         except IntegrityError:
             db.rollback()
-            logger.warning(f"Attempted to add existing admin: {email}")
+            logger.warning("Attempted to add existing admin: %s", email)
             return False
         except Exception as e:
             db.rollback()
-            logger.error(f"Error adding admin: {e}", exc_info=True)
+            logger.error("Error adding admin: %s", e, exc_info=True)
             return False
 
 def verify_admin(email, password):
-    """Verify admin credentials using bcrypt."""
+    """Verify admin credentials using bcrypt on the auth service pool."""
     with get_db() as db:
         try:
-            admin = db.query(Admin).filter(Admin.email == email).first()
-            if admin and bcrypt.checkpw(password.encode('utf-8'), admin.password.encode('utf-8')):
-                return True
-            return False
+            stored_hash = db.query(Admin.password).filter(Admin.email == email).scalar()
         except Exception as e:
-            logger.error(f"Error verifying admin: {e}", exc_info=True)
+            logger.error("Error verifying admin: %s", e, exc_info=True)
             return False
 
+    if not stored_hash:
+        return False
+
+    try:
+        return get_auth_service().check_password(password, stored_hash)
+    except Exception as e:
+        logger.error("Error verifying admin: %s", e, exc_info=True)
+        return False
+
 def log_admin_action(admin_email, action):
     """Log admin login/logout actions."""
     new_log = AdminLog(admin_email=admin_email, action=action)
@@ -145,13 +313,14 @@ def log_admin_action(admin_email, action):
             db.commit()
         except Exception as e:
             db.rollback()
-            logger.error(f"Error logging admin action: {e}", exc_info=True)
+            logger.error("Error logging admin action: %s", e, exc_info=True)
 
 def update_user_password(email, new_password):
     """Updates the user's password in the users table."""
-    hashed_password = bcrypt.hashpw(new_password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
     with get_db() as db:
         try:
+            # The session connects lazily, so no connection is held during the hash
+            hashed_password = get_auth_service().hash_password(new_password)
             user = db.query(User).filter(User.email == email).first()
             if user:
                 user.password = hashed_password
@@ -160,34 +329,79 @@ def update_user_password(email, new_password):
             return False
         except Exception as e:
             db.rollback()
-            logger.error(f"Error updating user password: {e}", exc_info=True)
+            logger.error("Error updating user password: %s", e, exc_info=True)
             return False
 
 def store_reset_token(email, token):
-    """Stores a password reset token in the database."""
-    expires_at = datetime.now() + timedelta(hours=1)
+    """
+    Stores a password reset token in the database.
+
+    Each write also sweeps one bounded batch of expired tokens. Every stored
+    token produces at most one expired row, so the sweep keeps pace with the
+    inserts and the table size stays bounded without a separate scheduler.
+    """
+    expires_at = datetime.now() + RESET_TOKEN_TTL
     new_token = PasswordResetToken(email=email, token=token, expires_at=expires_at)
     with get_db() as db:
         try:
             db.add(new_token)
             db.commit()
-            return True
         except Exception as e:
             db.rollback()
-            logger.error(f"Error storing reset token: {e}", exc_info=True)
+            logger.error("Error storing reset token: %s", e, exc_info=True)
             return False
 
+    purge_expired_reset_tokens(max_batches=1)
+    return True
+
+def purge_expired_reset_tokens(batch_size=TOKEN_SWEEP_BATCH_SIZE, max_batches=None):
+    """
+    Deletes expired password reset tokens in batches of at most `batch_size`.
+
+    Each batch is a range scan on the expires_at index followed by a delete by
+    primary key, committed on its own so locks are held only briefly. Stops
+    when no expired tokens remain or after `max_batches` batches.
+    Returns the number of tokens deleted.
+    """
+    deleted = 0
+    batches = 0
+    with get_db() as db:
+        try:
+            while max_batches is None or batches < max_batches:
+                expired_ids = [
+                    row.id for row in db.query(PasswordResetToken.id)
+                    .filter(PasswordResetToken.expires_at <= datetime.now())
+                    .order_by(PasswordResetToken.expires_at)
+                    .limit(batch_size)
+                ]
+                if not expired_ids:
+                    break
+
+                deleted += db.query(PasswordResetToken).filter(
+                    PasswordResetToken.id.in_(expired_ids)
+                ).delete(synchronize_session=False)
+                db.commit()
+                batches += 1
+
+                if len(expired_ids) < batch_size:
+                    break
+        except Exception as e:
+            db.rollback()
+            logger.error("Error purging expired reset tokens: %s", e, exc_info=True)
+    return deleted
+
 def get_user_email_by_token(token):
     """Retrieves the user's email for a given valid token."""
     with get_db() as db:
         try:
+            # Single probe on the unique token index; expiry is checked on that row only
             record = db.query(PasswordResetToken).filter(
                 PasswordResetToken.token == token,
                 PasswordResetToken.expires_at > datetime.now()
             ).first()
             return record.email if record else None
         except Exception as e:
-            logger.error(f"Error retrieving user by token: {e}", exc_info=True)
+            logger.error("Error retrieving user by token: %s", e, exc_info=True)
             return None
 
 def delete_reset_token(token):
@@ -198,10 +412,23 @@ def delete_reset_token(token):
             db.commit()
         except Exception as e:
             db.rollback()
-            logger.error(f"Error deleting reset token: {e}", exc_info=True)
+            logger.error("Error deleting reset token: %s", e, exc_info=True)
 
-def save_resume_data(data):
-    """Save resume data using ORM."""
+def _find_resume_id(db, fingerprint):
+    row = db.query(ResumeData.id).filter(ResumeData.fingerprint == fingerprint).first()
+    return row.id if row else None
+
+def get_resume_id(data):
+    """Id of the saved resume identical to `data`, or None; an index lookup on the fingerprint."""
+    with get_db() as db:
+        return _find_resume_id(db, resume_fingerprint(data))
+
+def _columns_only(model, data):
+    """The keys of `data` that are columns of `model`; the rest lives in the document only."""
+    return {key: value for key, value in data.items() if key in model.__table__.columns and key != 'id'}
+
+def _build_resume(data, fingerprint=None):
+    """ResumeData row, with its child rows, for a resume dict from the builder."""
     personal_info = data.get('personal_info', {})
     
     new_resume = ResumeData(
@@ -215,29 +442,115 @@ def save_resume_data(data):
         target_role=data.get('target_role', ''),
         target_category=data.get('target_category', ''),
         skills=str(data.get('skills', [])), # Keeping this simple for now
-        template=data.get('template', '')
+        template=data.get('template', ''),
+        fingerprint=fingerprint,
+        document=resume_document(data)
     )
 
     for exp_data in data.get('experience', []):
-        new_resume.experiences.append(Experience(**exp_data))
+        new_resume.experiences.append(Experience(**_columns_only(Experience, exp_data)))
     
     for edu_data in data.get('education', []):
-        new_resume.education.append(Education(**edu_data))
+        new_resume.education.append(Education(**_columns_only(Education, edu_data)))
 
     for proj_data in data.get('projects', []):
-        new_resume.projects.append(Project(**proj_data))
+        new_resume.projects.append(Project(**_columns_only(Project, proj_data)))
+    return new_resume
+
+@timed("db.save_resume_data")
+def save_resume_data(data):
+    """
+    Save resume data using ORM.
+
+    A resume identical to one already saved is not inserted again; the
+    existing row's id is returned instead.
+    """
+    fingerprint = resume_fingerprint(data)
+    new_resume = _build_resume(data, fingerprint)
 
     with get_db() as db:
         try:
+            existing_id = _find_resume_id(db, fingerprint)
+            if existing_id is not None:
+                return existing_id
             db.add(new_resume)
+            db.flush()
+            resume_id = new_resume.id
             db.commit()
-            db.refresh(new_resume)
-            return new_resume.id
+            return resume_id
+        except IntegrityError:
+            # The same resume was saved by another session since the check
+            db.rollback()
+            return _find_resume_id(db, fingerprint)
         except Exception as e:
             db.rollback()
-            logger.error(f"Error saving resume data: {e}", exc_info=True)
+            logger.error("Error saving resume data: %s", e, exc_info=True)
             return None
 
+@timed("db.save_resume_data_batch")
+def save_resume_data_batch(items):
+    """
+    Save several resumes in one transaction; returns their ids, in order.
+
+    Duplicates, within the batch or of saved resumes, map to one row.
+    Unlike save_resume_data, errors are raised after the rollback, so the
+    caller (the write-behind queue) can retry the batch.
+    """
+    fingerprints = [resume_fingerprint(data) for data in items]
+    if not fingerprints:
+        return []
+    unique = dict(zip(fingerprints, items))
+    with get_db() as db:
+        try:
+            ids = dict(
+                db.query(ResumeData.fingerprint, ResumeData.id)
+                .filter(ResumeData.fingerprint.in_(list(unique)))
+                .all()
+            )
+            new_resumes = [_build_resume(data, fp) for fp, data in unique.items() if fp not in ids]
+            db.add_all(new_resumes)
+            db.flush()
+            ids.update((resume.fingerprint, resume.id) for resume in new_resumes)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+    return [ids[fp] for fp in fingerprints]
+
+def get_resume_document(resume_id):
+    """The full normalized resume saved under `resume_id`, in one row fetch; None if absent."""
+    row = read_with_fallback(
+        lambda db: db.query(ResumeData.document).filter(ResumeData.id == resume_id).first()
+    )
+    return row.document if row else None
+
+def get_resumes_with_skills(skills, limit=None):
+    """
+    Newest resumes listing every one of `skills` (case-insensitive).
+
+    Returns dicts with the resume id and its document. On PostgreSQL the
+    containment test (document -> 'skill_tags' @> ...) is served by the
+    ix_resume_data_skill_tags GIN index; other databases scan json_each.
+    """
+    tags = skill_tags(skills)
+
+    def query_resumes(db):
+        query = db.query(ResumeData.id, ResumeData.document).filter(ResumeData.document.isnot(None))
+        if db.get_bind().dialect.name == 'postgresql':
+            query = query.filter(
+                # Literal key, so the expression matches the index definition
+                ResumeData.document.op('->')(literal_column("'skill_tags'")).op('@>')(cast(json.dumps(tags), JSONB))
+            )
+        else:
+            for i, tag in enumerate(tags):
+                query = query.filter(text(
+                    f"EXISTS (SELECT 1 FROM json_each(resume_data.document, '$.skill_tags') "
+                    f"WHERE json_each.value = :tag_{i})"
+                ).bindparams(**{f"tag_{i}": tag}))
+        return query.order_by(ResumeData.created_at.desc(), ResumeData.id.desc()).limit(limit).all()
+
+    return [{"id": row.id, "document": row.document} for row in read_with_fallback(query_resumes)]
+
 def save_analysis_data(resume_id, analysis):
     """Save resume analysis data using ORM."""
     new_analysis = ResumeAnalysis(
@@ -255,72 +568,107 @@ def save_analysis_data(resume_id, analysis):
             db.commit()
         except Exception as e:
             db.rollback()
-            logger.error(f"Error saving analysis data: {e}", exc_info=True)
+            logger.error("Error saving analysis data: %s", e, exc_info=True)
 
 def get_resume_stats():
     """Get statistics about resumes using ORM."""
-    with get_db() as db:
-        try:
-            total_resumes = db.query(func.count(ResumeData.id)).scalar()
-            avg_ats_score = db.query(func.avg(ResumeAnalysis.ats_score)).scalar() or 0
-            
-            recent_activity_query = db.query(
-                ResumeData.name,
-                ResumeData.target_role,
-                Resume_data.created_at
-            ).order_by(ResumeData.created_at.desc()).limit(5).all()
-
-            # Convert to list of dicts to match previous output format if needed
-            recent_activity = [
-                {"name": r.name, "target_role": r.target_role, "created_at": r.created_at}
-                for r in recent_activity_query
-            ]
-            
-            return {
-                'total_resumes': total_resumes,
-                'avg_ats_score': round(float(avg_ats_score), 2),
-                'recent_activity': recent_activity
-            }
-        except Exception as e:
-            logger.error(f"Error getting resume stats: {e}", exc_info=True)
-            return None
+    def query_stats(db):
+        total_resumes = db.query(func.count(ResumeData.id)).scalar()
+        avg_ats_score = db.query(func.avg(ResumeAnalysis.ats_score)).scalar() or 0
+
+        recent_activity_query = db.query(
+            ResumeData.name,
+            ResumeData.target_role,
+            ResumeData.created_at
+        ).order_by(ResumeData.created_at.desc()).limit(5).all()
+
+        # Convert to list of dicts to match previous output format if needed
+        recent_activity = [
+            {"name": r.name, "target_role": r.target_role, "created_at": r.created_at}
+            for r in recent_activity_query
+        ]
+
+        return {
+            'total_resumes': total_resumes,
+            'avg_ats_score': round(float(avg_ats_score), 2),
+            'recent_activity': recent_activity
+        }
+
+    try:
+        return read_with_fallback(query_stats)
+    except Exception as e:
+        logger.error("Error getting resume stats: %s", e, exc_info=True)
+        return None
 
 def get_all_resume_data():
     """Get all resume data for admin dashboard using ORM."""
-    with get_db() as db:
-        try:
-            # Query using join and return objects
-            results = db.query(ResumeData).outerjoin(ResumeAnalysis).order_by(ResumeData.created_at.desc()).all()
-            
-            # Format data to be similar to old RealDictCursor output
-            data_list = []
-            for r in results:
-                data = {
-                    "id": r.id, "name": r.name, "email": r.email, "phone": r.phone,
-                    "linkedin": r.linkedin, "github": r.github, "portfolio": r.portfolio,
-                    "target_role": r.target_role, "target_category": r.target_category,
-                    "created_at": r.created_at,
-                    "ats_score": r.analysis.ats_score if r.analysis else None,
-                    "keyword_match_score": r.analysis.keyword_match_score if r.analysis else None,
-                    "format_score": r.analysis.format_score if r.analysis else None,
-                    "section_score": r.analysis.section_score if r.analysis else None
-                }
-                data_list.append(data)
-            return data_list
-        except Exception as e:
-            logger.error(f"Error getting all resume data: {e}", exc_info=True)
-            return []
+    def query_resumes(db):
+        # Query using join and return objects
+        results = db.query(ResumeData).outerjoin(ResumeAnalysis).order_by(ResumeData.created_at.desc()).all()
 
-def get_admin_logs():
-    """Get all admin logs using ORM."""
-    with get_db() as db:
-        try:
-            # Query and return list of dicts to match old format
-            logs = db.query(AdminLog).order_by(AdminLog.timestamp.desc()).all()
-            return [
-                {"admin_email": log.admin_email, "action": log.action, "timestamp": log.timestamp}
-                for log in logs
-            ]
-        except Exception as e:
-            logger.error(f"Error getting admin logs: {e}", exc_info=True)
-            return []
+        # Format data to be similar to old RealDictCursor output
+        data_list = []
+        for r in results:
+            data = {
+                "id": r.id, "name": r.name, "email": r.email, "phone": r.phone,
+                "linkedin": r.linkedin, "github": r.github, "portfolio": r.portfolio,
+                "target_role": r.target_role, "target_category": r.target_category,
+                "created_at": r.created_at,
+                "ats_score": r.analysis.ats_score if r.analysis else None,
+                "keyword_match_score": r.analysis.keyword_match_score if r.analysis else None,
+                "format_score": r.analysis.format_score if r.analysis else None,
+                "section_score": r.analysis.section_score if r.analysis else None
+            }
+            data_list.append(data)
+        return data_list
+
+    try:
+        return read_with_fallback(query_resumes)
+    except Exception as e:
+        logger.error("Error getting all resume data: %s", e, exc_info=True)
+        return []
+
+def get_admin_logs_page(limit=ADMIN_LOG_PAGE_SIZE, cursor=None, admin_email=None, start=None, end=None):
+    """
+    Get one page of admin logs, newest first, using keyset pagination.
+
+    `cursor` is the (timestamp, id) pair of the last row of the previous page,
+    so each page is a single index range scan on (timestamp, id) no matter how
+    deep the admin pages. `start` is inclusive and `end` exclusive.
+
+    Returns a dict with the page's logs and the cursor of the next page,
+    which is None when there are no older rows.
+    """
+    def query_page(db):
+        query = db.query(AdminLog)
+        if admin_email:
+            query = query.filter(AdminLog.admin_email == admin_email)
+        if start is not None:
+            query = query.filter(AdminLog.timestamp >= start)
+        if end is not None:
+            query = query.filter(AdminLog.timestamp < end)
+        if cursor is not None:
+            last_timestamp, last_id = cursor
+            query = query.filter(or_(
+                AdminLog.timestamp < last_timestamp,
+                and_(AdminLog.timestamp == last_timestamp, AdminLog.id < last_id)
+            ))
+
+        # Fetch one extra row to know whether an older page exists
+        return query.order_by(AdminLog.timestamp.desc(), AdminLog.id.desc()).limit(limit + 1).all()
+
+    try:
+        rows = read_with_fallback(query_page)
+    except Exception as e:
+        logger.error("Error getting admin logs page: %s", e, exc_info=True)
+        return {"logs": [], "next_cursor": None}
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    return {
+        "logs": [
+            {"id": log.id, "admin_email": log.admin_email, "action": log.action, "timestamp": log.timestamp}
+            for log in rows
+        ],
+        "next_cursor": (rows[-1].timestamp, rows[-1].id) if has_more else None
+    }
@@ -1,7 +1,8 @@
 from sqlalchemy import (
     create_engine, Column, Integer, String, Text, DateTime,
-    ForeignKey, REAL
+    ForeignKey, REAL, Index, JSON, text
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import declarative_base, relationship
 from sqlalchemy.sql import func
 
@@ -28,12 +29,19 @@ class AdminLog(Base):
     action = Column(String, nullable=False)
     timestamp = Column(DateTime(timezone=True), server_default=func.now())
 
+    __table_args__ = (
+        # Newest-first listing of the admin activity log
+        Index('ix_admin_logs_timestamp_id', 'timestamp', 'id'),
+        # Same listing filtered to a single admin
+        Index('ix_admin_logs_admin_email_timestamp', 'admin_email', 'timestamp', 'id'),
+    )
+
 class PasswordResetToken(Base):
     __tablename__ = 'password_reset_tokens'
     id = Column(Integer, primary_key=True)
     email = Column(String, nullable=False)
     token = Column(String, nullable=False, unique=True)
-    expires_at = Column(DateTime(timezone=True), nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
 
 class ResumeData(Base):
     __tablename__ = 'resume_data'
@@ -49,7 +57,21 @@ class ResumeData(Base):
     target_category = Column(Text)
     skills = Column(Text)  # Storing as string, could be improved to a related table
     template = Column(Text)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # sha256 of the canonical resume JSON; NULL for rows saved before fingerprinting
+    fingerprint = Column(String(64))
+    # The whole normalized resume, see config.database.resume_document; JSONB on PostgreSQL
+    document = Column(JSON().with_variant(JSONB(), 'postgresql'))
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+
+    __table_args__ = (
+        # One row per distinct resume; also serves the existence check on save
+        Index('ix_resume_data_fingerprint', 'fingerprint', unique=True),
+        # Skill containment (document -> 'skill_tags' @> '["python"]'); GIN exists on PostgreSQL only
+        Index(
+            'ix_resume_data_skill_tags', text("(document -> 'skill_tags') jsonb_path_ops"),
+            postgresql_using='gin'
+        ).ddl_if(dialect='postgresql'),
+    )
     
     # Relationships
     experiences = relationship("Experience", back_populates="resume", cascade="all, delete-orphan")
@@ -61,7 +83,7 @@ class ResumeData(Base):
 class Experience(Base):
     __tablename__ = 'experiences'
     id = Column(Integer, primary_key=True)
-    resume_id = Column(Integer, ForeignKey('resume_data.id'), nullable=False)
+    resume_id = Column(Integer, ForeignKey('resume_data.id'), nullable=False, index=True)
     company = Column(Text)
     position = Column(Text)
     start_date = Column(Text)
@@ -73,7 +95,7 @@ class Experience(Base):
 class Education(Base):
     __tablename__ = 'education'
     id = Column(Integer, primary_key=True)
-    resume_id = Column(Integer, ForeignKey('resume_data.id'), nullable=False)
+    resume_id = Column(Integer, ForeignKey('resume_data.id'), nullable=False, index=True)
     school = Column(Text)
     degree = Column(Text)
     field = Column(Text)
@@ -85,7 +107,7 @@ class Education(Base):
 class Project(Base):
     __tablename__ = 'projects'
     id = Column(Integer, primary_key=True)
-    resume_id = Column(Integer, ForeignKey('resume_data.id'), nullable=False)
+    resume_id = Column(Integer, ForeignKey('resume_data.id'), nullable=False, index=True)
     name = Column(Text)
     technologies = Column(Text)
     description = Column(Text)
@@ -96,7 +118,7 @@ class Project(Base):
 class ResumeSkill(Base):
     __tablename__ = 'resume_skills'
     id = Column(Integer, primary_key=True)
-    resume_id = Column(Integer, ForeignKey('resume_data.id'), nullable=False)
+    resume_id = Column(Integer, ForeignKey('resume_data.id'), nullable=False, index=True)
     skill_name = Column(Text, nullable=False)
     skill_category = Column(Text, nullable=False)
     proficiency_score = Column(REAL)
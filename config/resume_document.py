@@ -0,0 +1,63 @@
+"""Canonical form of a resume dict, shared by the fingerprint and the stored document"""
+import hashlib
+import json
+
+EMPTY = (None, "", [], {})
+
+def canonical(value):
+    """Whitespace-normalized copy of a resume value, without empty fields."""
+    if isinstance(value, str):
+        return " ".join(value.split())
+    if isinstance(value, dict):
+        items = ((str(key), canonical(item)) for key, item in value.items())
+        return {key: item for key, item in items if item not in EMPTY}
+    if isinstance(value, (list, tuple)):
+        return [item for item in map(canonical, value) if item not in EMPTY]
+    return value
+
+def normalize_resume(data):
+    """Canonical copy of a builder resume dict, with the email lowercased."""
+    resume = canonical(data)
+    personal_info = resume.get('personal_info')
+    if isinstance(personal_info, dict) and isinstance(personal_info.get('email'), str):
+        personal_info['email'] = personal_info['email'].lower()
+    return resume
+
+def resume_fingerprint(data):
+    """
+    Stable sha256 of a resume dict.
+
+    The dict is canonicalized first (sorted keys, collapsed whitespace, empty
+    fields dropped, email lowercased), so resaving an unchanged form gives the
+    same fingerprint. List order is kept: reordered experiences are a
+    different resume.
+    """
+    payload = json.dumps(normalize_resume(data), sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def skill_tags(skills):
+    """
+    Sorted, lowercased, de-duplicated skill names.
+
+    Accepts the builder's {category: [skills]} dict, a list, or a
+    comma-separated string.
+    """
+    if isinstance(skills, dict):
+        skills = [skill for values in skills.values() for skill in (values if isinstance(values, list) else [values])]
+    elif isinstance(skills, str):
+        skills = skills.split(',')
+    return sorted({" ".join(str(skill).split()).lower() for skill in skills or [] if str(skill).strip()})
+
+def resume_document(data):
+    """
+    The normalized resume as stored in resume_data.document.
+
+    Every field the builder sends is kept, including those the per-row
+    tables have no columns for (responsibilities, key_points, certifications).
+    `skill_tags` flattens the skills for containment queries.
+    """
+    document = normalize_resume(data)
+    tags = skill_tags(data.get('skills'))
+    if tags:
+        document['skill_tags'] = tags
+    return json.loads(json.dumps(document, default=str))
@@ -9,8 +9,9 @@ import logging
 from datetime import datetime, timedelta
 
 # Import the new database session manager and ORM models
-from config.database import get_db
-from config.models import ResumeData, ResumeAnalysis, AdminLog
+from config.database import read_with_fallback, get_admin_logs_page, ADMIN_LOG_PAGE_SIZE
+from config.models import ResumeData, ResumeAnalysis
+from utils.metrics import timed, get_metrics_snapshot, render_prometheus
 
 logger = logging.getLogger(__name__)
 
@@ -23,59 +24,64 @@ class DashboardManager:
             'text': '#212529', 'subtext': '#495057'
         }
 
+    @timed("dashboard.get_resume_metrics")
     def get_resume_metrics(self):
         """Fetches key metrics about resumes from the database using ORM."""
-        with get_db() as db:
-            total_resumes = db.query(func.count(ResumeData.id)).scalar()
-            avg_ats_score = db.query(func.avg(ResumeAnalysis.ats_score)).scalar() or 0
-            
-            return {
-                'total_resumes': total_resumes,
-                'avg_ats_score': round(float(avg_ats_score), 2),
-            }
+        def query_metrics(db):
+            return (db.query(func.count(ResumeData.id)).scalar(),
+                    db.query(func.avg(ResumeAnalysis.ats_score)).scalar() or 0)
+
+        total_resumes, avg_ats_score = read_with_fallback(query_metrics)
+        return {
+            'total_resumes': total_resumes,
+            'avg_ats_score': round(float(avg_ats_score), 2),
+        }
 
+    @timed("dashboard.get_skill_distribution")
     def get_skill_distribution(self, top_n=20):
         """Analyzes skill frequency from all resumes."""
-        with get_db() as db:
-            all_skills_str = db.query(ResumeData.skills).filter(ResumeData.skills.isnot(None)).all()
-            
-            all_skills = []
-            for skills_tuple in all_skills_str:
-                skills_str = skills_tuple[0]
-                try:
-                    # This assumes skills are stored like "['python', 'java']"
-                    skills_list = eval(skills_str)
-                    if isinstance(skills_list, list):
-                        all_skills.extend([skill.lower().strip() for skill in skills_list])
-                except (SyntaxError, NameError):
-                    # Handle cases where skills might be a simple comma-separated string
-                    if isinstance(skills_str, str):
-                        all_skills.extend([s.lower().strip() for s in skills_str.split(',')])
-
-            if not all_skills:
-                return pd.DataFrame(columns=['Skill', 'Count'])
-
-            skill_counts = Counter(all_skills)
-            df = pd.DataFrame(skill_counts.items(), columns=['Skill', 'Count']).sort_values('Count', ascending=False)
-            return df.head(top_n)
+        all_skills_str = read_with_fallback(
+            lambda db: db.query(ResumeData.skills).filter(ResumeData.skills.isnot(None)).all()
+        )
+
+        all_skills = []
+        for skills_tuple in all_skills_str:
+            skills_str = skills_tuple[0]
+            try:
+                # This assumes skills are stored like "['python', 'java']"
+                skills_list = eval(skills_str)
+                if isinstance(skills_list, list):
+                    all_skills.extend([skill.lower().strip() for skill in skills_list])
+            except (SyntaxError, NameError):
+                # Handle cases where skills might be a simple comma-separated string
+                if isinstance(skills_str, str):
+                    all_skills.extend([s.lower().strip() for s in skills_str.split(',')])
+
+        if not all_skills:
+            return pd.DataFrame(columns=['Skill', 'Count'])
 
+        skill_counts = Counter(all_skills)
+        df = pd.DataFrame(skill_counts.items(), columns=['Skill', 'Count']).sort_values('Count', ascending=False)
+        return df.head(top_n)
+
+    @timed("dashboard.get_weekly_trends")
     def get_weekly_trends(self):
         """Gets the count of resumes created per day for the last 7 days."""
-        with get_db() as db:
-            seven_days_ago = datetime.now().date() - timedelta(days=7)
-            trends_query = db.query(
-                cast(ResumeData.created_at, Date).label('date'),
-                func.count(ResumeData.id).label('count')
-            ).filter(ResumeData.created_at >= seven_days_ago).group_by('date').order_by('date').all()
-            
-            df = pd.DataFrame(trends_query, columns=['Date', 'Count'])
-            return df
+        seven_days_ago = datetime.now().date() - timedelta(days=7)
+        trends_query = read_with_fallback(lambda db: db.query(
+            cast(ResumeData.created_at, Date).label('date'),
+            func.count(ResumeData.id).label('count')
+        ).filter(ResumeData.created_at >= seven_days_ago).group_by('date').order_by('date').all())
+
+        df = pd.DataFrame(trends_query, columns=['Date', 'Count'])
+        return df
             
+    @timed("dashboard.get_all_resume_data")
     def get_all_resume_data(self):
         """Gets detailed data for all resumes for exporting."""
-        with get_db() as db:
+        def query_resumes(db):
             results = db.query(ResumeData).outerjoin(ResumeAnalysis).order_by(ResumeData.created_at.desc()).all()
-            
+
             data_list = []
             for r in results:
                 data = {
@@ -85,16 +91,82 @@ class DashboardManager:
                     "ATS Score": r.analysis.ats_score if r.analysis else None
                 }
                 data_list.append(data)
-            return pd.DataFrame(data_list)
+            return data_list
+
+        return pd.DataFrame(read_with_fallback(query_resumes))
             
-    def get_admin_logs(self):
-        """Gets all admin logs."""
-        with get_db() as db:
-            logs = db.query(AdminLog).order_by(AdminLog.timestamp.desc()).all()
-            return pd.DataFrame([
-                {"Admin Email": log.admin_email, "Action": log.action, "Timestamp": log.timestamp}
-                for log in logs
-            ])
+    @timed("dashboard.get_admin_logs")
+    def get_admin_logs(self, cursor=None, admin_email=None, start_date=None, end_date=None, page_size=ADMIN_LOG_PAGE_SIZE):
+        """Gets one page of admin logs and the cursor of the next (older) page."""
+        start = datetime.combine(start_date, datetime.min.time()) if start_date else None
+        end = datetime.combine(end_date + timedelta(days=1), datetime.min.time()) if end_date else None
+
+        page = get_admin_logs_page(
+            limit=page_size, cursor=cursor, admin_email=admin_email or None, start=start, end=end
+        )
+        df = pd.DataFrame([
+            {"Admin Email": log["admin_email"], "Action": log["action"], "Timestamp": log["timestamp"]}
+            for log in page["logs"]
+        ])
+        return df, page["next_cursor"]
+
+    def render_admin_logs(self):
+        """Renders the admin activity log one page at a time."""
+        st.subheader("🛡️ Admin Activity Logs")
+
+        col1, col2, col3 = st.columns([2, 1, 1])
+        with col1:
+            admin_email = st.text_input("Filter by admin email", key="admin_log_email").strip()
+        with col2:
+            start_date = st.date_input("From", value=None, key="admin_log_start")
+        with col3:
+            end_date = st.date_input("To", value=None, key="admin_log_end")
+
+        # Cursors of the pages visited so far; reset whenever the filters change
+        filters = (admin_email, start_date, end_date)
+        if st.session_state.get('admin_log_filters') != filters:
+            st.session_state.admin_log_filters = filters
+            st.session_state.admin_log_cursors = [None]
+        cursors = st.session_state.admin_log_cursors
+
+        log_df, next_cursor = self.get_admin_logs(cursors[-1], admin_email, start_date, end_date)
+        if log_df.empty:
+            st.info("No admin activity found for the selected filters.")
+        else:
+            st.dataframe(log_df)
+
+        nav_prev, nav_page, nav_next = st.columns([1, 2, 1])
+        with nav_prev:
+            if st.button("← Newer", key="admin_log_newer", disabled=len(cursors) == 1):
+                cursors.pop()
+                st.rerun()
+        with nav_page:
+            st.caption(f"Page {len(cursors)}")
+        with nav_next:
+            if st.button("Older →", key="admin_log_older", disabled=next_cursor is None):
+                cursors.append(next_cursor)
+                st.rerun()
+
+    def render_performance_metrics(self):
+        """Renders per-operation latency collected by utils.metrics in this process."""
+        st.subheader("⏱️ Performance Metrics")
+        snapshot = get_metrics_snapshot()
+        if not snapshot:
+            st.info("No operations have been timed yet in this server process.")
+            return
+
+        metrics_df = pd.DataFrame(snapshot).rename(columns={
+            'operation': 'Operation', 'count': 'Calls', 'errors': 'Errors', 'total_ms': 'Total (ms)',
+            'avg_ms': 'Avg (ms)', 'p50_ms': 'p50 (ms)', 'p95_ms': 'p95 (ms)', 'max_ms': 'Max (ms)'
+        })
+        st.dataframe(metrics_df, hide_index=True)
+        st.download_button(
+            label="📥 Download Prometheus metrics",
+            data=render_prometheus(),
+            file_name="metrics.txt",
+            mime="text/plain",
+            key="download_prometheus_metrics"
+        )
 
     def export_to_excel(self):
         """Exports all resume data to an Excel file in memory."""
@@ -163,6 +235,6 @@ class DashboardManager:
 
         # Admin Logs (only for admins)
         if st.session_state.get('is_admin', False):
-            st.subheader("🛡️ Admin Activity Logs")
-            log_df = self.get_admin_logs()
-            st.dataframe(log_df)
\ No newline at end of file
+            self.render_admin_logs()
+            st.markdown("---")
+            self.render_performance_metrics()
\ No newline at end of file
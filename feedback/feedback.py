@@ -1,74 +1,105 @@
 import streamlit as st
-import sqlite3
 from datetime import datetime
-import pandas as pd
 import time
+from utils.sqlite_manager import get_connection_manager
+
+FEEDBACK_SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS feedback (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        rating INTEGER,
+        usability_score INTEGER,
+        feature_satisfaction INTEGER,
+        missing_features TEXT,
+        improvement_suggestions TEXT,
+        user_experience TEXT,
+        timestamp DATETIME
+    );
+
+    -- Running totals maintained by save_feedback, so the overview is O(1)
+    CREATE TABLE IF NOT EXISTS feedback_summary (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        total_responses INTEGER NOT NULL,
+        rating_sum INTEGER NOT NULL,
+        usability_sum INTEGER NOT NULL,
+        satisfaction_sum INTEGER NOT NULL
+    );
+
+    -- Seed the totals from any feedback saved before the summary existed
+    INSERT OR IGNORE INTO feedback_summary
+    SELECT 1, COUNT(*), COALESCE(SUM(rating), 0),
+           COALESCE(SUM(usability_score), 0), COALESCE(SUM(feature_satisfaction), 0)
+    FROM feedback;
+'''
 
 class FeedbackManager:
-    def __init__(self):
-        self.db_path = "feedback/feedback.db"
+    def __init__(self, db_path="feedback/feedback.db", use_summary=True):
+        self.db_path = db_path
+        self.use_summary = use_summary
         self.setup_database()
 
     def setup_database(self):
-        """Create feedback table if it doesn't exist"""
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute('''
-            CREATE TABLE IF NOT EXISTS feedback (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                rating INTEGER,
-                usability_score INTEGER,
-                feature_satisfaction INTEGER,
-                missing_features TEXT,
-                improvement_suggestions TEXT,
-                user_experience TEXT,
-                timestamp DATETIME
-            )
-        ''')
-        conn.commit()
-        conn.close()
+        """Get the shared connection pool, creating the feedback table on first use"""
+        self.db = get_connection_manager(self.db_path, schema=FEEDBACK_SCHEMA)
 
     def save_feedback(self, feedback_data):
         """Save feedback to database"""
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute('''
-            INSERT INTO feedback (
-                rating, usability_score, feature_satisfaction,
-                missing_features, improvement_suggestions,
-                user_experience, timestamp
-            ) VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            feedback_data['rating'],
-            feedback_data['usability_score'],
-            feedback_data['feature_satisfaction'],
-            feedback_data['missing_features'],
-            feedback_data['improvement_suggestions'],
-            feedback_data['user_experience'],
-            datetime.now()
-        ))
-        conn.commit()
-        conn.close()
+        with self.db.transaction() as conn:
+            conn.execute('''
+                INSERT INTO feedback (
+                    rating, usability_score, feature_satisfaction,
+                    missing_features, improvement_suggestions,
+                    user_experience, timestamp
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', (
+                feedback_data['rating'],
+                feedback_data['usability_score'],
+                feedback_data['feature_satisfaction'],
+                feedback_data['missing_features'],
+                feedback_data['improvement_suggestions'],
+                feedback_data['user_experience'],
+                datetime.now().isoformat(" ")
+            ))
+            conn.execute('''
+                UPDATE feedback_summary SET
+                    total_responses = total_responses + 1,
+                    rating_sum = rating_sum + ?,
+                    usability_sum = usability_sum + ?,
+                    satisfaction_sum = satisfaction_sum + ?
+                WHERE id = 1
+            ''', (
+                feedback_data['rating'],
+                feedback_data['usability_score'],
+                feedback_data['feature_satisfaction']
+            ))
 
     def get_feedback_stats(self):
-        """Get feedback statistics"""
-        conn = sqlite3.connect(self.db_path)
-        df = pd.read_sql_query("SELECT * FROM feedback", conn)
-        conn.close()
-        
-        if df.empty:
-            return {
-                'avg_rating': 0,
-                'avg_usability': 0,
-                'avg_satisfaction': 0,
-                'total_responses': 0
-            }
-        
+        """
+        Get feedback statistics.
+
+        Reads the running totals from feedback_summary by default, or computes
+        them with a single aggregate query when use_summary is False.
+        """
+        with self.db.connection() as conn:
+            if self.use_summary:
+                row = conn.execute('''
+                    SELECT total_responses,
+                           CAST(rating_sum AS REAL) / NULLIF(total_responses, 0),
+                           CAST(usability_sum AS REAL) / NULLIF(total_responses, 0),
+                           CAST(satisfaction_sum AS REAL) / NULLIF(total_responses, 0)
+                    FROM feedback_summary WHERE id = 1
+                ''').fetchone()
+            else:
+                row = conn.execute('''
+                    SELECT COUNT(*), AVG(rating), AVG(usability_score), AVG(feature_satisfaction)
+                    FROM feedback
+                ''').fetchone()
+
+        total_responses, avg_rating, avg_usability, avg_satisfaction = row
         return {
-            'avg_rating': df['rating'].mean(),
-            'avg_usability': df['usability_score'].mean(),
-            'avg_satisfaction': df['feature_satisfaction'].mean(),
-            'total_responses': len(df)
+            'avg_rating': avg_rating or 0,
+            'avg_usability': avg_usability or 0,
+            'avg_satisfaction': avg_satisfaction or 0,
+            'total_responses': total_responses
         }
 
     def render_feedback_form(self):
@@ -1,4 +1,7 @@
 """Company data and market insights for job search"""
+from types import MappingProxyType
+
+from utils.readonly import freeze
 
 FEATURED_COMPANIES = {
     "tech": [
@@ -159,11 +162,29 @@ JOB_MARKET_INSIGHTS = {
     ]
 }
 
+# Shared by every caller, so frozen: lists become tuples and dicts read-only mappings
+FEATURED_COMPANIES = freeze(FEATURED_COMPANIES)
+JOB_MARKET_INSIGHTS = freeze(JOB_MARKET_INSIGHTS)
+
+def _build_company_indexes():
+    """Flatten the featured companies and index them by name and industry"""
+    all_companies = [company for companies in FEATURED_COMPANIES.values() for company in companies]
+    by_name, by_industry = {}, {}
+    for company in all_companies:
+        by_name.setdefault(company["name"], company)
+        if "industry" in company:
+            by_industry.setdefault(company["industry"], []).append(company)
+    by_industry = {industry: tuple(companies) for industry, companies in by_industry.items()}
+    return tuple(all_companies), MappingProxyType(by_name), MappingProxyType(by_industry)
+
+# Built once at import; the functions below return these read-only values
+_ALL_COMPANIES, _COMPANIES_BY_NAME, _COMPANIES_BY_INDUSTRY = _build_company_indexes()
+
 def get_featured_companies(category=None):
     """Get featured companies, optionally filtered by category"""
     if category and category in FEATURED_COMPANIES:
         return FEATURED_COMPANIES[category]
-    return [company for companies in FEATURED_COMPANIES.values() for company in companies]
+    return _ALL_COMPANIES
 
 def get_market_insights():
     """Get job market insights"""
@@ -171,17 +192,8 @@ def get_market_insights():
 
 def get_company_info(company_name):
     """Get company information by name"""
-    for companies in FEATURED_COMPANIES.values():
-        for company in companies:
-            if company["name"] == company_name:
-                return company
-    return None
+    return _COMPANIES_BY_NAME.get(company_name)
 
 def get_companies_by_industry(industry):
     """Get list of companies by industry"""
-    companies = []
-    for companies_list in FEATURED_COMPANIES.values():
-        for company in companies_list:
-            if "industry" in company and company["industry"] == industry:
-                companies.append(company)
-    return companies
+    return _COMPANIES_BY_INDUSTRY.get(industry, ())
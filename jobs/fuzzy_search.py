@@ -0,0 +1,177 @@
+"""Typo-tolerant matching over job titles, locations and companies"""
+import re
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+# Alternate spellings, old names and abbreviations mapped to catalogue terms
+ALIASES = {
+    # Locations
+    "bengaluru": "bangalore",
+    "bombay": "mumbai",
+    "new delhi": "delhi",
+    "ncr": "delhi",
+    "gurugram": "gurgaon",
+    "madras": "chennai",
+    "calcutta": "kolkata",
+    "poona": "pune",
+    "mysuru": "mysore",
+    "mangaluru": "mangalore",
+    "belagavi": "belgaum",
+    "trivandrum": "thiruvananthapuram",
+    "cochin": "kochi",
+    "calicut": "kozhikode",
+    "trichy": "tiruchirappalli",
+    "vizag": "visakhapatnam",
+    "baroda": "vadodara",
+    "wfh": "work from home",
+    # Job titles
+    "dev": "developer",
+    "devs": "developer",
+    "engg": "engineer",
+    "eng": "engineer",
+    "swe": "software engineer",
+    "sde": "software engineer",
+    "ml": "machine learning",
+    "ai": "artificial intelligence",
+    "fullstack": "full stack",
+    "front end": "frontend",
+    "back end": "backend",
+    "pm": "product manager",
+    "dba": "database administrator",
+    # Companies
+    "meta": "facebook",
+    "msft": "microsoft",
+    "tata consultancy services": "tcs",
+    "hcltech": "hcl",
+}
+
+_TOKEN_RE = re.compile(r"[a-z0-9+#.]+")
+
+def normalize(text: str) -> str:
+    return " ".join(_TOKEN_RE.findall(text.lower()))
+
+def trigrams(word: str) -> set:
+    padded = f"  {word} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def bounded_edit_distance(a: str, b: str, limit: int) -> int:
+    """Levenshtein distance between a and b, or limit + 1 once it exceeds limit."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b)
+            ))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+class FuzzyIndex:
+    """
+    Trigram inverted index over the words of a catalogue, built once.
+
+    A query word only looks up the vocabulary words that share trigrams with
+    it, then confirms them with a prefix check or a bounded edit distance, so
+    the work depends on the query rather than on the catalogue size. Entries
+    are ranked by the average similarity of their best-matching word for
+    each query word. Alias phrases anywhere in the query are applied before
+    matching.
+    """
+
+    def __init__(self, entries: List[Dict], key: str = "text", aliases: Dict[str, str] = None,
+                 min_score: float = 0.6):
+        self.entries = entries
+        self.min_score = min_score
+        self.aliases = {normalize(k): normalize(v) for k, v in (ALIASES if aliases is None else aliases).items()}
+        self._max_alias_words = max((len(k.split()) for k in self.aliases), default=1)
+
+        self._word_entries = defaultdict(set)   # vocabulary word -> entry ids
+        self._trigram_words = defaultdict(set)  # trigram -> vocabulary words
+        self._word_trigram_counts = {}
+        for entry_id, entry in enumerate(entries):
+            for word in normalize(entry[key]).split():
+                self._word_entries[word].add(entry_id)
+        for word in self._word_entries:
+            grams = trigrams(word)
+            self._word_trigram_counts[word] = len(grams)
+            for gram in grams:
+                self._trigram_words[gram].add(word)
+
+    def _expand_aliases(self, query: str) -> List[str]:
+        """
+        Query words with alias phrases replaced, longest phrase first.
+
+        A phrase whose words are all in the vocabulary is kept as typed, so an
+        alias never hides a catalogue term (e.g. "ai" in "AI Researcher").
+        """
+        words = query.split()
+        expanded = []
+        i = 0
+        while i < len(words):
+            for size in range(min(self._max_alias_words, len(words) - i), 0, -1):
+                phrase = words[i:i + size]
+                key = " ".join(phrase)
+                if key in self.aliases and not all(word in self._word_entries for word in phrase):
+                    expanded.extend(self.aliases[key].split())
+                    i += size
+                    break
+            else:
+                expanded.append(words[i])
+                i += 1
+        return expanded
+
+    def _similar_words(self, word: str) -> Dict[str, float]:
+        """Vocabulary words similar to `word`, with a similarity in (0, 1]."""
+        if word in self._word_entries:
+            return {word: 1.0}
+
+        grams = trigrams(word)
+        shared = defaultdict(int)
+        for gram in grams:
+            for candidate in self._trigram_words.get(gram, ()):
+                shared[candidate] += 1
+
+        limit = max(1, len(word) // 3)
+        matches = {}
+        for candidate, count in shared.items():
+            # Dice coefficient as a cheap filter before the edit distance
+            if 2 * count / (len(grams) + self._word_trigram_counts[candidate]) < 0.3:
+                continue
+            if len(word) >= 3 and candidate.startswith(word):
+                matches[candidate] = 0.9
+                continue
+            distance = bounded_edit_distance(word, candidate, limit)
+            if distance <= limit:
+                matches[candidate] = 1 - distance / max(len(word), len(candidate))
+        return matches
+
+    def search_with_scores(self, query: str, limit: int = 5) -> List[Tuple[Dict, float]]:
+        """Return up to `limit` (entry, score) pairs, best first."""
+        words = self._expand_aliases(normalize(query or ""))
+        if not words:
+            return []
+
+        scores = defaultdict(float)
+        for word in words:
+            best = {}
+            for candidate, similarity in self._similar_words(word).items():
+                for entry_id in self._word_entries[candidate]:
+                    best[entry_id] = max(best.get(entry_id, 0), similarity)
+            for entry_id, similarity in best.items():
+                scores[entry_id] += similarity / len(words)
+
+        ranked = sorted(
+            ((score, entry_id) for entry_id, score in scores.items() if score >= self.min_score),
+            key=lambda item: (-item[0], item[1])
+        )
+        return [(self.entries[entry_id], round(score, 3)) for score, entry_id in ranked[:limit]]
+
+    def search(self, query: str, limit: int = 5) -> List[Dict]:
+        """Return up to `limit` entries matching `query` despite typos, best first."""
+        return [entry for entry, _ in self.search_with_scores(query, limit)]
@@ -0,0 +1,302 @@
+"""Job listing ingestion: portal adapters, concurrent fetching and a local listing store"""
+import hashlib
+import json
+import os
+import threading
+import time
+import urllib.parse
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from utils.sqlite_manager import get_connection_manager
+from .fuzzy_search import normalize
+
+LISTING_FIELDS = (
+    "title", "company", "location", "description", "skills",
+    "experience_min", "experience_max", "salary_min", "salary_max",
+    "job_type", "url", "source", "posted_at"
+)
+
+LISTINGS_SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS listings (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        listing_key TEXT NOT NULL UNIQUE,
+        title TEXT NOT NULL,
+        company TEXT NOT NULL,
+        location TEXT,
+        description TEXT,
+        skills TEXT,
+        experience_min REAL,
+        experience_max REAL,
+        salary_min REAL,
+        salary_max REAL,
+        job_type TEXT,
+        url TEXT,
+        source TEXT,
+        posted_at TEXT,
+        ingested_at TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS ix_listings_ingested_at ON listings (ingested_at);
+'''
+
+def listing_key(title: str, company: str) -> str:
+    """Dedup key: hash of the normalized title and company"""
+    return hashlib.sha256(f"{normalize(title)}|{normalize(company)}".encode("utf-8")).hexdigest()
+
+def _number(value) -> Optional[float]:
+    try:
+        return float(value) if value not in (None, "") else None
+    except (TypeError, ValueError):
+        return None
+
+def normalize_listing(raw: Dict, source: str) -> Optional[Dict]:
+    """
+    Map a raw portal record onto the listing fields.
+
+    Returns None for records without a title or company, which cannot be
+    deduplicated.
+    """
+    title = " ".join(str(raw.get("title") or "").split())
+    company = " ".join(str(raw.get("company") or "").split())
+    if not title or not company:
+        return None
+
+    skills = raw.get("skills") or []
+    if isinstance(skills, str):
+        skills = skills.split(",")
+    return {
+        "title": title,
+        "company": company,
+        "location": " ".join(str(raw.get("location") or "").split()),
+        "description": raw.get("description") or "",
+        "skills": [s.strip() for s in skills if s and s.strip()],
+        "experience_min": _number(raw.get("experience_min")),
+        "experience_max": _number(raw.get("experience_max")),
+        "salary_min": _number(raw.get("salary_min")),
+        "salary_max": _number(raw.get("salary_max")),
+        "job_type": (raw.get("job_type") or "").lower(),
+        "url": raw.get("url") or "",
+        "source": raw.get("source") or source,
+        "posted_at": raw.get("posted_at") or "",
+        "listing_key": listing_key(title, company)
+    }
+
+class PortalAdapter(ABC):
+    """
+    Source of raw job listings.
+
+    Subclasses set `name` and `host` (used for rate limiting; empty for
+    local sources) and implement fetch(), which yields raw listing dicts for
+    one search.
+    """
+    name = "portal"
+    host = ""
+
+    @abstractmethod
+    def fetch(self, query: str, location: str = "") -> Iterable[Dict]:
+        """Raw listing dicts for one search"""
+
+class FixtureAdapter(PortalAdapter):
+    """
+    Replays listings from a JSON or JSONL file, for offline runs and tests.
+
+    A .json file holds a list of listings or {"listings": [...]}; a .jsonl
+    file holds one listing per line. Records are filtered by query and
+    location the way a portal search would.
+    """
+
+    def __init__(self, path: str, name: str = None):
+        self.path = path
+        self.name = name or os.path.splitext(os.path.basename(path))[0]
+
+    def _records(self) -> Iterable[Dict]:
+        with open(self.path, encoding="utf-8") as f:
+            if self.path.endswith(".jsonl"):
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)
+            else:
+                data = json.load(f)
+                yield from data.get("listings", []) if isinstance(data, dict) else data
+
+    def fetch(self, query: str, location: str = "") -> Iterable[Dict]:
+        query, location = normalize(query or ""), normalize(location or "")
+        for record in self._records():
+            if query and query not in normalize(f"{record.get('title', '')} {' '.join(record.get('skills') or [])}"):
+                continue
+            if location and location not in normalize(record.get("location") or ""):
+                continue
+            yield record
+
+class HTTPPortalAdapter(PortalAdapter):
+    """
+    Fetches listings from a JSON search endpoint.
+
+    `build_params` turns (query, location) into request parameters and
+    `parse` extracts the raw listing dicts from the decoded response. The
+    session is shared so connections to the host are kept alive and pooled.
+    """
+
+    def __init__(self, name: str, url: str, build_params: Callable[[str, str], Dict],
+                 parse: Callable[[Dict], Iterable[Dict]], session: requests.Session = None,
+                 timeout: float = 10):
+        self.name = name
+        self.url = url
+        self.host = urllib.parse.urlsplit(url).netloc
+        self.build_params = build_params
+        self.parse = parse
+        self.session = session or create_session()
+        self.timeout = timeout
+
+    def fetch(self, query: str, location: str = "") -> Iterable[Dict]:
+        response = self.session.get(self.url, params=self.build_params(query, location), timeout=self.timeout)
+        response.raise_for_status()
+        return list(self.parse(response.json()))
+
+def create_session(pool_size: int = 10, retries: int = 2) -> requests.Session:
+    """requests session with a keep-alive connection pool per host"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["User-Agent"] = "Mozilla/5.0 (compatible; SmartResumeAI job ingestion)"
+    return session
+
+class RateLimiter:
+    """
+    Minimum interval between requests to the same host.
+
+    wait() reserves the next free slot for the host under a lock and sleeps
+    outside it, so workers hitting different hosts never wait on each other.
+    """
+
+    def __init__(self, default_rate: float = 1.0, rates: Dict[str, float] = None,
+                 clock: Callable[[], float] = time.monotonic, sleep: Callable[[float], None] = time.sleep):
+        self.default_rate = default_rate
+        self.rates = rates or {}
+        self.clock = clock
+        self.sleep = sleep
+        self._next_slot = {}
+        self._lock = threading.Lock()
+
+    def wait(self, host: str):
+        rate = self.rates.get(host, self.default_rate)
+        if not host or not rate or rate <= 0:
+            return
+        with self._lock:
+            now = self.clock()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + 1.0 / rate
+        if slot > now:
+            self.sleep(slot - now)
+
+class ListingStore:
+    """Listings deduplicated by listing_key, kept in a local SQLite database"""
+
+    def __init__(self, db_path="jobs/listings.db"):
+        self.db_path = db_path
+        self.db = get_connection_manager(db_path, schema=LISTINGS_SCHEMA)
+
+    def save_listings(self, listings: List[Dict]) -> int:
+        """Insert new listings and refresh existing ones; returns the number inserted"""
+        if not listings:
+            return 0
+        now = datetime.now().isoformat(" ")
+        rows = [
+            (listing["listing_key"],) + tuple(
+                json.dumps(listing["skills"]) if field == "skills" else listing[field]
+                for field in LISTING_FIELDS
+            ) + (now,)
+            for listing in listings
+        ]
+        columns = ("listing_key",) + LISTING_FIELDS + ("ingested_at",)
+        updates = ", ".join(f"{c} = excluded.{c}" for c in LISTING_FIELDS)
+        with self.db.transaction() as conn:
+            before = conn.execute("SELECT COUNT(*) FROM listings").fetchone()[0]
+            conn.executemany(
+                f"INSERT INTO listings ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))}) "
+                f"ON CONFLICT(listing_key) DO UPDATE SET {updates}",
+                rows
+            )
+            return conn.execute("SELECT COUNT(*) FROM listings").fetchone()[0] - before
+
+    def _to_dict(self, row) -> Dict:
+        listing = dict(row)
+        listing["skills"] = json.loads(listing["skills"] or "[]")
+        return listing
+
+    def iter_listings(self) -> Iterable[Dict]:
+        with self.db.connection() as conn:
+            for row in conn.execute("SELECT * FROM listings ORDER BY id"):
+                yield self._to_dict(row)
+
+    def get_listings(self, limit: int = None) -> List[Dict]:
+        with self.db.connection() as conn:
+            rows = conn.execute("SELECT * FROM listings ORDER BY id LIMIT ?", (limit or -1,)).fetchall()
+        return [self._to_dict(row) for row in rows]
+
+    def count(self) -> int:
+        with self.db.connection() as conn:
+            return conn.execute("SELECT COUNT(*) FROM listings").fetchone()[0]
+
+class IngestionReport(NamedTuple):
+    fetched: int
+    stored: int
+    duplicates: int
+    rejected: int
+    errors: Dict[str, str]
+
+class IngestionPipeline:
+    """
+    Fetches every (adapter, query) pair on a thread pool and stores the results.
+
+    Requests are spaced per host by a RateLimiter. Listings are deduplicated
+    by listing_key within the run and against the store, and an adapter that
+    fails only loses its own results.
+    """
+
+    def __init__(self, adapters: List[PortalAdapter], store: ListingStore, max_workers: int = 4,
+                 rate_limiter: RateLimiter = None):
+        self.adapters = adapters
+        self.store = store
+        self.max_workers = max_workers
+        self.rate_limiter = rate_limiter or RateLimiter()
+
+    def _fetch(self, adapter: PortalAdapter, query: str, location: str) -> List[tuple]:
+        self.rate_limiter.wait(adapter.host)
+        return [(adapter.name, record) for record in adapter.fetch(query, location)]
+
+    def run(self, queries: Iterable[str], location: str = "") -> IngestionReport:
+        tasks = [(adapter, query) for query in dict.fromkeys(queries) for adapter in self.adapters]
+        fetched, rejected, errors = 0, 0, {}
+        unique = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(self._fetch, adapter, query, location): (adapter, query) for adapter, query in tasks}
+            for future in as_completed(futures):
+                adapter, query = futures[future]
+                try:
+                    records = future.result()
+                except Exception as e:
+                    errors[f"{adapter.name}:{query}"] = str(e)
+                    continue
+                for source, record in records:
+                    fetched += 1
+                    listing = normalize_listing(record, source)
+                    if listing is None:
+                        rejected += 1
+                    else:
+                        unique.setdefault(listing["listing_key"], listing)
+
+        stored = self.store.save_listings(list(unique.values()))
+        return IngestionReport(
+            fetched=fetched,
+            stored=stored,
+            duplicates=fetched - rejected - stored,
+            rejected=rejected,
+            errors=errors
+        )
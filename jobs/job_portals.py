@@ -1,162 +1,183 @@
 """Module for handling job portal integrations"""
+import re
 import urllib.parse
-from typing import Dict, List
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, NamedTuple
+
+# Experience filter ids (see get_filter_options) mapped to portal-specific values
+EXPERIENCE_LEVELS = {"0-1": "0", "1-3": "1", "3-5": "2", "5-7": "3", "7-10": "4", "10+": "5"}
+LINKEDIN_EXPERIENCE = {"0-1": "1,2", "1-3": "2", "3-5": "3", "5-7": "4", "7-10": "4", "10+": "5"}
+INDEED_EXPERIENCE = {
+    "0-1": "entry_level", "1-3": "entry_level", "3-5": "mid_level",
+    "5-7": "mid_level", "7-10": "senior_level", "10+": "senior_level"
+}
+
+class SearchParams(NamedTuple):
+    """Normalized search inputs handed to every portal URL builder"""
+    query: str
+    location: str
+    job_title: str
+    exp_id: str
+    exp_min: str
+    exp_max: str
+
+def _slug(text: str) -> str:
+    """URL path segment: lowercase words joined by hyphens"""
+    return urllib.parse.quote(re.sub(r"[^a-z0-9+#]+", "-", text.lower()).strip("-"))
+
+def _with_query(base: str, params: Dict[str, str]) -> str:
+    """Append the non-empty params to `base` as an encoded query string"""
+    params = {key: value for key, value in params.items() if value}
+    return f"{base}?{urllib.parse.urlencode(params)}" if params else base
+
+def _linkedin_url(p: SearchParams) -> str:
+    return _with_query("https://www.linkedin.com/jobs/search/", {
+        "keywords": p.query, "location": p.location, "f_E": LINKEDIN_EXPERIENCE.get(p.exp_id, "")
+    })
+
+def _indeed_url(p: SearchParams) -> str:
+    return _with_query("https://www.indeed.com/jobs", {
+        "q": p.query, "l": p.location, "explvl": INDEED_EXPERIENCE.get(p.exp_id, "")
+    })
+
+def _naukri_url(p: SearchParams) -> str:
+    path = f"{_slug(p.query)}-jobs-in-{_slug(p.location)}" if p.location else f"{_slug(p.query)}-jobs"
+    return _with_query(f"https://www.naukri.com/{path}", {
+        "experience": p.exp_min if p.exp_id != "all" else ""
+    })
+
+def _foundit_url(p: SearchParams) -> str:
+    params = {"query": f'"{p.query}"', "locations": p.location}
+    if p.exp_id != "all":
+        params.update({"experienceRanges": f"{p.exp_min}~{p.exp_max}", "experience": p.exp_min})
+    return _with_query("https://www.foundit.in/srp/results", params)
+
+def _instahyre_url(p: SearchParams) -> str:
+    title = _slug(p.job_title or p.query)
+    return f"https://www.instahyre.com/{title}-jobs-in-{_slug(p.location)}" if p.location else f"https://www.instahyre.com/{title}-jobs"
+
+def _freshersworld_url(p: SearchParams) -> str:
+    title = _slug(p.job_title or p.query)
+    path = f"{title}-jobs-in-{_slug(p.location)}" if p.location else f"{title}-jobs"
+    return f"https://www.freshersworld.com/jobs/jobsearch/{path}"
+
+_PORTALS: List[Dict] = []
+
+def register_portal(name: str, icon: str, color: str, build_url: Callable[[SearchParams], str], url: str = ""):
+    """
+    Register a job portal and the callable that builds its search URL.
+
+    `url` is the portal's search URL template, listed by get_portal_list().
+    """
+    _PORTALS.append({"name": name, "icon": icon, "color": color, "url": url, "build_url": build_url})
+    _cached_search.cache_clear()
+
+def format_experience(experience) -> tuple:
+    """
+    Normalize an experience filter (a get_filter_options entry or its id).
+
+    Returns (level, min_years, max_years, type) with "10+" mapped to 10-15 years.
+    """
+    exp_id = experience.get("id", "all") if isinstance(experience, dict) else (experience or "all")
+    if exp_id not in EXPERIENCE_LEVELS:
+        return "", "0", "0", "entry"
+
+    if exp_id.endswith("+"):
+        exp_min, exp_max = exp_id[:-1], "15"  # a reasonable maximum for 10+ years
+    else:
+        exp_min, exp_max = exp_id.split("-")
+    return EXPERIENCE_LEVELS[exp_id], exp_min, exp_max, "entry" if exp_min == "0" else "experienced"
+
+def format_job_title(title: str) -> str:
+    """Simplified job title used by portals with title-based paths"""
+    title = title.lower()
+    title = title.replace("developer", "").replace("engineer", "").strip()
+    title = title.replace(" ", "-")
+    return title.strip("-")
+
+@lru_cache(maxsize=1024)
+def _cached_search(query: str, location: str, exp_id: str) -> tuple:
+    """Build every portal's result for one normalized search; memoized"""
+    _, exp_min, exp_max, _ = format_experience(exp_id)
+    params = SearchParams(
+        query=query,
+        location=location,
+        job_title=format_job_title(query),
+        exp_id=exp_id if exp_id in EXPERIENCE_LEVELS else "all",
+        exp_min=exp_min,
+        exp_max=exp_max
+    )
+    title = f"Search {query} jobs in {location}" if location else f"Search {query} jobs"
+
+    results = []
+    for portal in _PORTALS:
+        try:
+            url = portal["build_url"](params)
+        except Exception as e:
+            print(f"Error generating URL for {portal['name']}: {str(e)}")
+            continue
+        results.append({
+            "portal": portal["name"],
+            "icon": portal["icon"],
+            "color": portal["color"],
+            "title": title,
+            "url": url
+        })
+    return tuple(results)
+
+register_portal("LinkedIn", "fab fa-linkedin", "#0077b5", _linkedin_url,
+                "https://www.linkedin.com/jobs/search/?keywords={}&location={}&f_E={}")
+register_portal("Indeed", "fas fa-search-dollar", "#2164f3", _indeed_url,
+                "https://www.indeed.com/jobs?q={}&l={}&explvl={}")
+register_portal("Naukri", "fas fa-briefcase", "#4a90e2", _naukri_url,
+                "https://www.naukri.com/{}-jobs-in-{}?experience={}")
+register_portal("Foundit", "fas fa-globe", "#ff6b6b", _foundit_url,
+                "https://www.foundit.in/srp/results?query=\"{}\"&locations={}&experienceRanges={}~{}&experience={}")
+register_portal("Instahyre", "fas fa-user-tie", "#00bfa5", _instahyre_url,
+                "https://www.instahyre.com/{}-jobs-in-{}")
+register_portal("Freshersworld", "fas fa-graduation-cap", "#28a745", _freshersworld_url,
+                "https://www.freshersworld.com/jobs/jobsearch/{}-jobs-in-{}")
 
 class JobPortal:
     """Class to handle job portal integrations and searches"""
-    
+
     def __init__(self):
         """Initialize job portal connections"""
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
-        self.portals = [
-            {
-                "name": "LinkedIn",
-                "icon": "fab fa-linkedin",
-                "color": "#0077b5",
-                "url": "https://www.linkedin.com/jobs/search/?keywords={}&location={}&f_E={}"
-            },
-            {
-                "name": "Indeed",
-                "icon": "fas fa-search-dollar",
-                "color": "#2164f3",
-                "url": "https://www.indeed.com/jobs?q={}&l={}&explvl={}"
-            },
-            {
-                "name": "Naukri",
-                "icon": "fas fa-briefcase",
-                "color": "#4a90e2",
-                "url": "https://www.naukri.com/{}-jobs-in-{}?experience={}"
-            },
-            {
-                "name": "Foundit",
-                "icon": "fas fa-globe",
-                "color": "#ff6b6b",
-                "url": "https://www.foundit.in/srp/results?query=\"{}\"&locations={}&experienceRanges={}~{}&experience={}"
-            },
-            {
-                "name": "Instahyre",
-                "icon": "fas fa-user-tie",
-                "color": "#00bfa5",
-                "url": "https://www.instahyre.com/{}-jobs-in-{}"
-            },
-            {
-                "name": "Freshersworld",
-                "icon": "fas fa-graduation-cap",
-                "color": "#28a745",
-                "url": "https://www.freshersworld.com/jobs/jobsearch/{}-jobs-in-{}"
-            }
-        ]
+        self.portals = _PORTALS
 
     def get_portal_list(self) -> List[Dict]:
-        """Get list of available job portals"""
-        return self.portals
+        """Get list of available job portals: name, icon, color and search URL template"""
+        return [{key: portal[key] for key in ("name", "icon", "color", "url")} for portal in _PORTALS]
 
     def format_query(self, query: str) -> str:
         """Format query string for URLs"""
-        # Replace spaces with appropriate characters based on portal
-        return query.replace(" ", "+")
+        return urllib.parse.quote_plus(query.strip())
 
     def format_location(self, location: str) -> str:
         """Format location string for URLs"""
-        # Convert to lowercase and replace spaces with hyphens
-        return location.strip().lower().replace(" ", "-")
+        return _slug(location.strip())
 
     def format_job_title(self, title: str) -> str:
         """Format job title for URLs"""
-        # Remove common words and special characters
-        title = title.lower()
-        title = title.replace("developer", "").replace("engineer", "").strip()
-        title = title.replace(" ", "-")
-        return title.strip("-")
+        return format_job_title(title)
 
-    def format_experience(self, experience: str) -> tuple:
+    def format_experience(self, experience) -> tuple:
         """Format experience for different job portals"""
-        if not experience or experience == "all":
-            return "", "0", "0", "entry"
-        
-        try:
-            # Handle dictionary input
-            if isinstance(experience, dict):
-                exp_id = experience.get('id', 'all')
-                if exp_id == 'all':
-                    return "", "0", "0", "entry"
-                
-                # Split experience range (e.g., "1-3" -> ["1", "3"])
-                exp_min, exp_max = exp_id.split('-')
-                if exp_max == "+":
-                    exp_max = "15"  # Set a reasonable maximum for 10+ years
-                
-                # Map to portal-specific format
-                exp_level = {
-                    "0-1": "0",
-                    "1-3": "1",
-                    "3-5": "2",
-                    "5-7": "3",
-                    "7-10": "4",
-                    "10+": "5"
-                }.get(exp_id, "0")
-                
-                return exp_level, exp_min, exp_max, "entry" if exp_min == "0" else "experienced"
-            
-            return "", "0", "0", "entry"
-            
-        except Exception as e:
-            print(f"Error formatting experience: {str(e)}")
-            return "", "0", "0", "entry"
+        return format_experience(experience)
 
     def search_jobs(self, query: str, location: str = "", experience: dict = None) -> list:
         """Search for jobs across all portals with formatted URLs"""
-        results = []
-        formatted_query = self.format_query(query)
-        formatted_location = self.format_location(location) if location else ""
-        job_title = self.format_job_title(query)
-        
-        # Handle experience
-        if experience and isinstance(experience, dict):
-            exp_id = experience.get('id', 'all')
-            exp_text = experience.get('text', 'All Levels')
-            exp_level, exp_min, exp_max, exp_type = self.format_experience(exp_id)
-        else:
-            exp_level, exp_min, exp_max, exp_type = "", "0", "0", "entry"
-        
-        for portal in self.portals:
-            try:
-                if portal["name"] == "Foundit":
-                    url = portal["url"].format(
-                        formatted_query,
-                        formatted_location,
-                        exp_min, exp_max, exp_min
-                    )
-                elif portal["name"] == "Instahyre":
-                    url = portal["url"].format(
-                        job_title,  # Use simplified job title
-                        formatted_location
-                    )
-                elif portal["name"] == "Freshersworld":
-                    url = portal["url"].format(
-                        job_title,  # Use simplified job title
-                        formatted_location
-                    )
-                elif portal["name"] in ["LinkedIn", "Indeed", "Naukri"]:
-                    url = portal["url"].format(
-                        formatted_query,
-                        formatted_location,
-                        exp_level
-                    )
-                else:
-                    url = portal["url"].format(formatted_query, formatted_location)
-                
-                results.append({
-                    "portal": portal["name"],
-                    "icon": portal["icon"],
-                    "color": portal["color"],
-                    "title": f"Search {query} jobs in {location}" if location else f"Search {query} jobs",
-                    "url": url
-                })
-            except Exception as e:
-                print(f"Error generating URL for {portal['name']}: {str(e)}")
-                continue
-        
-        return results
+        exp_id = experience.get("id", "all") if isinstance(experience, dict) else (experience or "all")
+        results = _cached_search(" ".join(query.split()), " ".join((location or "").split()), exp_id)
+        # Copies, so callers cannot alter the memoized results
+        return [dict(result) for result in results]
+
+    def search_jobs_batch(self, queries: Iterable[str], location: str = "", experience: dict = None) -> Dict[str, list]:
+        """Search links for many queries at once, e.g. every role matched from a resume"""
+        return {
+            query: self.search_jobs(query, location, experience)
+            for query in dict.fromkeys(q for q in queries if q and q.strip())
+        }
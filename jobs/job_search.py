@@ -9,15 +9,33 @@ from .suggestions import (
     JOB_TYPES
 )
 from .companies import get_featured_companies, get_market_insights
+from .suggestion_index import get_suggestion_index
+from .fuzzy_search import FuzzyIndex
+
+# Autocomplete indexes, built once at import
+JOB_INDEX = get_suggestion_index(JOB_SUGGESTIONS)
+LOCATION_INDEX = get_suggestion_index(LOCATION_SUGGESTIONS)
+
+# Typo-tolerant fallbacks for when autocomplete finds nothing
+JOB_FUZZY_INDEX = FuzzyIndex(JOB_SUGGESTIONS)
+LOCATION_FUZZY_INDEX = FuzzyIndex(LOCATION_SUGGESTIONS)
+COMPANY_FUZZY_INDEX = FuzzyIndex(get_featured_companies(), key="name")
+
+def match_suggestions(query: str, index, fuzzy_index, limit: int = 10) -> List[str]:
+    """Suggestion texts for a query, falling back to fuzzy matching when no substring matches"""
+    results = index.search(query, limit=limit) or fuzzy_index.search(query, limit=limit)
+    # The catalogues contain a few duplicate entries
+    return list(dict.fromkeys(s["text"] for s in results))
+
+def search_companies(query: str, limit: int = 5) -> List[Dict]:
+    """Featured companies matching a possibly misspelled name"""
+    return COMPANY_FUZZY_INDEX.search(query, limit=limit)
 
 def filter_suggestions(query: str, suggestions: List[Dict]) -> List[Dict]:
     """Filter suggestions based on user input"""
     if not query:
         return []
-    return [
-        s for s in suggestions 
-        if query.lower() in s["text"].lower()
-    ][:5]
+    return get_suggestion_index(suggestions).search(query, limit=5)
 
 def get_filter_options():
     """Get filter options for job search"""
@@ -100,12 +118,19 @@ def render_company_section():
     # Featured Companies
     st.markdown("### 🏢 Featured Companies")
     
+    company_query = st.text_input("Search companies", placeholder="e.g. Google, Infosys", key="company_search")
+    matched_names = {c["name"] for c in search_companies(company_query, limit=10)} if company_query else None
+
     tabs = st.tabs(["All Companies", "Tech Giants", "Indian Tech", "Global Corps"])
     
     categories = [None, "tech", "indian_tech", "global_corps"]
     for tab, category in zip(tabs, categories):
         with tab:
             companies = get_featured_companies(category)
+            if matched_names is not None:
+                companies = [c for c in companies if c["name"] in matched_names]
+                if not companies:
+                    st.info("No featured companies match your search.")
             st.markdown('<div class="company-grid">', unsafe_allow_html=True)
             
             for company in companies:
@@ -297,7 +322,7 @@ def render_job_search():
                                     placeholder="e.g. Software Engineer, Data Scientist")
             
             if job_query and len(job_query) >= 2:
-                filtered_jobs = [s["text"] for s in JOB_SUGGESTIONS if job_query.lower() in s["text"].lower()]
+                filtered_jobs = match_suggestions(job_query, JOB_INDEX, JOB_FUZZY_INDEX)
                 if filtered_jobs:
                     job_query = st.selectbox("Select Job Title", filtered_jobs)
         
@@ -307,7 +332,7 @@ def render_job_search():
                                    placeholder="e.g. Bangalore, Mumbai")
             
             if location and len(location) >= 2:
-                filtered_locations = [s["text"] for s in LOCATION_SUGGESTIONS if location.lower() in s["text"].lower()]
+                filtered_locations = match_suggestions(location, LOCATION_INDEX, LOCATION_FUZZY_INDEX)
                 if filtered_locations:
                     location = st.selectbox("Select Location", filtered_locations)
 
@@ -0,0 +1,192 @@
+"""Inverted index and BM25 ranking of job listings against resume skills"""
+import heapq
+import math
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from config.job_roles import JOB_ROLES
+from .fuzzy_search import ALIASES, normalize
+
+# BM25 parameters: term frequency saturation and document length normalization
+BM25_K1 = 1.2
+BM25_B = 0.75
+# Integer term weights stored in the postings; a title word counts half a listed skill
+SKILL_WEIGHT = 2
+TITLE_WEIGHT = 1
+
+def canonical_term(text: str) -> str:
+    """Index term for a skill or title word: normalized, aliased, without a .js suffix"""
+    term = normalize(text)
+    term = ALIASES.get(term, term)
+    if term.endswith(".js") and len(term) > 3:
+        term = term[:-3]
+    return term
+
+def _location_key(text: str) -> str:
+    text = normalize(text)
+    return ALIASES.get(text) or " ".join(ALIASES.get(word, word) for word in text.split())
+
+# get_filter_options range ids that are names rather than "low-high"
+NAMED_RANGES = {"fresher": (0.0, 1.0)}
+
+def parse_range(range_id: str) -> Optional[Tuple[float, float]]:
+    """
+    (low, high) for a get_filter_options range id such as "3-5", "10+" or
+    "fresher"; None for "all" and for ids it does not recognize, so the
+    filter is skipped rather than failing the search.
+    """
+    if not range_id or range_id == "all":
+        return None
+    if range_id in NAMED_RANGES:
+        return NAMED_RANGES[range_id]
+    try:
+        if range_id.endswith("+"):
+            return float(range_id[:-1]), math.inf
+        low, high = range_id.split("-")
+        return float(low), float(high)
+    except ValueError:
+        return None
+
+def _overlaps(low: Optional[float], high: Optional[float], wanted: Tuple[float, float]) -> bool:
+    # Listings that do not state a range are kept
+    if low is None and high is None:
+        return True
+    low = wanted[0] if low is None else low
+    high = math.inf if high is None else high
+    return low <= wanted[1] and high >= wanted[0]
+
+def encode_postings(postings: List[Tuple[int, int]]) -> bytes:
+    """Varint-encode (doc id, frequency) pairs, doc ids as deltas from the previous one"""
+    out = bytearray()
+    previous = 0
+    for doc_id, freq in postings:
+        for value in (doc_id - previous, freq):
+            while value >= 0x80:
+                out.append((value & 0x7F) | 0x80)
+                value >>= 7
+            out.append(value)
+        previous = doc_id
+    return bytes(out)
+
+def decode_postings(data: bytes) -> Iterable[Tuple[int, int]]:
+    """Inverse of encode_postings"""
+    doc_id = 0
+    values = []
+    value = shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        values.append(value)
+        value = shift = 0
+        if len(values) == 2:
+            doc_id += values[0]
+            yield doc_id, values[1]
+            values = []
+
+class ListingIndex:
+    """
+    Inverted index from skill terms to the listings that mention them.
+
+    Each listing's skills and title words become terms; a term's postings
+    list holds (listing id, term frequency) pairs, delta and varint encoded.
+    Queries only decode the postings of the resume's skills, so ranking cost
+    depends on how common those skills are rather than on the number of
+    listings. Scores are BM25; location, experience, salary and job type
+    filters use the ids from get_filter_options.
+    """
+
+    def __init__(self, listings: Iterable[Dict]):
+        self.listings = list(listings)
+        self._doc_lengths = []
+        self._locations = []
+
+        postings = defaultdict(list)
+        for doc_id, listing in enumerate(self.listings):
+            terms = Counter()
+            for skill in listing.get("skills") or []:
+                term = canonical_term(skill)
+                if term:
+                    terms[term] += SKILL_WEIGHT
+            for word in normalize(listing.get("title") or "").split():
+                terms[canonical_term(word)] += TITLE_WEIGHT
+            for term, freq in terms.items():
+                postings[term].append((doc_id, freq))
+            self._doc_lengths.append(sum(terms.values()) / SKILL_WEIGHT)
+            self._locations.append(_location_key(listing.get("location") or ""))
+
+        self._postings = {term: encode_postings(pairs) for term, pairs in postings.items()}
+        self._doc_freq = {term: len(pairs) for term, pairs in postings.items()}
+        self._avg_length = (sum(self._doc_lengths) / len(self._doc_lengths)) if self._doc_lengths else 0
+
+    def __len__(self):
+        return len(self.listings)
+
+    @classmethod
+    def from_store(cls, store) -> "ListingIndex":
+        """Index every listing in a jobs.ingestion.ListingStore"""
+        return cls(store.iter_listings())
+
+    def _idf(self, term: str) -> float:
+        df = self._doc_freq.get(term, 0)
+        return math.log(1 + (len(self.listings) - df + 0.5) / (df + 0.5))
+
+    def _accepts(self, doc_id: int, location: str, experience, salary, job_type: str) -> bool:
+        listing = self.listings[doc_id]
+        if location and location not in self._locations[doc_id]:
+            return False
+        if experience and not _overlaps(listing.get("experience_min"), listing.get("experience_max"), experience):
+            return False
+        if salary and not _overlaps(listing.get("salary_min"), listing.get("salary_max"), salary):
+            return False
+        if job_type:
+            if job_type == "remote":
+                if "remote" not in self._locations[doc_id] and listing.get("job_type") != "remote":
+                    return False
+            elif listing.get("job_type") and listing.get("job_type") != job_type:
+                return False
+        return True
+
+    def search(self, skills: Iterable[str], top_k: int = 10, location: str = "", experience: str = "all",
+               salary: str = "all", job_type: str = "all") -> List[Tuple[Dict, float]]:
+        """Top `top_k` (listing, score) pairs for a set of skills, best first"""
+        terms = {canonical_term(skill) for skill in skills} - {""}
+        location = _location_key(location or "")
+        experience, salary = parse_range(experience), parse_range(salary)
+        job_type = "" if job_type in (None, "", "all") else job_type
+
+        scores = defaultdict(float)
+        for term in terms:
+            data = self._postings.get(term)
+            if data is None:
+                continue
+            idf = self._idf(term)
+            for doc_id, freq in decode_postings(data):
+                tf = freq / SKILL_WEIGHT
+                norm = 1 - BM25_B + BM25_B * self._doc_lengths[doc_id] / self._avg_length
+                scores[doc_id] += idf * tf * (BM25_K1 + 1) / (tf + BM25_K1 * norm)
+
+        best = heapq.nsmallest(
+            top_k,
+            ((-score, doc_id) for doc_id, score in scores.items()
+             if self._accepts(doc_id, location, experience, salary, job_type))
+        )
+        return [(self.listings[doc_id], round(-score, 4)) for score, doc_id in best]
+
+    def match_resume(self, resume_data: Dict, **kwargs) -> List[Tuple[Dict, float]]:
+        """Rank listings for a ResumeParser.parse() result"""
+        return self.search(resume_data.get("skills") or [], **kwargs)
+
+def _build_role_skills():
+    return {
+        role: info.get("required_skills", [])
+        for roles in JOB_ROLES.values()
+        for role, info in roles.items()
+    }
+
+_ROLE_SKILLS = _build_role_skills()
+
+def get_role_skills(role_name: str) -> List[str]:
+    """Required skills of a JOB_ROLES role, for ranking listings against a target role"""
+    return _ROLE_SKILLS.get(role_name, [])
@@ -0,0 +1,110 @@
+"""Precomputed substring index for job title and location autocomplete"""
+from typing import Dict, List
+
+# Rank of a match, best first
+MATCH_START, MATCH_WORD, MATCH_INFIX = 0, 1, 2
+
+class _Node:
+    __slots__ = ("children", "top", "ids")
+
+    def __init__(self):
+        self.children = {}
+        self.top = []    # best (rank, entry id) pairs, at most max_results
+        self.ids = None  # every entry id; only kept on nodes at max_depth
+
+class SuggestionIndex:
+    """
+    Suffix trie over lowercased suggestion texts, built once.
+
+    Every suffix of every text is inserted up to `max_depth` characters, and
+    each node keeps its best `max_results` entries ranked by match type
+    (start of text, start of a word, anywhere) then catalogue order. A query
+    is answered by walking len(query) nodes, so its cost does not depend on
+    the catalogue size. Queries longer than `max_depth` verify the few
+    candidates stored at the depth limit.
+    """
+
+    def __init__(self, suggestions: List[Dict], max_results: int = 10, max_depth: int = 12):
+        self.suggestions = suggestions
+        self.max_results = max_results
+        self.max_depth = max_depth
+        self._lowered = [s["text"].lower() for s in suggestions]
+        self._root = _Node()
+        for entry_id, text in enumerate(self._lowered):
+            self._insert(entry_id, text)
+
+    @staticmethod
+    def _rank(text: str, start: int) -> int:
+        if start == 0:
+            return MATCH_START
+        if not text[start - 1].isalnum():
+            return MATCH_WORD
+        return MATCH_INFIX
+
+    def _insert(self, entry_id: int, text: str):
+        for start in range(len(text)):
+            key = (self._rank(text, start), entry_id)
+            node = self._root
+            for depth, char in enumerate(text[start:start + self.max_depth], 1):
+                node = node.children.setdefault(char, _Node())
+                self._offer(node, key)
+                if depth == self.max_depth:
+                    if node.ids is None:
+                        node.ids = set()
+                    node.ids.add(entry_id)
+
+    def _offer(self, node: _Node, key):
+        """Keep `key` in the node's top list if it ranks among the best."""
+        rank, entry_id = key
+        for i, (existing_rank, existing_id) in enumerate(node.top):
+            if existing_id == entry_id:
+                if rank < existing_rank:
+                    node.top[i] = key
+                    node.top.sort()
+                return
+        if len(node.top) < self.max_results or key < node.top[-1]:
+            node.top.append(key)
+            node.top.sort()
+            del node.top[self.max_results:]
+
+    def _best_rank(self, text: str, query: str) -> int:
+        best = MATCH_INFIX
+        start = text.find(query)
+        while start != -1 and best != MATCH_START:
+            best = min(best, self._rank(text, start))
+            start = text.find(query, start + 1)
+        return best
+
+    def search(self, query: str, limit: int = None) -> List[Dict]:
+        """Return up to `limit` suggestions containing `query`, best matches first."""
+        limit = min(limit or self.max_results, self.max_results)
+        query = query.strip().lower() if query else ""
+        if not query:
+            return []
+
+        node = self._root
+        for char in query[:self.max_depth]:
+            node = node.children.get(char)
+            if node is None:
+                return []
+
+        if len(query) <= self.max_depth:
+            return [self.suggestions[entry_id] for _, entry_id in node.top[:limit]]
+
+        matches = sorted(
+            (self._best_rank(self._lowered[entry_id], query), entry_id)
+            for entry_id in node.ids
+            if query in self._lowered[entry_id]
+        )
+        return [self.suggestions[entry_id] for _, entry_id in matches[:limit]]
+
+_indexes = {}
+
+def get_suggestion_index(suggestions: List[Dict]) -> SuggestionIndex:
+    """Return the index for a suggestion list, building it on first use."""
+    cached = _indexes.get(id(suggestions))
+    # Keep a reference to the list so its id cannot be reused by another object
+    if cached is None or cached[0] is not suggestions:
+        cached = (suggestions, SuggestionIndex(suggestions))
+        _indexes[id(suggestions)] = cached
+    return cached[1]
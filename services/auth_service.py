@@ -0,0 +1,118 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import bcrypt
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+DEFAULT_BCRYPT_ROUNDS = 12
+DEFAULT_MAX_WORKERS = min(4, os.cpu_count() or 1)
+DEFAULT_TIMEOUT = 30
+
+class AuthService:
+    """
+    Runs bcrypt hashing and checking on a dedicated, bounded thread pool.
+
+    bcrypt releases the GIL while it works, so a small pool hashes in parallel
+    without blocking other sessions' script threads, and the pool size caps
+    how many CPU cores a burst of sign-ins can occupy. The work factor, pool
+    size and wait timeout come from BCRYPT_ROUNDS, AUTH_MAX_WORKERS and
+    AUTH_TIMEOUT when not passed explicitly.
+    """
+
+    def __init__(self, rounds=None, max_workers=None, timeout=None):
+        self.rounds = rounds or int(os.getenv('BCRYPT_ROUNDS', DEFAULT_BCRYPT_ROUNDS))
+        self.max_workers = max_workers or int(os.getenv('AUTH_MAX_WORKERS', DEFAULT_MAX_WORKERS))
+        self.timeout = timeout or float(os.getenv('AUTH_TIMEOUT', DEFAULT_TIMEOUT))
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='auth')
+        self._metrics_lock = threading.Lock()
+        self._metrics = {}
+
+    def _record(self, operation, wait_seconds, run_seconds):
+        """Accumulate timing metrics for one operation."""
+        with self._metrics_lock:
+            stats = self._metrics.setdefault(operation, {
+                'count': 0, 'total_wait': 0.0, 'total_run': 0.0, 'max_run': 0.0
+            })
+            stats['count'] += 1
+            stats['total_wait'] += wait_seconds
+            stats['total_run'] += run_seconds
+            stats['max_run'] = max(stats['max_run'], run_seconds)
+
+    def _submit(self, operation, func, *args):
+        """Run `func` on the pool, timing queue wait and execution separately."""
+        submitted_at = time.perf_counter()
+
+        def task():
+            started_at = time.perf_counter()
+            try:
+                return func(*args)
+            finally:
+                finished_at = time.perf_counter()
+                self._record(operation, started_at - submitted_at, finished_at - started_at)
+
+        return self._executor.submit(task)
+
+    def _hash(self, password):
+        return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=self.rounds)).decode('utf-8')
+
+    def _check(self, password, hashed):
+        try:
+            return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+        except ValueError:
+            logger.warning("Stored password hash is not a valid bcrypt hash")
+            return False
+
+    def hash_password_async(self, password):
+        """Hash a password on the pool. Returns a Future resolving to the hash string."""
+        return self._submit('hash', self._hash, password)
+
+    def check_password_async(self, password, hashed):
+        """Check a password against a bcrypt hash on the pool. Returns a Future resolving to a bool."""
+        return self._submit('check', self._check, password, hashed)
+
+    def hash_password(self, password):
+        """Hash a password, waiting at most `timeout` seconds for the result."""
+        return self.hash_password_async(password).result(timeout=self.timeout)
+
+    def check_password(self, password, hashed):
+        """Check a password, waiting at most `timeout` seconds for the result."""
+        return self.check_password_async(password, hashed).result(timeout=self.timeout)
+
+    def needs_rehash(self, hashed):
+        """True when a hash was created with a different work factor than the configured one."""
+        try:
+            return int(hashed.split('$')[2]) != self.rounds
+        except (IndexError, ValueError):
+            return True
+
+    def get_metrics(self):
+        """Timing metrics per operation, in milliseconds."""
+        with self._metrics_lock:
+            return {
+                operation: {
+                    'count': stats['count'],
+                    'avg_wait_ms': stats['total_wait'] / stats['count'] * 1000,
+                    'avg_run_ms': stats['total_run'] / stats['count'] * 1000,
+                    'max_run_ms': stats['max_run'] * 1000
+                }
+                for operation, stats in self._metrics.items()
+            }
+
+    def shutdown(self):
+        self._executor.shutdown(wait=True)
+
+_auth_service = None
+_auth_service_lock = threading.Lock()
+
+def get_auth_service():
+    """Return the process-wide AuthService, creating it on first use."""
+    global _auth_service
+    if _auth_service is None:
+        with _auth_service_lock:
+            if _auth_service is None:
+                _auth_service = AuthService()
+    return _auth_service
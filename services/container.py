@@ -0,0 +1,119 @@
+"""Process-wide services shared by every Streamlit session"""
+from functools import partial
+from typing import Dict
+
+import streamlit as st
+
+from services.job_queue import JobQueue
+from services.write_behind import WriteBehindQueue
+from ui_components import clean_page_name
+from utils.logger import setup_logger
+from views.registry import PageRegistry, import_module
+
+logger = setup_logger(__name__)
+
+# Alternate names for pages set in st.session_state.page, mapped to cleaned page names
+PAGE_ALIASES = {
+    'builder': 'resume_builder',
+    'insights': 'dashboard',
+    'forgot_password': 'forgot_password'
+}
+
+HOME_PAGE = "🏠 HOME"
+GENERATE_RESUME_JOB = "generate_resume"
+RESET_PASSWORD_PAGE = "RESET PASSWORD"
+
+# The managers below keep no per-session state, so one instance per process
+# is shared by every session. st.cache_resource builds each on first use.
+
+@st.cache_resource
+def get_dashboard_manager():
+    return import_module("dashboard.dashboard").DashboardManager()
+
+@st.cache_resource
+def get_resume_builder():
+    return import_module("utils.resume_builder").ResumeBuilder()
+
+@st.cache_resource
+def get_old_analyzer():
+    return import_module("utils.resume_analyzer").ResumeAnalyzer()
+
+def generate_resume_job(payload, writer: WriteBehindQueue):
+    """
+    Job handler: LaTeX from the LLM; the resume row is queued on `writer`.
+
+    The resume is in the writer's SQLite outbox before the job succeeds, so
+    a crash cannot lose it. Only a failed generation fails the job; save
+    failures are retried and dead-lettered by the resume writer.
+    """
+    generate_latex_resume = import_module("services.latex_generator").generate_latex_resume
+    latex_code = generate_latex_resume(payload["resume_data"], payload["template"], payload["job_role"])
+    writer.submit(payload["resume_data"])
+    return {"latex": latex_code}
+
+@st.cache_resource
+def get_resume_writer() -> WriteBehindQueue:
+    """Generated resumes are saved in batches by this queue, off the job's critical path"""
+    save_resume_data_batch = import_module("config.database").save_resume_data_batch
+    writer = WriteBehindQueue(save_resume_data_batch, name="resume_writes")
+    # Drain resumes a previous process persisted but did not write
+    writer.start()
+    return writer
+
+@st.cache_resource
+def get_job_queue() -> JobQueue:
+    queue = JobQueue()
+    # Resolved here, in the script thread: workers have no Streamlit context for cache lookups
+    queue.register(GENERATE_RESUME_JOB, partial(generate_resume_job, writer=get_resume_writer()))
+    queue.start()
+    return queue
+
+class Router:
+    """
+    Page registry plus the lookup tables used to route st.session_state.page.
+
+    Built once per process by get_router(); read-only afterwards.
+    """
+
+    def __init__(self, registry: PageRegistry, aliases: Dict[str, str] = None):
+        self.registry = registry
+        self.pages = {name: render for name, render in registry.renderers().items() if name != RESET_PASSWORD_PAGE}
+        self.page_mapping = {clean_page_name(name): name for name in self.pages}
+        self.aliases = PAGE_ALIASES if aliases is None else aliases
+
+    def resolve(self, current_page) -> str:
+        """
+        Registered page name for a session's current page, or the home page.
+
+        Aliases are checked first (e.g. 'builder' -> 'resume_builder'), then
+        the cleaned name (e.g. "Resume Analyzer" -> "resume_analyzer").
+        """
+        current_page_lower = str(current_page).lower().strip()
+        target_page = self.aliases.get(current_page_lower, clean_page_name(str(current_page)))
+        return self.page_mapping.get(target_page, HOME_PAGE)
+
+    def render(self, name: str):
+        return self.registry.render(name)
+
+def build_page_registry() -> PageRegistry:
+    """Every page of the app, by view module; each is imported when first rendered"""
+    registry = PageRegistry()
+    registry.register(HOME_PAGE, "views.home", "render_home")
+    registry.register("📝 RESUME BUILDER", "views.builder", "render_builder", lambda: (get_resume_builder(),))
+    registry.register("🎯 ATS RESUME OPTIMIZER", "views.ats_optimizer", "render_ats_optimizer")
+    registry.register("✉️ COVER LETTER GENERATOR", "views.cover_letter", "render_cover_letter_page")
+    registry.register("🌐 PORTFOLIO VIEWER", "views.portfolio", "render_portfolio_page")
+    registry.register("📊 DASHBOARD", "views.dashboard_view", "render_dashboard", lambda: (get_dashboard_manager(),))
+    registry.register("🎯 JOB SEARCH", "views.job_search", "render_job_search")
+    registry.register("💬 FEEDBACK", "views.feedback", "render_feedback_page")
+    registry.register("ℹ️ ABOUT", "views.about", "render_about")
+    registry.register("🔑 SIGN IN", "views.signin", "render_signin")
+    registry.register("📝 SIGN UP", "views.signup", "render_signup")
+    registry.register("🔑 FORGOT PASSWORD", "views.forgot_password", "render_forgot_password")
+    # Reached through the emailed link only, so it is not in the sidebar
+    registry.register(RESET_PASSWORD_PAGE, "views.reset_password", "render_reset_password")
+    return registry
+
+@st.cache_resource
+def get_router() -> Router:
+    return Router(build_page_registry())
@@ -0,0 +1,193 @@
+"""SQLite-backed background jobs, so long-running work outlives Streamlit reruns"""
+import json
+import threading
+import uuid
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Optional
+
+from utils.logger import setup_logger
+from utils.sqlite_manager import get_connection_manager
+
+logger = setup_logger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+FINISHED = (SUCCEEDED, FAILED)
+
+JOBS_SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS jobs (
+        id TEXT PRIMARY KEY,
+        kind TEXT NOT NULL,
+        status TEXT NOT NULL,
+        payload TEXT NOT NULL,
+        result TEXT,
+        error TEXT,
+        attempts INTEGER NOT NULL DEFAULT 0,
+        created_at TEXT NOT NULL,
+        started_at TEXT,
+        finished_at TEXT
+    );
+    CREATE INDEX IF NOT EXISTS ix_jobs_status_created_at ON jobs (status, created_at);
+'''
+
+def _now() -> str:
+    return datetime.now().isoformat(" ")
+
+class JobQueue:
+    """
+    Persistent queue of jobs run by a pool of daemon worker threads.
+
+    submit() stores the job and returns its id straight away; the UI polls
+    get() with that id on later reruns. Jobs, their status and their results
+    live in SQLite, so several app processes can share one queue file: a job
+    is claimed inside a write transaction, so only one worker ever runs it.
+
+    A job left "running" for longer than `stale_after` seconds (its process
+    died mid-job) is queued again, up to `max_attempts` runs in total.
+    """
+
+    def __init__(self, db_path="services/jobs.db", workers=2, poll_interval=1.0,
+                 max_attempts=2, stale_after=900, retention_days=7):
+        self.db_path = db_path
+        self.db = get_connection_manager(db_path, schema=JOBS_SCHEMA)
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.stale_after = stale_after
+        self.retention_days = retention_days
+        self._handlers: Dict[str, Callable[[Dict], Dict]] = {}
+        self._threads = []
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._lock = threading.Lock()
+
+    def register(self, kind: str, handler: Callable[[Dict], Dict]):
+        """Run jobs of `kind` with handler(payload); its return value is stored as the result"""
+        self._handlers[kind] = handler
+
+    def submit(self, kind: str, payload: Dict) -> str:
+        if kind not in self._handlers:
+            raise ValueError(f"No handler registered for job kind '{kind}'")
+        job_id = uuid.uuid4().hex
+        with self.db.transaction() as conn:
+            conn.execute(
+                "INSERT INTO jobs (id, kind, status, payload, created_at) VALUES (?, ?, ?, ?, ?)",
+                (job_id, kind, QUEUED, json.dumps(payload), _now())
+            )
+        logger.info("Queued %s job %s", kind, job_id)
+        self._wakeup.set()
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """The job with its payload and result decoded, or None if it does not exist"""
+        with self.db.connection() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        job["payload"] = json.loads(job["payload"])
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        return job
+
+    def counts(self) -> Dict[str, int]:
+        with self.db.connection() as conn:
+            rows = conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        return {status: count for status, count in rows}
+
+    def requeue_stale(self) -> int:
+        """Put jobs orphaned by a dead worker back in the queue, or fail them once out of attempts"""
+        cutoff = (datetime.now() - timedelta(seconds=self.stale_after)).isoformat(" ")
+        with self.db.transaction() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, finished_at = ?, error = 'Worker stopped before the job finished' "
+                "WHERE status = ? AND started_at < ? AND attempts >= ?",
+                (FAILED, _now(), RUNNING, cutoff, self.max_attempts)
+            )
+            return conn.execute(
+                "UPDATE jobs SET status = ?, started_at = NULL WHERE status = ? AND started_at < ?",
+                (QUEUED, RUNNING, cutoff)
+            ).rowcount
+
+    def prune(self) -> int:
+        """Delete finished jobs older than the retention period"""
+        cutoff = (datetime.now() - timedelta(days=self.retention_days)).isoformat(" ")
+        with self.db.transaction() as conn:
+            return conn.execute(
+                f"DELETE FROM jobs WHERE status IN ({', '.join('?' * len(FINISHED))}) AND finished_at < ?",
+                FINISHED + (cutoff,)
+            ).rowcount
+
+    def _claim(self) -> Optional[Dict]:
+        with self.db.transaction() as conn:
+            row = conn.execute(
+                "SELECT id, kind, payload, attempts FROM jobs WHERE status = ? ORDER BY created_at LIMIT 1",
+                (QUEUED,)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE jobs SET status = ?, started_at = ?, attempts = attempts + 1 WHERE id = ?",
+                (RUNNING, _now(), row["id"])
+            )
+        return dict(row)
+
+    def _finish(self, job_id: str, status: str, result=None, error=None):
+        with self.db.transaction() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ? WHERE id = ?",
+                (status, json.dumps(result) if result is not None else None, error, _now(), job_id)
+            )
+
+    def run_next(self) -> bool:
+        """Claim and run the oldest queued job in the calling thread; False if none was queued"""
+        job = self._claim()
+        if job is None:
+            return False
+        handler = self._handlers.get(job["kind"])
+        if handler is None:
+            self._finish(job["id"], FAILED, error=f"No handler registered for job kind '{job['kind']}'")
+            return True
+        try:
+            result = handler(json.loads(job["payload"]))
+        except Exception as e:
+            logger.error("%s job %s failed: %s", job["kind"], job["id"], e, exc_info=True)
+            self._finish(job["id"], FAILED, error=str(e))
+        else:
+            logger.info("%s job %s succeeded", job["kind"], job["id"])
+            self._finish(job["id"], SUCCEEDED, result=result)
+        return True
+
+    def _work(self):
+        while not self._stopping.is_set():
+            try:
+                if self.run_next():
+                    continue
+            except Exception as e:
+                # A database error must not kill the worker; try again on the next poll
+                logger.error("Job worker error: %s", e, exc_info=True)
+            self._wakeup.wait(self.poll_interval)
+            self._wakeup.clear()
+
+    def start(self):
+        """Start the worker threads; safe to call more than once"""
+        with self._lock:
+            if self._threads:
+                return
+            self._stopping.clear()
+            self.requeue_stale()
+            self.prune()
+            for i in range(self.workers):
+                thread = threading.Thread(target=self._work, name=f"job-worker-{i}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def stop(self, timeout=5.0):
+        """Stop the workers after their current job"""
+        with self._lock:
+            self._stopping.set()
+            self._wakeup.set()
+            for thread in self._threads:
+                thread.join(timeout)
+            self._threads = []
@@ -1,8 +1,10 @@
 from config.groq_config import get_groq_client
 from utils.logger import setup_logger
+from utils.metrics import timed
 
 logger = setup_logger(__name__)
 
+@timed("latex.generate")
 def generate_latex_resume(resume_data, template_style, job_role):
     """
     Generate LaTeX code for resume using Groq API with job role targeting
@@ -262,14 +264,9 @@ Write a compelling 2-3 line summary specifically highlighting passion and skills
 
 Generate ONLY the complete, production-ready LaTeX code with all the improvements. No explanations, no markdown blocks."""
 
-        logger.info(f"Sending enhanced request to Groq API for {template_style} template targeting {job_role} role")
+        logger.info("Sending enhanced request to Groq API for %s template targeting %s role", template_style, job_role)
         
-        # Call Groq API
-        chat_completion = client.chat.completions.create(
-            messages=[
-                {
-                    "role": "system",
-                    "content": f"""You are a professional resume writer with 15+ years of experience and an expert LaTeX developer. You specialize in creating compelling, ATS-optimized resumes for {job_role} positions that get interviews at top companies. 
+        system_prompt = f"""You are a professional resume writer with 15+ years of experience and an expert LaTeX developer. You specialize in creating compelling, ATS-optimized resumes for {job_role} positions that get interviews at top companies. 
 
 You write achievement-focused, metric-driven content. You create visually stunning, modern resumes that compile perfectly with pdflatex. You NEVER use fontspec. You ALWAYS show FULL URLs for LinkedIn (https://www.linkedin.com/in/username) and GitHub (https://github.com/username) in the contact section.
 
@@ -281,21 +278,29 @@ You follow these principles:
 - Ensure the resume fits on exactly ONE page
 - Make it visually appealing yet professional
 - Focus on IMPACT and RESULTS over duties"""
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            model="llama-3.3-70b-versatile",
-            temperature=0.8,
-            max_tokens=4500,
-            top_p=0.95,
-            stream=False
-        )
+
+        # Call Groq API
+        with timed("latex.llm_call"):
+            chat_completion = client.chat.completions.create(
+                messages=[
+                    {
+                        "role": "system",
+                        "content": system_prompt
+                    },
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ],
+                model="llama-3.3-70b-versatile",
+                temperature=0.8,
+                max_tokens=4500,
+                top_p=0.95,
+                stream=False
+            )
         
         latex_code = chat_completion.choices[0].message.content
-        logger.info(f"Enhanced LaTeX code generated successfully for {job_role} role")
+        logger.info("Enhanced LaTeX code generated successfully for %s role", job_role)
         
         # Clean up the response
         latex_code = latex_code.strip()
@@ -320,7 +325,7 @@ You follow these principles:
         return latex_code.strip()
         
     except Exception as e:
-        logger.error(f"Error generating LaTeX with Groq: {str(e)}", exc_info=True)
+        logger.error("Error generating LaTeX with Groq: %s", e, exc_info=True)
         raise Exception(f"Failed to generate LaTeX resume: {str(e)}")
 
 
@@ -440,7 +445,7 @@ def format_resume_data_as_text(resume_data):
     """
     Format resume data as readable text for the prompt
     """
-    logger.debug(f"Formatting resume data: {resume_data}")
+    logger.debug("Formatting resume data sections: %s", list(resume_data))
     personal_info = resume_data.get('personal_info', {})
     
     text = f"""
@@ -1,8 +1,10 @@
 import requests
 from utils.logger import setup_logger
+from utils.metrics import timed
 
 logger = setup_logger(__name__)
 
+@timed("latex.compile_online")
 def compile_latex_online(latex_code):
     """
     Compile LaTeX to PDF using latex.online service
@@ -32,10 +34,10 @@ def compile_latex_online(latex_code):
             logger.info("PDF compiled successfully online")
             return response.content
         else:
-            logger.error(f"Online compilation failed: {response.status_code}")
-            logger.error(f"Response: {response.text}")
+            logger.error("Online compilation failed: %s", response.status_code)
+            logger.error("Response: %s", response.text)
             return None
             
     except Exception as e:
-        logger.error(f"Error with online LaTeX compilation: {str(e)}", exc_info=True)
+        logger.error("Error with online LaTeX compilation: %s", e, exc_info=True)
         return None
\ No newline at end of file
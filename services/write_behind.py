@@ -0,0 +1,230 @@
+"""Write-behind queue: saves are batched and written off the request path"""
+import atexit
+import json
+import os
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Callable, Dict, List
+
+from utils.logger import setup_logger
+from utils.metrics import REGISTRY
+from utils.sqlite_manager import get_connection_manager
+
+logger = setup_logger(__name__)
+
+# Seconds the interpreter waits at exit for pending items to be written
+EXIT_FLUSH_TIMEOUT = 30
+
+# Outbox file used when neither db_path nor the OUTBOX_DB_PATH environment variable is set
+DEFAULT_OUTBOX_DB_PATH = os.path.join("services", "outbox.db")
+
+OUTBOX_SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS outbox (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        queue TEXT NOT NULL,
+        item TEXT NOT NULL,
+        enqueued_at REAL NOT NULL,
+        claimed_by TEXT,
+        claimed_at REAL
+    );
+    CREATE INDEX IF NOT EXISTS ix_outbox_queue_id ON outbox (queue, id);
+'''
+
+class WriteBehindQueue:
+    """
+    Persists items to a SQLite outbox and writes them in batches on a daemon thread.
+
+    submit() returns once the item is committed to the outbox, so a crash
+    before the write loses nothing: the next start() drains what is left.
+    Items must be JSON-serializable. Several processes may share one outbox
+    file; a batch is claimed inside a write transaction, and a claim older
+    than `claim_timeout` seconds (its writer died mid-batch) is taken over.
+
+    write_batch(items) must write every item or raise, and should be
+    idempotent, since an item whose write committed just before a crash is
+    written again. A failed batch is retried with exponential backoff; when
+    it still fails, each item is retried on its own so one bad record cannot
+    sink the rest, and items that fail alone are appended to the dead-letter
+    JSONL file. Dead letters can be resubmitted with replay_dead_letters().
+
+    The time from submit() to a committed write is recorded as the
+    "<name>.lag" operation in utils.metrics.
+    """
+
+    def __init__(self, write_batch: Callable[[List[Any]], Any], name="write_behind", batch_size=25,
+                 flush_interval=0.5, max_retries=3, retry_backoff=0.5, dead_letter_path=None,
+                 db_path=None, claim_timeout=300, sleep=time.sleep):
+        self.write_batch = write_batch
+        self.name = name
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.dead_letter_path = dead_letter_path or os.path.join(os.getenv("LOG_DIR", "logs"), f"{name}.dead.jsonl")
+        self.db = get_connection_manager(db_path or os.getenv("OUTBOX_DB_PATH", DEFAULT_OUTBOX_DB_PATH), schema=OUTBOX_SCHEMA)
+        self.claim_timeout = claim_timeout
+        self.sleep = sleep
+        self._owner = uuid.uuid4().hex
+        self._thread = None
+        self._atexit_registered = False
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._lock = threading.Lock()
+        self._stats = {"submitted": 0, "written": 0, "batches": 0, "retries": 0, "dead_lettered": 0}
+
+    def submit(self, item: Any):
+        """Persist an item for writing; returns once it is in the outbox"""
+        self.start()
+        with self.db.transaction() as conn:
+            conn.execute(
+                "INSERT INTO outbox (queue, item, enqueued_at) VALUES (?, ?, ?)",
+                (self.name, json.dumps(item, default=str), time.time())
+            )
+        with self._lock:
+            self._stats["submitted"] += 1
+        self._wakeup.set()
+
+    def start(self):
+        """Start the writer thread, draining items left by an earlier process; safe to call more than once"""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stopping.clear()
+                self._thread = threading.Thread(target=self._run, name=f"{self.name}-writer", daemon=True)
+                self._thread.start()
+            if not self._atexit_registered:
+                atexit.register(self.flush, EXIT_FLUSH_TIMEOUT)
+                self._atexit_registered = True
+
+    def _next_batch(self):
+        """Claim up to batch_size unclaimed (or abandoned) items, oldest first"""
+        now = time.time()
+        with self.db.transaction() as conn:
+            rows = conn.execute(
+                "SELECT id, item, enqueued_at FROM outbox WHERE queue = ? "
+                "AND (claimed_at IS NULL OR claimed_at < ?) ORDER BY id LIMIT ?",
+                (self.name, now - self.claim_timeout, self.batch_size)
+            ).fetchall()
+            if rows:
+                conn.execute(
+                    f"UPDATE outbox SET claimed_by = ?, claimed_at = ? WHERE id IN ({', '.join('?' * len(rows))})",
+                    (self._owner, now, *(row["id"] for row in rows))
+                )
+        return [(row["id"], row["enqueued_at"], json.loads(row["item"])) for row in rows]
+
+    def _remove(self, batch):
+        with self.db.transaction() as conn:
+            conn.execute(
+                f"DELETE FROM outbox WHERE id IN ({', '.join('?' * len(batch))})",
+                tuple(row_id for row_id, _, _ in batch)
+            )
+
+    def _run(self):
+        while not self._stopping.is_set():
+            try:
+                batch = self._next_batch()
+                if batch:
+                    self._write(batch)
+                    continue
+            except Exception as e:
+                # Never let the writer die; unwritten items stay in the outbox for the next claim
+                logger.error("%s writer error: %s", self.name, e, exc_info=True)
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+
+    def _write(self, batch):
+        items = [item for _, _, item in batch]
+        error = None
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                with self._lock:
+                    self._stats["retries"] += 1
+                self.sleep(self.retry_backoff * 2 ** (attempt - 1))
+            try:
+                self.write_batch(items)
+            except Exception as e:
+                error = e
+                logger.warning("%s batch of %s failed (attempt %s): %s", self.name, len(items), attempt + 1, e)
+                continue
+            self._remove(batch)
+            now = time.time()
+            for _, enqueued_at, _ in batch:
+                REGISTRY.observe(f"{self.name}.lag", now - enqueued_at)
+            with self._lock:
+                self._stats["written"] += len(items)
+                self._stats["batches"] += 1
+            return
+
+        if len(batch) > 1:
+            for entry in batch:
+                self._write([entry])
+        else:
+            self._dead_letter(items[0], error)
+            self._remove(batch)
+
+    def _dead_letter(self, item, error):
+        logger.error("%s item dead-lettered to %s: %s", self.name, self.dead_letter_path, error)
+        directory = os.path.dirname(self.dead_letter_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        entry = {"failed_at": datetime.now().isoformat(" "), "error": str(error), "item": item}
+        with self._lock:
+            with open(self.dead_letter_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, default=str) + "\n")
+            self._stats["dead_lettered"] += 1
+
+    def _unfinished(self) -> int:
+        """Items waiting for a claim or claimed by this writer"""
+        with self.db.connection() as conn:
+            return conn.execute(
+                "SELECT COUNT(*) FROM outbox WHERE queue = ? AND (claimed_by IS NULL OR claimed_by = ?)",
+                (self.name, self._owner)
+            ).fetchone()[0]
+
+    def flush(self, timeout=None) -> bool:
+        """Block until every pending item is written or dead-lettered; False on timeout"""
+        if self._thread is None:
+            return True
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._unfinished():
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def stop(self, timeout=5.0):
+        """Stop the writer after its current batch; unwritten items stay in the outbox"""
+        with self._lock:
+            thread = self._thread
+            self._stopping.set()
+            self._wakeup.set()
+        if thread is not None:
+            thread.join(timeout)
+
+    def replay_dead_letters(self) -> int:
+        """Resubmit every dead-lettered item and clear the file; returns the number resubmitted"""
+        with self._lock:
+            if not os.path.exists(self.dead_letter_path):
+                return 0
+            replay_path = f"{self.dead_letter_path}.replay"
+            os.replace(self.dead_letter_path, replay_path)
+        with open(replay_path, encoding="utf-8") as f:
+            items = [json.loads(line)["item"] for line in f if line.strip()]
+        for item in items:
+            self.submit(item)
+        os.remove(replay_path)
+        return len(items)
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters plus the number of unclaimed items and the age of the oldest, in seconds"""
+        with self.db.connection() as conn:
+            pending, oldest = conn.execute(
+                "SELECT COUNT(*), MIN(enqueued_at) FROM outbox WHERE queue = ? AND claimed_at IS NULL",
+                (self.name,)
+            ).fetchone()
+        with self._lock:
+            stats = dict(self._stats)
+        stats["pending"] = pending
+        stats["oldest_pending_age"] = round(time.time() - oldest, 3) if oldest is not None else 0.0
+        return stats
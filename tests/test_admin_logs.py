@@ -0,0 +1,64 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from config.database import get_admin_logs_page, get_db
+from config.models import AdminLog
+
+BASE_TIME = datetime(2026, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture
+def admin_logs(sqlite_db):
+    """Seeds 25 logs from two admins; every fifth log shares the previous timestamp."""
+    with get_db() as db:
+        for i in range(25):
+            minutes = i - 1 if i % 5 == 0 and i else i
+            db.add(AdminLog(
+                admin_email=f"admin{i % 2}@example.com",
+                action="login",
+                timestamp=BASE_TIME + timedelta(minutes=minutes)
+            ))
+        db.commit()
+        return [(log.timestamp, log.id) for log in db.query(AdminLog).all()]
+
+
+def collect_pages(**filters):
+    pages, cursor = [], None
+    while True:
+        page = get_admin_logs_page(limit=10, cursor=cursor, **filters)
+        pages.append(page["logs"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+def test_pages_cover_all_logs_newest_first(admin_logs):
+    """Walking the cursors returns every log exactly once, ordered by (timestamp, id) descending."""
+    pages = collect_pages()
+
+    assert [len(page) for page in pages] == [10, 10, 5]
+    keys = [(log["timestamp"], log["id"]) for page in pages for log in page]
+    assert keys == sorted(admin_logs, reverse=True)
+
+
+def test_admin_filter(admin_logs):
+    """Only the requested admin's logs are returned."""
+    pages = collect_pages(admin_email="admin1@example.com")
+
+    emails = {log["admin_email"] for page in pages for log in page}
+    assert emails == {"admin1@example.com"}
+    assert sum(len(page) for page in pages) == 12
+
+
+def test_time_range_filter(admin_logs):
+    """The start bound is inclusive and the end bound exclusive."""
+    page = get_admin_logs_page(
+        start=BASE_TIME + timedelta(minutes=11),
+        end=BASE_TIME + timedelta(minutes=13)
+    )
+
+    assert page["next_cursor"] is None
+    assert {log["timestamp"] for log in page["logs"]} == {
+        BASE_TIME + timedelta(minutes=m) for m in (11, 12)
+    }
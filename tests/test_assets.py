@@ -0,0 +1,107 @@
+import json
+
+import pytest
+import requests
+
+from utils import assets
+from utils.assets import AssetManager
+
+URL = "https://assets.example.com/packages/spinner.json"
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, payload):
+        self.payload = payload
+
+    def json(self):
+        return self.payload
+
+
+@pytest.fixture
+def asset_dir(tmp_path):
+    (tmp_path / "style.css").write_text("body { color: red; }")
+    (tmp_path / "lottie").mkdir()
+    return tmp_path
+
+
+@pytest.fixture
+def fetches(monkeypatch):
+    """Records network fetches; responds with a tiny animation."""
+    calls = []
+
+    def fake_get(url, timeout=None):
+        calls.append(url)
+        return FakeResponse({"v": "5.7.4", "layers": []})
+
+    monkeypatch.setattr(assets.requests, "get", fake_get)
+    return calls
+
+
+def make_manager(asset_dir):
+    return AssetManager(asset_dir=str(asset_dir), lottie_dir=str(asset_dir / "lottie"))
+
+
+def test_css_is_read_once_and_hashed(asset_dir):
+    """CSS is served from memory after the first read, tagged with its hash."""
+    manager = make_manager(asset_dir)
+    first = manager.get_css("style.css")
+    (asset_dir / "style.css").write_text("body { color: blue; }")
+
+    assert manager.get_css("style.css") == first
+    assert "color: red" in first
+    assert f'data-hash="{manager.asset_hash("style.css")}"' in first
+
+    manager.clear()
+    assert "color: blue" in manager.get_css("style.css")
+
+
+def test_bundled_lottie_skips_network(asset_dir, fetches):
+    """Bundled animations are loaded from disk without a request."""
+    (asset_dir / "lottie" / "spinner.json").write_text(json.dumps({"v": "1", "layers": []}))
+    manager = make_manager(asset_dir)
+
+    assert manager.get_lottie(URL) == {"v": "1", "layers": []}
+    assert manager.get_lottie(URL) is manager.get_lottie(URL)
+    assert fetches == []
+    assert len(manager.asset_hash("spinner")) == 12
+
+
+def test_missing_lottie_is_fetched_once_and_bundled(asset_dir, fetches):
+    """An unbundled animation is downloaded once and written to the bundle."""
+    manager = make_manager(asset_dir)
+    assert manager.get_lottie(URL)["v"] == "5.7.4"
+    assert manager.get_lottie(URL)["v"] == "5.7.4"
+    assert fetches == [URL]
+    assert json.loads((asset_dir / "lottie" / "spinner.json").read_text())["v"] == "5.7.4"
+
+
+def test_unreachable_lottie_is_retried_after_backoff(asset_dir, monkeypatch):
+    """A failed download returns None and is not retried on every rerun, only after retry_after."""
+    calls = []
+    now = [0.0]
+
+    def failing_get(url, timeout=None):
+        calls.append(url)
+        raise requests.ConnectionError("offline")
+
+    monkeypatch.setattr(assets.requests, "get", failing_get)
+    manager = AssetManager(asset_dir=str(asset_dir), lottie_dir=str(asset_dir / "lottie"),
+                           retry_after=60, clock=lambda: now[0])
+    assert manager.get_lottie(URL) is None
+    now[0] = 59
+    assert manager.get_lottie(URL) is None
+    assert calls == [URL]
+
+    now[0] = 60
+    monkeypatch.setattr(assets.requests, "get", lambda url, timeout=None: FakeResponse({"v": "5.7.4", "layers": []}))
+    assert manager.get_lottie(URL)["v"] == "5.7.4"
+
+
+def test_sidebar_animation_is_bundled(monkeypatch):
+    """The sidebar animation ships with the app, so rendering it needs no request."""
+    monkeypatch.setattr(assets.requests, "get", lambda url, timeout=None: pytest.fail("network used"))
+    animation = AssetManager().get_lottie("https://assets5.lottiefiles.com/packages/lf20_xyadoh9h.json", "sidebar")
+    assert animation["layers"]
+
@@ -0,0 +1,69 @@
+import concurrent.futures
+
+import pytest
+
+from config.database import add_admin, add_user, update_user_password, verify_user, get_db
+from config.models import User
+from services.auth_service import AuthService
+
+
+@pytest.fixture
+def auth_service():
+    """Provides a fast AuthService using the minimum bcrypt work factor."""
+    service = AuthService(rounds=4, max_workers=2)
+    yield service
+    service.shutdown()
+
+
+def test_hash_and_check_roundtrip(auth_service):
+    """A password verifies against its own hash and nothing else."""
+    hashed = auth_service.hash_password("password123")
+
+    assert hashed.startswith("$2b$04$")
+    assert auth_service.check_password("password123", hashed)
+    assert not auth_service.check_password("wrong-password", hashed)
+
+
+def test_invalid_hash_is_rejected(auth_service):
+    """A malformed stored hash fails verification instead of raising."""
+    assert not auth_service.check_password("password123", "not-a-bcrypt-hash")
+
+
+def test_metrics_are_recorded(auth_service):
+    """Each operation is counted with its timings."""
+    futures = [auth_service.hash_password_async(f"password{i}") for i in range(3)]
+    hashed = [future.result() for future in futures]
+    auth_service.check_password("password0", hashed[0])
+
+    metrics = auth_service.get_metrics()
+    assert metrics["hash"]["count"] == 3
+    assert metrics["check"]["count"] == 1
+    assert metrics["hash"]["max_run_ms"] > 0
+
+
+def test_verify_user_upgrades_outdated_work_factor(sqlite_db, monkeypatch):
+    """Signing in with a hash from an older work factor rehashes it."""
+    old_service = AuthService(rounds=4)
+    monkeypatch.setattr("config.database.get_auth_service", lambda: old_service)
+    assert add_user("test@example.com", "password123")
+
+    new_service = AuthService(rounds=5)
+    monkeypatch.setattr("config.database.get_auth_service", lambda: new_service)
+    assert verify_user("test@example.com", "password123")
+    assert not verify_user("test@example.com", "wrong-password")
+
+    with get_db() as db:
+        stored_hash = db.query(User.password).filter(User.email == "test@example.com").scalar()
+    assert stored_hash.startswith("$2b$05$")
+
+
+def test_hash_timeout_fails_the_write(sqlite_db, monkeypatch):
+    """A saturated bcrypt pool makes sign-up and password changes return False instead of raising."""
+    class SaturatedService:
+        def hash_password(self, password):
+            raise concurrent.futures.TimeoutError()
+
+    monkeypatch.setattr("config.database.get_auth_service", lambda: SaturatedService())
+    assert add_user("test@example.com", "password123") is False
+    assert add_admin("admin@example.com", "password123") is False
+    assert update_user_password("test@example.com", "password123") is False
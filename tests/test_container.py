@@ -0,0 +1,36 @@
+import sys
+
+from services.container import (
+    HOME_PAGE, RESET_PASSWORD_PAGE, Router, build_page_registry,
+    get_resume_builder, get_router
+)
+
+
+def test_router_is_built_once_per_process():
+    """Every call shares the same router and routing tables."""
+    assert get_router() is get_router()
+    assert get_router().pages is get_router().pages
+
+
+def test_resolve_aliases_and_cleaned_names():
+    """Session page values resolve to registered page names."""
+    router = Router(build_page_registry())
+    assert router.resolve("builder") == "📝 RESUME BUILDER"
+    assert router.resolve("insights") == "📊 DASHBOARD"
+    assert router.resolve("📝 RESUME BUILDER") == "📝 RESUME BUILDER"
+    assert router.resolve("Job Search") == "🎯 JOB SEARCH"
+    assert router.resolve("home") == HOME_PAGE
+    assert router.resolve("no such page") == HOME_PAGE
+
+
+def test_reset_password_is_routable_but_not_in_sidebar():
+    router = Router(build_page_registry())
+    assert RESET_PASSWORD_PAGE in router.registry
+    assert RESET_PASSWORD_PAGE not in router.pages
+
+
+def test_managers_are_shared():
+    """Managers are process-wide singletons."""
+    builder = get_resume_builder()
+    assert get_resume_builder() is builder
+    assert "utils.resume_builder" in sys.modules
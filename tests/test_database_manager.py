@@ -0,0 +1,69 @@
+import threading
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from utils.database import DatabaseManager
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    """Provides a DatabaseManager backed by a temporary SQLite file."""
+    manager = DatabaseManager(db_path=str(tmp_path / "resume_data.db"))
+    yield manager
+    manager.close()
+
+
+def test_user_resumes_use_index(db_manager):
+    """Per-user lookups are served by the user_id index."""
+    db_manager.save_resume("alice", "Data Scientist", "resume A")
+    db_manager.save_resume("bob", "Backend Developer", "resume B")
+
+    resumes = db_manager.get_user_resumes("alice")
+    assert [r.job_role for r in resumes] == ["Data Scientist"]
+
+    with db_manager.engine.connect() as conn:
+        plan = conn.execute(text("EXPLAIN QUERY PLAN SELECT * FROM resumes WHERE user_id = 'alice'")).fetchall()
+    assert "ix_resumes_user_id" in plan[0][-1]
+
+
+def test_indexes_added_to_existing_database(tmp_path):
+    """Databases created before the indexes existed get them on startup."""
+    db_path = tmp_path / "legacy.db"
+    engine = create_engine(f"sqlite:///{db_path}")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE resumes (id INTEGER PRIMARY KEY, user_id VARCHAR(100), job_role VARCHAR(100), "
+                          "content TEXT, created_at DATETIME, updated_at DATETIME)"))
+        conn.execute(text("CREATE TABLE analyses (id INTEGER PRIMARY KEY, resume_id INTEGER, "
+                          "analysis_data TEXT, created_at DATETIME)"))
+    engine.dispose()
+
+    manager = DatabaseManager(db_path=str(db_path))
+    with manager.engine.connect() as conn:
+        names = {row[0] for row in conn.execute(text("SELECT name FROM sqlite_master WHERE type = 'index'"))}
+    manager.close()
+    assert {"ix_resumes_user_id", "ix_analyses_resume_id"} <= names
+
+
+def test_shared_across_threads(db_manager):
+    """One manager can be used from several threads, and results stay readable after the session closes."""
+    errors = []
+
+    def work(i):
+        try:
+            resume_id = db_manager.save_resume(f"user{i % 3}", "Role", f"content {i}")
+            db_manager.save_analysis(resume_id, '{"score": 1}')
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=work, args=(i,)) for i in range(12)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    resumes = db_manager.get_user_resumes("user0")
+    assert len(resumes) == 4
+    assert len(db_manager.get_resume_analyses(resumes[0].id)) == 1
+    assert db_manager.get_resume(resumes[0].id).content.startswith("content")
@@ -0,0 +1,95 @@
+import threading
+
+import pandas as pd
+import pytest
+
+from utils.excel_manager import ExcelManager
+
+
+@pytest.fixture
+def excel_manager(tmp_path):
+    """Provides an ExcelManager writing to a temporary directory."""
+    return ExcelManager(
+        store_file=str(tmp_path / "resume_data.jsonl"),
+        excel_file=str(tmp_path / "resume_data.xlsx")
+    )
+
+
+def test_save_appends_records(excel_manager):
+    """Each save appends one record; per-user reads only return that user's rows."""
+    assert excel_manager.save_resume_data("alice", "Data Scientist", "resume A", {"ats_score": 80})
+    assert excel_manager.save_resume_data("bob", "Backend Developer", "resume B")
+    assert excel_manager.save_resume_data("alice", "ML Engineer", "resume C")
+
+    assert len(excel_manager.get_all_resumes()) == 3
+    alice = excel_manager.get_user_resumes("alice")
+    assert list(alice["job_role"]) == ["Data Scientist", "ML Engineer"]
+    assert alice.iloc[0]["analysis_data"] == {"ats_score": 80}
+
+
+def test_concurrent_writers(excel_manager):
+    """Saves from many threads are all kept intact."""
+    threads = [
+        threading.Thread(target=excel_manager.save_resume_data, args=(f"user{i % 4}", "Role", "x" * 1000))
+        for i in range(40)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    df = excel_manager.get_all_resumes()
+    assert len(df) == 40
+    assert (df["content"] == "x" * 1000).all()
+
+
+def test_partial_trailing_line_is_ignored(excel_manager):
+    """A line still being written by another process is not read."""
+    excel_manager.save_resume_data("alice", "Role", "complete")
+    with open(excel_manager.store_file, "a") as f:
+        f.write('{"user_id": "bob", "job_ro')
+
+    assert list(excel_manager.get_all_resumes()["user_id"]) == ["alice"]
+
+
+def test_legacy_workbook_import_and_export(tmp_path):
+    """An existing workbook is imported once, and Excel export round-trips."""
+    pytest.importorskip("openpyxl")
+    legacy = tmp_path / "resume_data.xlsx"
+    pd.DataFrame([{"user_id": "old", "job_role": "Analyst", "content": "legacy"}]).to_excel(legacy, index=False)
+
+    manager = ExcelManager(store_file=str(tmp_path / "resume_data.jsonl"), excel_file=str(legacy))
+    manager.save_resume_data("new", "Engineer", "fresh")
+
+    export_path = manager.export_to_excel(str(tmp_path / "export.xlsx"))
+    exported = pd.read_excel(export_path)
+    assert list(exported["user_id"]) == ["old", "new"]
+
+
+def test_user_index_picks_up_new_records(excel_manager):
+    """The per-user index follows appends made after it was built."""
+    excel_manager.save_resume_data("alice", "Role 1", "a")
+    assert len(excel_manager.get_user_resumes("alice")) == 1
+
+    other_writer = ExcelManager(store_file=excel_manager.store_file, excel_file=excel_manager.excel_file)
+    other_writer.save_resume_data("alice", "Role 2", "b")
+    other_writer.save_resume_data("bob", "Role 3", "c")
+
+    assert list(excel_manager.get_user_resumes("alice")["job_role"]) == ["Role 1", "Role 2"]
+    assert list(excel_manager.get_user_resumes("bob")["content"]) == ["c"]
+    assert excel_manager.get_user_resumes("nobody").empty
+
+
+def test_append_after_crashed_writer(excel_manager):
+    """A line left broken by a crashed writer is skipped and does not swallow the next save."""
+    excel_manager.save_resume_data("alice", "Data Scientist", "resume A")
+    assert list(excel_manager.get_user_resumes("alice")["job_role"]) == ["Data Scientist"]
+    with open(excel_manager.store_file, "a", encoding="utf-8") as f:
+        f.write('{"user_id": "bob", "job_ro')
+
+    excel_manager.save_resume_data("alice", "ML Engineer", "resume B")
+    excel_manager.save_resume_data("bob", "Backend Developer", "resume C")
+
+    assert list(excel_manager.get_all_resumes()["content"]) == ["resume A", "resume B", "resume C"]
+    assert list(excel_manager.get_user_resumes("alice")["job_role"]) == ["Data Scientist", "ML Engineer"]
+    assert list(excel_manager.get_user_resumes("bob")["content"]) == ["resume C"]
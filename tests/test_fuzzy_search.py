@@ -0,0 +1,69 @@
+import pytest
+
+from jobs.fuzzy_search import FuzzyIndex, bounded_edit_distance
+from jobs.job_search import (
+    JOB_FUZZY_INDEX, LOCATION_FUZZY_INDEX, JOB_INDEX, match_suggestions, search_companies
+)
+
+
+def texts(results):
+    return [s["text"] for s in results]
+
+
+@pytest.mark.parametrize("a, b, limit, expected", [
+    ("devlopr", "developer", 2, 2),
+    ("kitten", "sitting", 3, 3),
+    ("same", "same", 1, 0),
+    ("short", "much longer word", 2, 3),
+])
+def test_bounded_edit_distance(a, b, limit, expected):
+    """Distances above the limit are reported as limit + 1."""
+    assert bounded_edit_distance(a, b, limit) == expected
+
+
+def test_typos_in_job_titles():
+    """Misspelled words still find the intended titles."""
+    assert all("Developer" in text for text in texts(JOB_FUZZY_INDEX.search("devlopr")))
+    assert texts(JOB_FUZZY_INDEX.search("pyhton dev"))[0] == "Python Developer"
+    assert texts(JOB_FUZZY_INDEX.search("data sciencist"))[0] == "Data Scientist"
+
+
+def test_location_aliases_and_typos():
+    """Aliases map alternate names, and close spellings rank the exact city first."""
+    assert texts(LOCATION_FUZZY_INDEX.search("Bengaluru")) == ["Bangalore"]
+    assert texts(LOCATION_FUZZY_INDEX.search("bangalor"))[0] == "Bangalore"
+    assert texts(LOCATION_FUZZY_INDEX.search("mumbay")) == ["Mumbai"]
+
+
+def test_company_search():
+    """Companies are found by misspelled names and aliases."""
+    assert search_companies("infosis")[0]["name"] == "Infosys"
+    assert search_companies("meta")[0]["name"] == "Facebook"
+
+
+def test_unrelated_query_matches_nothing():
+    """Queries sharing no similar words return no results."""
+    assert JOB_FUZZY_INDEX.search("zzzz qqqq") == []
+    assert FuzzyIndex([{"text": "Data Analyst"}], aliases={}).search("") == []
+
+
+def test_match_suggestions_prefers_substring_matches():
+    """Fuzzy matching is only used when autocomplete finds nothing."""
+    assert match_suggestions("data sci", JOB_INDEX, JOB_FUZZY_INDEX) == ["Data Scientist"]
+    assert "Data Scientist" in match_suggestions("data sciencist", JOB_INDEX, JOB_FUZZY_INDEX)
+
+
+def test_alias_does_not_hide_catalogue_words():
+    """"ai" is a vocabulary word, so it is not rewritten to "artificial intelligence"."""
+    assert texts(JOB_FUZZY_INDEX.search("ai")) == ["AI Researcher"]
+    assert texts(JOB_FUZZY_INDEX.search("ai reseacher")) == ["AI Researcher"]
+    assert texts(JOB_FUZZY_INDEX.search("ml engg"))[0] == "Machine Learning Engineer"
+
+
+def test_alias_phrases_inside_queries():
+    """Multi-word aliases apply anywhere in the query, not only to the whole query."""
+    assert texts(JOB_FUZZY_INDEX.search("front end devloper")) == ["Frontend Developer"]
+    assert texts(JOB_FUZZY_INDEX.search("back end dev")) == ["Backend Developer"]
+    assert texts(LOCATION_FUZZY_INDEX.search("new delhi ncr")) == ["Delhi"]
+    index = FuzzyIndex([{"text": "Frontend Developer"}], aliases={"front end": "frontend"})
+    assert texts(index.search("front end developer")) == ["Frontend Developer"]
@@ -0,0 +1,151 @@
+import os
+
+import pytest
+
+from jobs.ingestion import (
+    FixtureAdapter, HTTPPortalAdapter, IngestionPipeline, ListingStore,
+    PortalAdapter, RateLimiter, listing_key, normalize_listing
+)
+from utils import sqlite_manager
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """Provides a ListingStore backed by a temporary database."""
+    monkeypatch.setattr(sqlite_manager, "_managers", {})
+    store = ListingStore(db_path=str(tmp_path / "listings.db"))
+    yield store
+    store.db.close()
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self.payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.payload
+
+
+class FakeSession:
+    def __init__(self, payload):
+        self.payload = payload
+        self.calls = []
+
+    def get(self, url, params=None, timeout=None):
+        self.calls.append((url, params))
+        return FakeResponse(self.payload)
+
+
+def test_listing_key_ignores_case_and_spacing():
+    """Reposts of the same role at the same company share a dedup key."""
+    assert listing_key("Python  Developer", "INFOSYS") == listing_key("python developer", "Infosys")
+    assert listing_key("Python Developer", "Infosys") != listing_key("Python Developer", "TCS")
+
+
+def test_normalize_listing():
+    """Raw records are mapped onto the listing fields."""
+    listing = normalize_listing({
+        "title": " Frontend  Developer ", "company": "Zoho", "skills": "React, CSS",
+        "salary_min": "3", "job_type": "Full-Time"
+    }, "feed")
+    assert listing["title"] == "Frontend Developer"
+    assert listing["skills"] == ["React", "CSS"]
+    assert listing["salary_min"] == 3.0
+    assert listing["salary_max"] is None
+    assert listing["job_type"] == "full-time"
+    assert listing["source"] == "feed"
+    assert normalize_listing({"title": "", "company": "Zoho"}, "feed") is None
+
+
+def test_fixture_adapter_filters_by_query_and_location():
+    """Fixture replay behaves like a portal search."""
+    adapter = FixtureAdapter(os.path.join(FIXTURES, "job_listings.jsonl"))
+    assert adapter.name == "job_listings"
+    titles = [r["title"] for r in adapter.fetch("python", "bangalore")]
+    assert titles == ["Python Developer", "python  developer", "Data Scientist"]
+    assert [r["company"] for r in adapter.fetch("", "pune")] == ["TCS"]
+
+
+def test_pipeline_deduplicates_within_run_and_across_runs(store):
+    """Duplicates are dropped within a run and existing listings are not reinserted."""
+    adapters = [
+        FixtureAdapter(os.path.join(FIXTURES, "job_listings.jsonl")),
+        FixtureAdapter(os.path.join(FIXTURES, "job_listings.json"), name="feed")
+    ]
+    pipeline = IngestionPipeline(adapters, store, max_workers=4)
+
+    report = pipeline.run(["developer", "engineer", "scientist"])
+    assert report.errors == {}
+    assert report.rejected == 0
+    assert report.stored == 5
+    assert report.fetched == report.stored + report.duplicates
+    assert sorted(l["title"] for l in store.get_listings()) == [
+        "Backend Developer", "Data Scientist", "DevOps Engineer",
+        "Frontend Developer", "Python Developer"
+    ]
+
+    again = pipeline.run(["developer"])
+    assert again.stored == 0
+    assert store.count() == 5
+
+
+def test_pipeline_isolates_adapter_errors(store):
+    """A failing adapter is reported without losing the other results."""
+    class BrokenAdapter(FixtureAdapter):
+        def fetch(self, query, location=""):
+            raise ConnectionError("portal unavailable")
+
+    adapters = [
+        BrokenAdapter(os.path.join(FIXTURES, "job_listings.json"), name="broken"),
+        FixtureAdapter(os.path.join(FIXTURES, "job_listings.json"))
+    ]
+    report = IngestionPipeline(adapters, store).run(["python"])
+    assert report.errors == {"broken:python": "portal unavailable"}
+    assert report.stored == 2
+
+
+def test_http_adapter_uses_shared_session(store):
+    """HTTP adapters build request params and parse the JSON payload."""
+    session = FakeSession({"results": [{"title": "SRE", "company": "Razorpay", "location": "Bangalore"}]})
+    adapter = HTTPPortalAdapter(
+        "api", "https://jobs.example.com/search",
+        build_params=lambda q, l: {"q": q, "where": l},
+        parse=lambda payload: payload["results"],
+        session=session
+    )
+    assert adapter.host == "jobs.example.com"
+
+    limiter = RateLimiter(default_rate=0)
+    report = IngestionPipeline([adapter], store, rate_limiter=limiter).run(["sre", "sre"], "Bangalore")
+    assert session.calls == [("https://jobs.example.com/search", {"q": "sre", "where": "Bangalore"})]
+    assert report.stored == 1
+    assert store.get_listings()[0]["source"] == "api"
+
+
+def test_rate_limiter_spaces_requests_per_host():
+    """Requests to one host are spaced by 1/rate; other hosts are unaffected."""
+    now = [0.0]
+    sleeps = []
+    limiter = RateLimiter(default_rate=2, rates={"slow.example.com": 0.5},
+                          clock=lambda: now[0], sleep=sleeps.append)
+
+    for _ in range(3):
+        limiter.wait("fast.example.com")
+    limiter.wait("slow.example.com")
+    limiter.wait("slow.example.com")
+    limiter.wait("")
+
+    assert sleeps == [0.5, 1.0, 2.0]
+
+
+def test_adapter_without_fetch_cannot_be_created():
+    class Incomplete(PortalAdapter):
+        name = "incomplete"
+
+    with pytest.raises(TypeError):
+        Incomplete()
@@ -0,0 +1,88 @@
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from jobs.job_portals import JobPortal, format_experience, register_portal, _PORTALS, _cached_search
+
+
+@pytest.fixture
+def portal():
+    """Provides a JobPortal instance."""
+    return JobPortal()
+
+
+def urls_by_portal(results):
+    return {result["portal"]: result["url"] for result in results}
+
+
+@pytest.mark.parametrize("experience, expected", [
+    ({"id": "all", "text": "All Levels"}, ("", "0", "0", "entry")),
+    ({"id": "1-3", "text": "1-3 years"}, ("1", "1", "3", "experienced")),
+    ("0-1", ("0", "0", "1", "entry")),
+    ("10+", ("5", "10", "15", "experienced")),
+    (None, ("", "0", "0", "entry")),
+])
+def test_format_experience(experience, expected):
+    """Dict entries and plain ids both map to portal experience values."""
+    assert format_experience(experience) == expected
+
+
+def test_experience_filter_reaches_urls(portal):
+    """The selected experience level is included in the generated links."""
+    urls = urls_by_portal(portal.search_jobs("Data Scientist", "Pune", {"id": "3-5", "text": "3-5 years"}))
+
+    assert parse_qs(urlparse(urls["LinkedIn"]).query)["f_E"] == ["3"]
+    assert parse_qs(urlparse(urls["Indeed"]).query)["explvl"] == ["mid_level"]
+    assert parse_qs(urlparse(urls["Naukri"]).query)["experience"] == ["3"]
+    assert parse_qs(urlparse(urls["Foundit"]).query)["experienceRanges"] == ["3~5"]
+
+
+def test_urls_are_encoded(portal):
+    """Special characters in queries and locations are URL-encoded."""
+    urls = urls_by_portal(portal.search_jobs("C++ & C# Developer", "New Delhi"))
+
+    assert parse_qs(urlparse(urls["LinkedIn"]).query) == {
+        "keywords": ["C++ & C# Developer"], "location": ["New Delhi"]
+    }
+    assert urls["Naukri"] == "https://www.naukri.com/c%2B%2B-c%23-developer-jobs-in-new-delhi"
+    assert urls["Instahyre"] == "https://www.instahyre.com/c%2B%2B-c%23-jobs-in-new-delhi"
+
+
+def test_results_are_cached_copies(portal):
+    """Repeated searches reuse the memoized links without sharing mutable results."""
+    first = portal.search_jobs("Python Developer")
+    first[0]["url"] = "tampered"
+    second = portal.search_jobs("  Python   Developer ")
+
+    assert second[0]["url"].startswith("https://www.linkedin.com/")
+    assert len(second) == len(_PORTALS)
+    assert second[0]["title"] == "Search Python Developer jobs"
+
+
+def test_batch_search(portal):
+    """Batch search returns one result list per distinct query."""
+    results = portal.search_jobs_batch(["Data Analyst", "ML Engineer", "Data Analyst", " "], "Remote")
+
+    assert list(results) == ["Data Analyst", "ML Engineer"]
+    assert all(len(links) == len(_PORTALS) for links in results.values())
+
+
+def test_portal_list_keeps_url(portal):
+    """Each listed portal has the keys callers of the old list used, and no builder."""
+    portals = portal.get_portal_list()
+    assert [p["name"] for p in portals] == [p["name"] for p in _PORTALS]
+    assert all(set(p) == {"name", "icon", "color", "url"} for p in portals)
+    assert portals[0]["url"] == "https://www.linkedin.com/jobs/search/?keywords={}&location={}&f_E={}"
+
+
+def test_register_portal(portal, monkeypatch):
+    """Newly registered portals appear in subsequent searches."""
+    monkeypatch.setattr("jobs.job_portals._PORTALS", list(_PORTALS))
+    try:
+        register_portal("Example", "fas fa-star", "#000000", lambda p: f"https://jobs.example.com/?q={p.query}")
+
+        urls = urls_by_portal(JobPortal().search_jobs("Tester"))
+        assert urls["Example"] == "https://jobs.example.com/?q=Tester"
+    finally:
+        # Drop memoized results that include the temporary portal
+        _cached_search.cache_clear()
@@ -0,0 +1,110 @@
+import time
+
+import pytest
+
+import services.latex_generator as latex_generator
+from config.database import save_resume_data_batch
+from services.container import generate_resume_job
+from services.job_queue import FAILED, QUEUED, RUNNING, SUCCEEDED, JobQueue
+from services.write_behind import WriteBehindQueue
+
+
+@pytest.fixture
+def job_queue(tmp_path):
+    queue = JobQueue(db_path=str(tmp_path / "jobs.db"), poll_interval=0.05)
+    queue.register("echo", lambda payload: {"echo": payload["text"]})
+    yield queue
+    queue.stop()
+
+
+def test_submit_and_run(job_queue):
+    """Jobs are persisted as queued and store their result once run."""
+    job_id = job_queue.submit("echo", {"text": "hello"})
+    assert job_queue.get(job_id)["status"] == QUEUED
+
+    assert job_queue.run_next() is True
+    job = job_queue.get(job_id)
+    assert job["status"] == SUCCEEDED
+    assert job["result"] == {"echo": "hello"}
+    assert job["attempts"] == 1
+    assert job_queue.run_next() is False
+
+
+def test_failed_job_keeps_error(job_queue):
+    def fail(payload):
+        raise RuntimeError("Groq is down")
+
+    job_queue.register("fail", fail)
+    job_id = job_queue.submit("fail", {})
+    job_queue.run_next()
+    job = job_queue.get(job_id)
+    assert job["status"] == FAILED
+    assert job["error"] == "Groq is down"
+    assert job["result"] is None
+
+
+def test_unknown_kind_and_missing_job(job_queue):
+    with pytest.raises(ValueError):
+        job_queue.submit("nope", {})
+    assert job_queue.get("missing") is None
+
+
+def test_background_workers(job_queue):
+    """Started workers pick up jobs without the caller running them."""
+    job_queue.start()
+    job_ids = [job_queue.submit("echo", {"text": str(i)}) for i in range(5)]
+    deadline = time.time() + 5
+    while time.time() < deadline and job_queue.counts().get(SUCCEEDED, 0) < 5:
+        time.sleep(0.02)
+    assert [job_queue.get(job_id)["result"]["echo"] for job_id in job_ids] == ["0", "1", "2", "3", "4"]
+
+
+def test_stale_jobs_are_requeued_then_failed(job_queue):
+    """Jobs orphaned mid-run are retried until they run out of attempts."""
+    job_queue.stale_after = 0
+    job_id = job_queue.submit("echo", {"text": "retry"})
+    job_queue._claim()
+    assert job_queue.get(job_id)["status"] == RUNNING
+
+    assert job_queue.requeue_stale() == 1
+    assert job_queue.get(job_id)["status"] == QUEUED
+
+    job_queue._claim()
+    assert job_queue.requeue_stale() == 0
+    job = job_queue.get(job_id)
+    assert job["status"] == FAILED
+    assert job["attempts"] == 2
+
+
+def test_prune_removes_old_finished_jobs(job_queue):
+    job_queue.retention_days = 0
+    job_queue.submit("echo", {"text": "old"})
+    queued = job_queue.submit("echo", {"text": "waiting"})
+    job_queue.run_next()
+    assert job_queue.prune() == 1
+    assert job_queue.counts() == {QUEUED: 1}
+    assert job_queue.get(queued) is not None
+
+
+@pytest.fixture
+def resume_writer(tmp_path):
+    """A resume writer whose outbox and dead letters live in tmp_path"""
+    writer = WriteBehindQueue(save_resume_data_batch, name="resume_writes", db_path=str(tmp_path / "outbox.db"),
+                              dead_letter_path=str(tmp_path / "dead.jsonl"), flush_interval=0.05)
+    yield writer
+    writer.flush(timeout=5)
+    writer.stop()
+
+
+def test_generate_resume_job(sqlite_db, resume_writer, monkeypatch):
+    """The handler returns the LaTeX and queues the resume for saving."""
+    monkeypatch.setattr(latex_generator, "generate_latex_resume",
+                        lambda data, template, role: f"% {template} {role}")
+    resume_data = {"personal_info": {"full_name": "Ada Lovelace", "email": "ada@example.com"}}
+    payload = {"resume_data": resume_data, "template": "Modern", "job_role": "Engineer"}
+    result = generate_resume_job(payload, writer=resume_writer)
+    assert result == {"latex": "% Modern Engineer"}
+    assert resume_writer.flush(timeout=5)
+
+    with sqlite_db.connect() as conn:
+        assert conn.exec_driver_sql("SELECT name FROM resume_data").fetchall() == [("Ada Lovelace",)]
@@ -0,0 +1,83 @@
+import json
+import logging
+
+import pytest
+
+from utils.logger import setup_logger, shutdown_logging
+
+
+@pytest.fixture
+def log_dir(tmp_path, monkeypatch):
+    """Points logging at a temporary directory and restarts the writer around the test."""
+    shutdown_logging()
+    monkeypatch.setenv("LOG_DIR", str(tmp_path))
+    monkeypatch.setenv("LOG_CONSOLE", "0")
+    yield tmp_path
+    shutdown_logging()
+    monkeypatch.undo()
+    setup_logger("tests.logger")
+
+
+def test_records_are_written_by_background_listener(log_dir):
+    """Text records reach the file once the queue is flushed."""
+    logger = setup_logger("tests.logger.text")
+    logger.info("Saved resume %s", 42)
+    shutdown_logging()
+
+    content = (log_dir / "app.log").read_text()
+    assert "tests.logger.text - INFO - Saved resume 42" in content
+
+
+def test_json_format_includes_extra_fields(log_dir, monkeypatch):
+    monkeypatch.setenv("LOG_FORMAT", "json")
+    logger = setup_logger("tests.logger.json")
+    logger.warning("Slow query %s", "weekly_trends", extra={"duration_ms": 120})
+    shutdown_logging()
+
+    entry = json.loads((log_dir / "app.log").read_text().splitlines()[-1])
+    assert entry["message"] == "Slow query weekly_trends"
+    assert entry["level"] == "WARNING"
+    assert entry["logger"] == "tests.logger.json"
+    assert entry["duration_ms"] == 120
+
+
+def test_size_rotation(log_dir, monkeypatch):
+    """Files rotate at LOG_MAX_BYTES and keep LOG_BACKUP_COUNT backups."""
+    monkeypatch.setenv("LOG_MAX_BYTES", "500")
+    monkeypatch.setenv("LOG_BACKUP_COUNT", "2")
+    logger = setup_logger("tests.logger.rotation")
+    for i in range(100):
+        logger.info("line %s %s", i, "x" * 40)
+    shutdown_logging()
+
+    files = sorted(p.name for p in log_dir.iterdir())
+    assert files == ["app.log", "app.log.1", "app.log.2"]
+
+
+def test_messages_below_level_are_not_formatted(log_dir):
+    """Arguments of disabled debug calls are never converted to strings."""
+    class Expensive:
+        formatted = 0
+
+        def __str__(self):
+            Expensive.formatted += 1
+            return "expensive"
+
+    logger = setup_logger("tests.logger.lazy")
+    assert not logger.isEnabledFor(logging.DEBUG)
+    logger.debug("Form data: %s", Expensive())
+    shutdown_logging()
+    assert Expensive.formatted == 0
+
+
+def test_handler_added_once(log_dir):
+    logger = setup_logger("tests.logger.once")
+    setup_logger("tests.logger.once")
+    assert len(logger.handlers) == 1
+
+
+def test_invalid_level_falls_back_to_info(log_dir, monkeypatch):
+    monkeypatch.setenv("LOG_LEVEL", "verbose")
+    assert setup_logger("tests.logger.badlevel").level == logging.INFO
+    monkeypatch.setenv("LOG_LEVEL", " debug ")
+    assert setup_logger("tests.logger.debuglevel").level == logging.DEBUG
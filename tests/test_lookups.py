@@ -0,0 +1,45 @@
+import pytest
+
+from config.courses import COURSES_BY_CATEGORY, get_category_for_role, get_courses_for_role
+from jobs.companies import (
+    FEATURED_COMPANIES, get_companies_by_industry, get_company_info, get_featured_companies
+)
+
+
+def test_company_lookups():
+    """Companies are found by name, industry and category."""
+    assert get_company_info("Infosys")["careers_url"] == "https://www.infosys.com/careers"
+    assert get_company_info("Unknown Corp") is None
+    assert [c["name"] for c in get_companies_by_industry("Technology & Consulting")] == ["IBM"]
+    assert get_companies_by_industry("Agriculture") == ()
+    assert get_featured_companies("tech") is FEATURED_COMPANIES["tech"]
+
+
+def test_all_companies_are_flattened_once():
+    """The flattened list covers every category and is shared between calls."""
+    companies = get_featured_companies()
+    assert len(companies) == sum(len(c) for c in FEATURED_COMPANIES.values())
+    assert get_featured_companies() is companies
+    assert get_featured_companies("unknown") is companies
+
+
+def test_course_lookups():
+    """Every role maps to its courses and category."""
+    for category, roles in COURSES_BY_CATEGORY.items():
+        for role, courses in roles.items():
+            assert get_courses_for_role(role) is courses
+            assert get_category_for_role(role) == category
+    assert get_courses_for_role("Astronaut") is None
+    assert get_category_for_role("Astronaut") is None
+
+
+def test_lookups_are_read_only():
+    """Callers cannot change the shared catalogue through a lookup result."""
+    with pytest.raises(TypeError):
+        get_company_info("Infosys")["name"] = "Changed"
+    with pytest.raises(AttributeError):
+        get_featured_companies().append({"name": "New"})
+    with pytest.raises(AttributeError):
+        get_courses_for_role("Frontend Developer").append(["Course", "https://example.com"])
+    with pytest.raises(TypeError):
+        get_courses_for_role("Frontend Developer")[0][0] = "Changed"
@@ -0,0 +1,98 @@
+import random
+import time
+
+from jobs.matching import (
+    ListingIndex, canonical_term, decode_postings, encode_postings,
+    get_role_skills, parse_range
+)
+
+LISTINGS = [
+    {"title": "Python Developer", "company": "Infosys", "location": "Bangalore",
+     "skills": ["Python", "Django", "SQL"], "experience_min": 1, "experience_max": 3,
+     "salary_min": 4, "salary_max": 7, "job_type": "full-time"},
+    {"title": "Data Scientist", "company": "Flipkart", "location": "Bangalore",
+     "skills": ["Python", "Machine Learning", "Statistics"], "experience_min": 3, "experience_max": 5,
+     "salary_min": 12, "salary_max": 18, "job_type": "full-time"},
+    {"title": "Frontend Developer", "company": "Zoho", "location": "Chennai",
+     "skills": ["React", "JavaScript", "CSS"], "experience_min": 0, "experience_max": 2,
+     "salary_min": 3, "salary_max": 5, "job_type": "full-time"},
+    {"title": "Full Stack Developer", "company": "Freshworks", "location": "Remote",
+     "skills": ["React", "Node.js", "Python", "SQL"], "job_type": "contract"},
+    {"title": "DevOps Engineer", "company": "TCS", "location": "Pune",
+     "skills": ["AWS", "Docker", "Kubernetes"], "experience_min": 5, "experience_max": 8,
+     "salary_min": 15, "salary_max": 22, "job_type": "full-time"},
+]
+
+
+def titles(results):
+    return [listing["title"] for listing, _ in results]
+
+
+def test_postings_round_trip():
+    """Delta/varint encoding preserves (doc id, frequency) pairs."""
+    postings = [(0, 2), (3, 1), (130, 3), (20000, 2), (20001, 300)]
+    data = encode_postings(postings)
+    assert list(decode_postings(data)) == postings
+    assert len(data) < len(postings) * 8
+
+
+def test_canonical_terms_and_ranges():
+    assert canonical_term("Node.js") == canonical_term("node") == "node"
+    assert canonical_term("ML") == "machine learning"
+    assert parse_range("all") is None
+    assert parse_range("3-5") == (3.0, 5.0)
+    assert parse_range("10+")[0] == 10.0
+    assert parse_range("fresher") == (0.0, 1.0)
+    assert parse_range("senior") is None
+    fresher = titles(ListingIndex(LISTINGS).search(["python"], experience="fresher"))
+    assert "Python Developer" in fresher and "Data Scientist" not in fresher
+
+
+def test_ranks_by_skill_overlap():
+    """Listings sharing more (and rarer) skills rank first."""
+    index = ListingIndex(LISTINGS)
+    results = index.search(["python", "django", "sql"])
+    assert titles(results)[:2] == ["Python Developer", "Full Stack Developer"]
+    assert "DevOps Engineer" not in titles(results)
+    assert all(score > 0 for _, score in results)
+
+
+def test_filters_use_filter_option_ids():
+    """Location, experience, salary and job type filters narrow the results."""
+    index = ListingIndex(LISTINGS)
+    skills = ["python", "react", "sql"]
+    assert titles(index.search(skills, location="Bengaluru")) == ["Python Developer", "Data Scientist"]
+    assert "Data Scientist" not in titles(index.search(skills, experience="0-1"))
+    # Listings without a salary are kept
+    assert set(titles(index.search(skills, salary="10-15"))) == {"Data Scientist", "Full Stack Developer"}
+    assert titles(index.search(skills, job_type="remote")) == ["Full Stack Developer"]
+    assert titles(index.search(skills, job_type="contract")) == ["Full Stack Developer"]
+
+
+def test_match_resume_and_role_skills():
+    """Parsed resumes and JOB_ROLES roles can be matched directly."""
+    index = ListingIndex(LISTINGS)
+    parsed = {"skills": ["react", "javascript", "css"], "raw_text": ""}
+    assert titles(index.match_resume(parsed, top_k=1)) == ["Frontend Developer"]
+    assert "React" in get_role_skills("Frontend Developer")
+    assert get_role_skills("Astronaut") == []
+
+
+def test_top_k_is_fast_on_large_catalogues():
+    """Ranking tens of thousands of listings stays in the millisecond range."""
+    rng = random.Random(7)
+    vocabulary = [f"skill{i}" for i in range(400)] + ["python", "sql", "react"]
+    listings = [
+        {"title": f"Engineer {i}", "company": f"Company {i}", "location": rng.choice(["Pune", "Delhi"]),
+         "skills": rng.sample(vocabulary, 6)}
+        for i in range(30000)
+    ]
+    index = ListingIndex(listings)
+
+    start = time.perf_counter()
+    results = index.search(["python", "sql", "react", "skill1"], top_k=10, location="pune")
+    elapsed = time.perf_counter() - start
+
+    assert len(results) == 10
+    assert all(listing["location"] == "Pune" for listing, _ in results)
+    assert elapsed < 0.5
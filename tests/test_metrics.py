@@ -0,0 +1,94 @@
+import urllib.request
+
+import pytest
+
+from utils import metrics
+from utils.metrics import Histogram, MetricsRegistry, start_metrics_server
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry(buckets=(0.01, 0.1, 1.0))
+
+
+def test_histogram_buckets_and_quantiles():
+    histogram = Histogram(buckets=(0.01, 0.1, 1.0))
+    for seconds in (0.005, 0.05, 0.05, 0.5, 2.0):
+        histogram.observe(seconds)
+    assert histogram.counts == [1, 2, 1, 1]
+    assert histogram.count == 5
+    assert histogram.sum == pytest.approx(2.605)
+    assert 0.01 <= histogram.quantile(0.5) <= 0.1
+    assert histogram.quantile(1.0) == 2.0
+
+
+def test_decorator_and_context_manager(registry):
+    """Both forms record one observation per use; exceptions count as errors."""
+    @registry.timed("parse")
+    def parse(fail=False):
+        if fail:
+            raise ValueError("bad file")
+        return "text"
+
+    assert parse() == "text"
+    assert parse.__name__ == "parse"
+    with pytest.raises(ValueError):
+        parse(fail=True)
+
+    timer = registry.timed("save")
+    with timer:
+        with timer:
+            pass
+
+    rows = {row["operation"]: row for row in registry.snapshot()}
+    assert rows["parse"]["count"] == 2
+    assert rows["parse"]["errors"] == 1
+    assert rows["save"]["count"] == 2
+    assert rows["save"]["errors"] == 0
+
+
+def test_prometheus_text(registry):
+    registry.observe("db.save_resume_data", 0.05)
+    registry.observe("db.save_resume_data", 5.0, error=True)
+    text = registry.to_prometheus()
+
+    assert "# TYPE smart_resume_operation_duration_seconds histogram" in text
+    assert 'smart_resume_operation_duration_seconds_bucket{operation="db.save_resume_data",le="0.1"} 1' in text
+    assert 'smart_resume_operation_duration_seconds_bucket{operation="db.save_resume_data",le="+Inf"} 2' in text
+    assert 'smart_resume_operation_duration_seconds_count{operation="db.save_resume_data"} 2' in text
+    assert 'smart_resume_operation_errors_total{operation="db.save_resume_data"} 1' in text
+
+
+def calls(operation):
+    rows = {row["operation"]: row for row in metrics.get_metrics_snapshot()}
+    return rows.get(operation, {}).get("count", 0)
+
+
+def test_hot_paths_are_instrumented():
+    """Wired operations report into the process-wide registry."""
+    import io
+    from utils.resume_parser import ResumeParser
+
+    upload = io.BytesIO(b"plain text")
+    upload.name = "resume.txt"
+    before = calls("resume_parser.parse"), calls("resume_parser.extract_text")
+
+    assert ResumeParser().parse(upload)["raw_text"] == ""
+    assert (calls("resume_parser.parse"), calls("resume_parser.extract_text")) == (before[0] + 1, before[1] + 1)
+
+
+def test_metrics_server(monkeypatch):
+    monkeypatch.setattr(metrics, "_server", None)
+    monkeypatch.delenv("METRICS_PORT", raising=False)
+    assert start_metrics_server() is None
+
+    metrics.REGISTRY.observe("tests.metrics_server", 0.01)
+    server = start_metrics_server(port=0, host="127.0.0.1")
+    try:
+        assert start_metrics_server(port=0) is server
+        url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+        body = urllib.request.urlopen(url, timeout=5).read().decode()
+        assert 'operation="tests.metrics_server"' in body
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,63 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from views import registry
+from views.registry import PageRegistry, get_import_stats, lazy_callable
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def fake_view(tmp_path, monkeypatch):
+    """A throwaway view module on sys.path, removed from sys.modules afterwards."""
+    (tmp_path / "fake_view.py").write_text(
+        "CALLS = []\n"
+        "def render_fake(*args):\n"
+        "    CALLS.append(args)\n"
+        "    return 'rendered'\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(registry, "_import_log", [])
+    yield "fake_view"
+    sys.modules.pop("fake_view", None)
+
+
+def test_pages_are_imported_on_first_render(fake_view):
+    """Registering a page imports nothing; rendering imports it once."""
+    pages = PageRegistry()
+    pages.register("FAKE", fake_view, "render_fake", lambda: ("builder",))
+    renderers = pages.renderers()
+
+    assert fake_view not in sys.modules
+    assert pages.names() == ["FAKE"] and "FAKE" in pages
+
+    assert renderers["FAKE"]() == "rendered"
+    assert pages.render("FAKE") == "rendered"
+    assert sys.modules[fake_view].CALLS == [("builder",), ("builder",)]
+
+    stats = get_import_stats()
+    assert [s["module"] for s in stats] == [fake_view]
+    assert stats[0]["ms"] >= 0
+
+
+def test_lazy_callable_defers_import(fake_view):
+    render = lazy_callable(fake_view, "render_fake")
+    assert fake_view not in sys.modules
+    assert render(1, 2) == "rendered"
+    assert sys.modules[fake_view].CALLS == [(1, 2)]
+
+
+def test_app_import_skips_heavy_modules():
+    """Importing the app does not load view modules, the database or python-docx."""
+    code = (
+        "import sys, app\n"
+        "heavy = ['config.database', 'dashboard.dashboard', 'utils.resume_builder',\n"
+        "         'views.ats_optimizer', 'views.builder', 'docx']\n"
+        "print([m for m in heavy if m in sys.modules])\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().splitlines()[-1] == "[]"
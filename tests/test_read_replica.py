@@ -0,0 +1,112 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import config.database as database
+from config.database import ReplicaMonitor, get_all_resume_data, get_resume_stats, save_resume_data
+from config.models import Base, ResumeData
+from dashboard.dashboard import DashboardManager
+
+
+class LaggingMonitor(ReplicaMonitor):
+    """Monitor with a scripted lag and a manual clock."""
+
+    def __init__(self, engine, lag=0.0, **kwargs):
+        self.now = 0.0
+        self.checks = 0
+        self.scripted_lag = lag
+        super().__init__(engine, clock=lambda: self.now, **kwargs)
+
+    def measure_lag(self):
+        self.checks += 1
+        if isinstance(self.scripted_lag, Exception):
+            raise self.scripted_lag
+        return self.scripted_lag
+
+
+@pytest.fixture
+def replica(tmp_path, sqlite_db, monkeypatch):
+    """A second SQLite database standing in for the read replica, seeded with one resume."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+    Base.metadata.create_all(engine)
+    ReadSession = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    with ReadSession() as db:
+        db.add(ResumeData(name="On the replica", email="", phone=""))
+        db.commit()
+    monkeypatch.setattr(database, "ReadSessionLocal", ReadSession)
+    yield engine
+    engine.dispose()
+
+
+def names():
+    return [row["name"] for row in get_all_resume_data()]
+
+
+def test_reads_go_to_primary_without_replica(sqlite_db):
+    save_resume_data({"personal_info": {"full_name": "On the primary"}})
+    assert database.ReadSessionLocal is None
+    assert names() == ["On the primary"]
+
+
+def test_reads_use_replica_and_writes_use_primary(replica, monkeypatch):
+    monkeypatch.setattr(database, "replica_monitor", ReplicaMonitor(replica))
+    save_resume_data({"personal_info": {"full_name": "On the primary"}})
+
+    assert names() == ["On the replica"]
+    assert get_resume_stats()["total_resumes"] == 1
+    assert DashboardManager().get_resume_metrics()["total_resumes"] == 1
+    assert database.get_resume_id({"personal_info": {"full_name": "On the primary"}}) is not None
+
+
+def test_lagging_or_unreachable_replica_falls_back(replica, monkeypatch):
+    """Reads return to the primary while the replica is too far behind, until the next check."""
+    monitor = LaggingMonitor(replica, lag=120.0, max_lag=30, check_interval=10)
+    monkeypatch.setattr(database, "replica_monitor", monitor)
+    save_resume_data({"personal_info": {"full_name": "On the primary"}})
+
+    assert names() == ["On the primary"]
+    assert monitor.lag == 120.0
+
+    monitor.scripted_lag = 1.0
+    assert names() == ["On the primary"]
+    assert monitor.checks == 1
+
+    monitor.now = 11
+    assert names() == ["On the replica"]
+    assert monitor.checks == 2
+
+    monitor.scripted_lag = ConnectionError("replica down")
+    monitor.now = 22
+    assert names() == ["On the primary"]
+    assert monitor.lag is None
+
+
+def test_failed_replica_read_is_retried_on_primary(tmp_path, sqlite_db, monkeypatch):
+    """A replica that errors mid-read is skipped until the next lag check."""
+    broken = create_engine(f"sqlite:///{tmp_path / 'empty.db'}")
+    monkeypatch.setattr(database, "ReadSessionLocal", sessionmaker(bind=broken))
+    monitor = LaggingMonitor(broken, lag=0.0)
+    monkeypatch.setattr(database, "replica_monitor", monitor)
+    save_resume_data({"personal_info": {"full_name": "On the primary"}})
+
+    assert names() == ["On the primary"]
+    assert DashboardManager().get_resume_metrics()["total_resumes"] == 1
+    assert monitor.checks == 1
+    assert monitor.lag is None
+    assert not monitor.is_usable()
+    broken.dispose()
+
+
+def test_replica_engine_has_connect_timeout(monkeypatch):
+    calls = []
+    monkeypatch.setattr(database, "create_engine", lambda url, **kwargs: calls.append((url, kwargs)))
+    monkeypatch.setenv("DB_REPLICA_URL", "postgres://reader@replica/db")
+    database.get_read_engine.clear()
+    try:
+        database.get_read_engine()
+    finally:
+        database.get_read_engine.clear()
+
+    url, kwargs = calls[0]
+    assert url == "postgresql://reader@replica/db"
+    assert kwargs["connect_args"] == {"connect_timeout": database.REPLICA_CONNECT_TIMEOUT}
@@ -0,0 +1,53 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from config.database import (
+    get_db, get_user_email_by_token, purge_expired_reset_tokens, store_reset_token
+)
+from config.models import PasswordResetToken
+
+
+@pytest.fixture
+def expired_tokens(sqlite_db):
+    """Seeds 12 expired tokens and one valid token."""
+    with get_db() as db:
+        for i in range(12):
+            db.add(PasswordResetToken(
+                email=f"user{i}@example.com",
+                token=f"expired-{i}",
+                expires_at=datetime.now() - timedelta(hours=2, minutes=i)
+            ))
+        db.add(PasswordResetToken(
+            email="valid@example.com",
+            token="valid",
+            expires_at=datetime.now() + timedelta(hours=1)
+        ))
+        db.commit()
+
+
+def count_tokens():
+    with get_db() as db:
+        return db.query(PasswordResetToken).count()
+
+
+def test_purge_deletes_only_expired_tokens(expired_tokens):
+    """A full sweep removes every expired token and keeps valid ones."""
+    assert purge_expired_reset_tokens(batch_size=5) == 12
+    assert count_tokens() == 1
+    assert get_user_email_by_token("valid") == "valid@example.com"
+
+
+def test_purge_respects_batch_limit(expired_tokens):
+    """Bounded sweeps delete at most batch_size * max_batches tokens."""
+    assert purge_expired_reset_tokens(batch_size=5, max_batches=2) == 10
+    assert count_tokens() == 3
+
+
+def test_store_reset_token_sweeps_one_batch(expired_tokens):
+    """Storing a token amortizes one sweep batch of expired tokens."""
+    assert store_reset_token("new@example.com", "new-token")
+
+    assert count_tokens() == 2
+    assert get_user_email_by_token("new-token") == "new@example.com"
+    assert get_user_email_by_token("expired-0") is None
@@ -0,0 +1,120 @@
+import importlib.util
+from pathlib import Path
+
+from config.database import (
+    get_resume_document, get_resume_id, get_resumes_with_skills,
+    resume_fingerprint, save_resume_data, save_resume_data_batch
+)
+
+RESUME = {
+    "personal_info": {"full_name": "Ada Lovelace", "email": "ada@example.com"},
+    "summary": "Mathematician",
+    "experience": [{"company": "Analytical Engines", "position": "Programmer"}],
+    "skills": {"languages": ["Python", "SQL"]},
+    "template": "Modern",
+}
+
+
+def count(engine, table):
+    with engine.connect() as conn:
+        return conn.exec_driver_sql(f"SELECT COUNT(*) FROM {table}").scalar()
+
+
+def test_fingerprint_ignores_formatting_only_changes():
+    """Key order, whitespace, email case and empty fields do not change the fingerprint."""
+    reformatted = {
+        "template": "Modern",
+        "skills": {"languages": ["Python", " SQL"]},
+        "experience": [{"position": "Programmer", "company": "Analytical  Engines", "description": ""}],
+        "summary": "Mathematician\n",
+        "personal_info": {"email": "Ada@Example.com", "full_name": "Ada Lovelace", "phone": ""},
+        "certifications": [],
+    }
+    assert resume_fingerprint(reformatted) == resume_fingerprint(RESUME)
+    assert len(resume_fingerprint(RESUME)) == 64
+
+    assert resume_fingerprint({**RESUME, "template": "Minimal"}) != resume_fingerprint(RESUME)
+    assert resume_fingerprint({**RESUME, "skills": {"languages": ["SQL", "Python"]}}) != resume_fingerprint(RESUME)
+
+
+def test_resaving_returns_existing_row(sqlite_db):
+    resume_id = save_resume_data(RESUME)
+    assert save_resume_data(dict(RESUME, summary=" Mathematician ")) == resume_id
+    assert get_resume_id(RESUME) == resume_id
+    assert count(sqlite_db, "resume_data") == 1
+    assert count(sqlite_db, "experiences") == 1
+
+    assert save_resume_data({**RESUME, "summary": "Poet"}) != resume_id
+    assert count(sqlite_db, "resume_data") == 2
+
+
+def test_batch_deduplicates(sqlite_db):
+    """Duplicates inside the batch and of saved resumes map to one row each."""
+    saved_id = save_resume_data(RESUME)
+    other = {**RESUME, "summary": "Poet"}
+    ids = save_resume_data_batch([other, RESUME, other])
+    assert ids[1] == saved_id
+    assert ids[0] == ids[2] != saved_id
+    assert count(sqlite_db, "resume_data") == 2
+
+
+def test_existence_check_uses_unique_index(sqlite_db):
+    assert get_resume_id(RESUME) is None
+    with sqlite_db.connect() as conn:
+        plan = conn.exec_driver_sql(
+            "EXPLAIN QUERY PLAN SELECT id FROM resume_data WHERE fingerprint = 'x'"
+        ).fetchall()
+    assert "ix_resume_data_fingerprint" in plan[0][-1]
+
+
+def test_document_keeps_fields_without_columns(sqlite_db):
+    """The document holds the whole resume; child rows keep only their columns."""
+    resume = {
+        **RESUME,
+        "experience": [{"company": "Analytical Engines", "position": "Programmer",
+                        "location": "London", "responsibilities": ["Wrote the first program"]}],
+        "projects": [{"name": "Notes", "key_points": ["Bernoulli numbers"]}],
+        "certifications": [{"name": "Royal Society"}],
+    }
+    resume_id = save_resume_data(resume)
+    document = get_resume_document(resume_id)
+
+    assert document["experience"][0]["responsibilities"] == ["Wrote the first program"]
+    assert document["projects"][0]["key_points"] == ["Bernoulli numbers"]
+    assert document["certifications"] == [{"name": "Royal Society"}]
+    assert document["skill_tags"] == ["python", "sql"]
+    assert get_resume_document(resume_id + 1) is None
+    assert count(sqlite_db, "experiences") == 1
+
+
+def test_skill_containment(sqlite_db):
+    python_sql = save_resume_data(RESUME)
+    python_only = save_resume_data({**RESUME, "skills": {"languages": ["python"], "tools": ["Docker"]}})
+
+    def ids(skills):
+        return [row["id"] for row in get_resumes_with_skills(skills)]
+
+    assert ids(["Python"]) == [python_only, python_sql]
+    assert ids(["python", "SQL"]) == [python_sql]
+    assert ids(["docker", "python"]) == [python_only]
+    assert ids(["rust"]) == []
+    assert ids(["python"]) == [row["id"] for row in get_resumes_with_skills("python, ")]
+
+
+def test_migration_backfills_documents(sqlite_db):
+    """Rows saved before the document column get one built from their columns and child rows."""
+    spec = importlib.util.spec_from_file_location(
+        "add_resume_document", Path(__file__).parent.parent / "alembic" / "versions" / "e9a4c27b5d13_add_resume_document.py"
+    )
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+
+    resume_id = save_resume_data(RESUME)
+    with sqlite_db.begin() as conn:
+        conn.exec_driver_sql("UPDATE resume_data SET document = NULL, skills = ?", (str(["Python", "SQL"]),))
+        migration._backfill(conn)
+
+    document = get_resume_document(resume_id)
+    assert document["personal_info"] == {"full_name": "Ada Lovelace", "email": "ada@example.com"}
+    assert document["experience"] == [{"company": "Analytical Engines", "position": "Programmer"}]
+    assert document["skill_tags"] == ["python", "sql"]
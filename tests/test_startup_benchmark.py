@@ -0,0 +1,79 @@
+import sys
+
+import pytest
+
+from benchmarks import mock_streamlit
+from benchmarks.startup import flatten, import_targets, print_report, run_worker
+
+
+@pytest.fixture
+def st(monkeypatch):
+    """Installs the mock streamlit for one test."""
+    monkeypatch.setitem(sys.modules, "streamlit", sys.modules.get("streamlit"))
+    monkeypatch.setitem(sys.modules, "streamlit_lottie", sys.modules.get("streamlit_lottie"))
+    return mock_streamlit.install(secrets={"GROQ_API_KEY": "key"})
+
+
+def test_mock_widgets_return_defaults(st):
+    """Widgets behave like an untouched page."""
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        assert col1.button("Go") is False
+    assert st.text_input("Name") == ""
+    assert st.selectbox("Template", ["Modern", "Minimal"]) == "Modern"
+    assert st.multiselect("Skills", ["a", "b"]) == []
+    assert len(st.tabs(["One", "Two"])) == 2
+    with st.expander("More"), st.sidebar:
+        st.markdown("text")
+    assert st.calls == 2
+    st.session_state.page = "home"
+    assert st.session_state["page"] == "home"
+    assert st.secrets["GROQ_API_KEY"] == "key"
+    with pytest.raises(mock_streamlit.ScriptControl):
+        st.rerun()
+
+
+def test_mock_cache_resource(st):
+    calls = []
+
+    @st.cache_resource
+    def build():
+        calls.append(1)
+        return object()
+
+    assert build() is build()
+    build.clear()
+    build()
+    assert len(calls) == 2
+
+
+def test_import_targets_cover_app_views_and_utils():
+    targets = import_targets()
+    assert {"app", "config.database", "views.home", "utils.logger"} <= set(targets)
+
+
+def test_worker_reports_json(tmp_path):
+    """Workers run in a fresh interpreter and report machine-readable results."""
+    result = run_worker(str(tmp_path), "job_roles")
+    assert result["ms"] >= 0
+    assert result["roles"] > 0
+
+
+def test_compare_report(capsys):
+    """Reports flatten to comparable metrics, with changes against a baseline."""
+    report = {
+        "imports": {"app": {"ms": 50.0}, "views.home": {"error": "ImportError: boom"}},
+        "engine": {"create_ms": 2.0, "first_connect_ms": 1.0},
+        "job_roles": {"ms": 1.0},
+        "pages": {"HOME": {"import_ms": 1.0, "render_ms": 4.0, "status": "ok"}}
+    }
+    baseline = {"imports": {"app": {"ms": 100.0}}}
+    assert flatten(report) == {
+        "import app": 50.0, "engine create": 2.0, "engine first_connect": 1.0,
+        "job roles load": 1.0, "page HOME import": 1.0, "page HOME render": 4.0
+    }
+
+    print_report(report, baseline)
+    out = capsys.readouterr().out
+    assert "-50%" in out
+    assert "[views.home] ImportError: boom" in out
@@ -0,0 +1,57 @@
+import pytest
+
+from jobs.job_search import filter_suggestions
+from jobs.suggestion_index import SuggestionIndex
+from jobs.suggestions import JOB_SUGGESTIONS, LOCATION_SUGGESTIONS
+
+
+@pytest.fixture
+def index():
+    """Provides an index over a small catalogue."""
+    return SuggestionIndex([
+        {"text": "Software Engineer"},
+        {"text": "Data Engineer"},
+        {"text": "Engineering Manager"},
+        {"text": "Reengineering Specialist"},
+        {"text": "Data Scientist"},
+    ], max_results=3, max_depth=6)
+
+
+def texts(results):
+    return [s["text"] for s in results]
+
+
+def test_ranks_start_then_word_then_infix(index):
+    """Text-start matches come first, then word-start matches, then infix matches."""
+    assert texts(index.search("eng")) == ["Engineering Manager", "Software Engineer", "Data Engineer"]
+    assert texts(index.search("eng", limit=5)) == ["Engineering Manager", "Software Engineer", "Data Engineer"]
+    assert texts(index.search("ngineer")) == ["Software Engineer", "Data Engineer", "Engineering Manager"]
+
+
+def test_case_and_whitespace_insensitive(index):
+    """Queries are trimmed and lowercased."""
+    assert texts(index.search("  DATA s ")) == ["Data Scientist"]
+    assert index.search("") == []
+    assert index.search("xyz") == []
+
+
+def test_queries_longer_than_depth(index):
+    """Queries past the trie depth are verified against the stored candidates."""
+    assert texts(index.search("reengineering spec")) == ["Reengineering Specialist"]
+    assert texts(index.search("data engineer")) == ["Data Engineer"]
+
+
+@pytest.mark.parametrize("catalogue", [JOB_SUGGESTIONS, LOCATION_SUGGESTIONS])
+@pytest.mark.parametrize("query", ["de", "eng", "an", "developer", "ba", "pu", "data", "full stack dev"])
+def test_matches_linear_scan(catalogue, query):
+    """The index returns the same entries as a substring scan."""
+    expected = {s["text"] for s in catalogue if query in s["text"].lower()}
+    results = SuggestionIndex(catalogue, max_results=len(catalogue)).search(query)
+    assert {s["text"] for s in results} == expected
+
+
+def test_filter_suggestions_limits_results():
+    """filter_suggestions keeps returning at most five entries."""
+    results = filter_suggestions("developer", JOB_SUGGESTIONS)
+    assert len(results) == 5
+    assert all("developer" in s["text"].lower() for s in results)
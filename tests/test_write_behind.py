@@ -0,0 +1,142 @@
+import json
+import threading
+import time
+
+import pytest
+
+import config.database as database
+import services.write_behind as write_behind
+from services.write_behind import WriteBehindQueue
+from utils.metrics import get_metrics_snapshot
+
+
+class FlakyStore:
+    """Batch writer that fails a set number of times, and always for poisoned items."""
+
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.batches = []
+        self.gate = threading.Event()
+        self.gate.set()
+
+    def __call__(self, items):
+        self.gate.wait(5)
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("database unavailable")
+        if any(item.get("poison") for item in items):
+            raise ValueError("bad record")
+        self.batches.append(list(items))
+
+
+@pytest.fixture
+def make_queue(tmp_path):
+    queues = []
+
+    def make(store, **kwargs):
+        writer = WriteBehindQueue(store, name="tests.writes", dead_letter_path=str(tmp_path / "dead.jsonl"),
+                                  db_path=str(tmp_path / "outbox.db"), flush_interval=0.05, retry_backoff=0, **kwargs)
+        queues.append(writer)
+        return writer
+    yield make
+    for writer in queues:
+        writer.stop()
+
+
+def test_items_are_written_in_batches(make_queue):
+    """Items queued while a write is in progress go out together in the next batches."""
+    store = FlakyStore()
+    store.gate.clear()
+    writer = make_queue(store, batch_size=10)
+    writer.submit({"id": 0})
+    while writer.stats()["pending"]:
+        time.sleep(0.001)
+    for i in range(1, 25):
+        writer.submit({"id": i})
+    store.gate.set()
+    assert writer.flush(timeout=5)
+
+    assert [len(batch) for batch in store.batches] == [1, 10, 10, 4]
+    assert [item["id"] for batch in store.batches for item in batch] == list(range(25))
+
+
+def test_failed_batches_are_retried(make_queue):
+    store = FlakyStore(failures=2)
+    writer = make_queue(store)
+    writer.submit({"id": 1})
+    assert writer.flush(timeout=5)
+
+    assert store.batches == [[{"id": 1}]]
+    stats = writer.stats()
+    assert stats["retries"] == 2
+    assert stats["written"] == 1
+    assert stats["pending"] == 0
+    assert any(row["operation"] == "tests.writes.lag" for row in get_metrics_snapshot())
+
+
+def test_poison_items_are_dead_lettered_and_replayed(make_queue, tmp_path):
+    """A bad item is isolated from its batch, kept on disk and can be resubmitted."""
+    store = FlakyStore()
+    store.gate.clear()
+    writer = make_queue(store, batch_size=10, max_retries=1)
+    writer.submit({"id": 0})
+    while writer.stats()["pending"]:
+        time.sleep(0.001)
+    for item in ({"id": 1}, {"id": 2, "poison": True}, {"id": 3}):
+        writer.submit(item)
+    store.gate.set()
+    assert writer.flush(timeout=5)
+
+    assert store.batches == [[{"id": 0}], [{"id": 1}], [{"id": 3}]]
+    entries = [json.loads(line) for line in (tmp_path / "dead.jsonl").read_text().splitlines()]
+    assert [(e["item"], e["error"]) for e in entries] == [({"id": 2, "poison": True}, "bad record")]
+    assert writer.stats()["dead_lettered"] == 1
+
+    entries[0]["item"].pop("poison")
+    (tmp_path / "dead.jsonl").write_text(json.dumps(entries[0]) + "\n")
+    assert writer.replay_dead_letters() == 1
+    assert writer.flush(timeout=5)
+    assert store.batches[-1] == [{"id": 2}]
+    assert not (tmp_path / "dead.jsonl").exists()
+
+
+def test_items_survive_a_restart(make_queue):
+    """Items persisted by a process that died, claimed or not, are written by the next writer."""
+    crashed = make_queue(FlakyStore())
+    crashed.start = lambda: None
+    crashed.submit({"id": 1})
+    assert crashed._next_batch()[0][2] == {"id": 1}
+    crashed.submit({"id": 2})
+
+    store = FlakyStore()
+    writer = make_queue(store, claim_timeout=0)
+    writer.start()
+    assert writer.flush(timeout=5)
+    assert store.batches == [[{"id": 1}, {"id": 2}]]
+    assert writer.stats()["pending"] == 0
+
+
+def test_exit_flush_is_registered_once(make_queue, monkeypatch):
+    registered = []
+    monkeypatch.setattr(write_behind.atexit, "register", lambda func, *args: registered.append(func))
+    writer = make_queue(FlakyStore())
+    writer.start()
+    writer._thread = threading.Thread(target=lambda: None)
+    writer.submit({"id": 1})
+    assert writer.flush(timeout=5)
+    assert registered == [writer.flush]
+
+
+def test_save_resume_data_batch(sqlite_db):
+    ids = database.save_resume_data_batch([
+        {"personal_info": {"full_name": "Ada"}, "experience": [{"company": "Analytical Engines"}]},
+        {"personal_info": {"full_name": "Grace"}},
+    ])
+    assert len(ids) == 2
+    with sqlite_db.connect() as conn:
+        assert conn.exec_driver_sql("SELECT COUNT(*) FROM experiences").scalar() == 1
+
+    with pytest.raises(AttributeError):
+        database.save_resume_data_batch([{"experience": ["not a dict"]}])
+    with sqlite_db.connect() as conn:
+        assert conn.exec_driver_sql("SELECT COUNT(*) FROM resume_data").scalar() == 2
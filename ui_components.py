@@ -1046,7 +1046,7 @@ def render_sidebar(pages, load_lottie_url, is_admin, current_admin_email, verify
     with st.sidebar:
         # Custom CSS for sidebar styling is now in style/style.css
 
-        st_lottie(load_lottie_url("https://assets5.lottiefiles.com/packages/lf20_xyadoh9h.json"), height=180, key="sidebar_animation")
+        st_lottie(load_lottie_url("https://assets5.lottiefiles.com/packages/lf20_xyadoh9h.json", "sidebar"), height=180, key="sidebar_animation")
         st.markdown('<div class="sidebar-header">Smart Resume AI</div>', unsafe_allow_html=True)
         st.markdown("---")
         
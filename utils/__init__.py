@@ -1,9 +1,26 @@
 """
 Utils package for Smart Resume AI
 """
+import importlib
 
-from .resume_analyzer import ResumeAnalyzer
-from .resume_builder import ResumeBuilder
-from .resume_parser import ResumeParser
-from .excel_manager import ExcelManager
-from .database import * 
+# Package exports, imported on first access so that loading one utility
+# (e.g. utils.logger) does not pull in python-docx or SQLAlchemy
+_EXPORTS = {
+    "ResumeAnalyzer": ".resume_analyzer",
+    "ResumeBuilder": ".resume_builder",
+    "ResumeParser": ".resume_parser",
+    "ExcelManager": ".excel_manager",
+    "Base": ".database",
+    "Resume": ".database",
+    "Analysis": ".database",
+    "DatabaseManager": ".database",
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
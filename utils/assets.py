@@ -0,0 +1,191 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import urllib.parse
+
+import requests
+
+ASSET_DIR = "style"
+LOTTIE_DIR = os.path.join(ASSET_DIR, "lottie")
+
+# Seconds before an animation that could not be fetched is tried again
+LOTTIE_RETRY_AFTER = 300
+
+# Simple loading animation for when an animation is neither bundled nor reachable
+FALLBACK_LOTTIE = {
+    "v": "5.7.4",
+    "fr": 60,
+    "ip": 0,
+    "op": 120,
+    "w": 200,
+    "h": 200,
+    "assets": [],
+    "layers": [{
+        "ddd": 0,
+        "ind": 1,
+        "ty": 4,
+        "nm": "Circle",
+        "sr": 1,
+        "ks": {
+            "o": {"a": 0, "k": 100},
+            "r": {
+                "a": 1,
+                "k": [{"t": 0, "s": [0]}, {"t": 120, "s": [360]}],
+                "ix": 10
+            },
+            "p": {"a": 0, "k": [100, 100, 0]},
+            "a": {"a": 0, "k": [0, 0, 0]},
+            "s": {"a": 0, "k": [100, 100, 100]}
+        },
+        "shapes": [{
+            "ty": "el",
+            "p": {"a": 0, "k": [0, 0]},
+            "s": {"a": 0, "k": [60, 60]},
+            "c": {"a": 0, "k": [0, 0.6, 1]}
+        }]
+    }]
+}
+
+class AssetManager:
+    """
+    Static assets (CSS and Lottie animations) loaded once per process.
+
+    Files are read on first use and served from memory afterwards. Lottie
+    animations are bundled under style/lottie/, named after the last path
+    segment of their URL unless a name is given; the network is only used
+    by refresh_lottie() or when an animation has not been bundled yet, and
+    a fetched animation is written back to the bundle. A failed fetch is
+    not retried for `retry_after` seconds. Every asset exposes a short
+    content hash for cache-busting.
+    """
+
+    def __init__(self, asset_dir=ASSET_DIR, lottie_dir=LOTTIE_DIR, timeout=5,
+                 retry_after=LOTTIE_RETRY_AFTER, clock=time.monotonic):
+        self.asset_dir = asset_dir
+        self.lottie_dir = lottie_dir
+        self.timeout = timeout
+        self.retry_after = retry_after
+        self.clock = clock
+        self._text = {}    # name -> (content, hash)
+        self._lottie = {}  # name -> (animation, hash)
+        self._failed_at = {}  # name -> clock time of the last failed fetch
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def content_hash(content: str) -> str:
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()[:12]
+
+    def get_text(self, name: str) -> str:
+        """Contents of a file in the asset directory"""
+        return self._load_text(name)[0]
+
+    def _load_text(self, name: str):
+        cached = self._text.get(name)
+        if cached is None:
+            with self._lock:
+                cached = self._text.get(name)
+                if cached is None:
+                    with open(os.path.join(self.asset_dir, name), encoding="utf-8") as f:
+                        content = f.read()
+                    cached = (content, self.content_hash(content))
+                    self._text[name] = cached
+        return cached
+
+    def get_css(self, name: str = "style.css") -> str:
+        """A stylesheet wrapped in a <style> tag tagged with its content hash"""
+        content, digest = self._load_text(name)
+        return f'<style data-asset="{name}" data-hash="{digest}">{content}</style>'
+
+    def asset_hash(self, name: str) -> str:
+        """Content hash of a text asset or bundled Lottie animation"""
+        if name in self._lottie:
+            return self._lottie[name][1]
+        return self._load_text(name)[1]
+
+    @staticmethod
+    def lottie_name(url: str) -> str:
+        path = urllib.parse.urlsplit(url).path
+        return os.path.splitext(os.path.basename(path))[0]
+
+    def _bundle_path(self, name: str) -> str:
+        return os.path.join(self.lottie_dir, f"{name}.json")
+
+    def _fetch_lottie(self, url: str):
+        try:
+            r = requests.get(url, timeout=self.timeout)
+            if r.status_code == 200:
+                return r.json()
+        except (requests.RequestException, ValueError):
+            pass
+        return None
+
+    def _store_lottie(self, name: str, animation) -> dict:
+        content = json.dumps(animation, sort_keys=True)
+        self._lottie[name] = (animation, self.content_hash(content))
+        return animation
+
+    def get_lottie(self, url: str, name: str = None):
+        """
+        Lottie animation for `url`, from memory, the bundle or the network.
+
+        Returns None when the animation is neither bundled nor reachable.
+        """
+        name = name or self.lottie_name(url)
+        cached = self._lottie.get(name)
+        if cached is not None:
+            return cached[0]
+        failed_at = self._failed_at.get(name)
+        if failed_at is not None and self.clock() - failed_at < self.retry_after:
+            return None
+
+        with self._lock:
+            cached = self._lottie.get(name)
+            if cached is not None:
+                return cached[0]
+            try:
+                with open(self._bundle_path(name), encoding="utf-8") as f:
+                    return self._store_lottie(name, json.load(f))
+            except (OSError, ValueError):
+                pass
+
+        return self.refresh_lottie(url, name)
+
+    def refresh_lottie(self, url: str, name: str = None):
+        """Re-download an animation and update the bundle; keeps the old copy on failure"""
+        name = name or self.lottie_name(url)
+        animation = self._fetch_lottie(url)
+        with self._lock:
+            if animation is None:
+                cached = self._lottie.get(name)
+                if cached is None:
+                    self._failed_at[name] = self.clock()
+                return cached[0] if cached else None
+            self._failed_at.pop(name, None)
+            try:
+                os.makedirs(self.lottie_dir, exist_ok=True)
+                with open(self._bundle_path(name), "w", encoding="utf-8") as f:
+                    json.dump(animation, f)
+            except OSError:
+                pass
+            return self._store_lottie(name, animation)
+
+    def clear(self):
+        """Forget every loaded asset, e.g. after editing style.css"""
+        with self._lock:
+            self._text.clear()
+            self._lottie.clear()
+            self._failed_at.clear()
+
+_asset_manager = None
+_asset_manager_lock = threading.Lock()
+
+def get_asset_manager():
+    """Return the process-wide AssetManager, creating it on first use."""
+    global _asset_manager
+    if _asset_manager is None:
+        with _asset_manager_lock:
+            if _asset_manager is None:
+                _asset_manager = AssetManager()
+    return _asset_manager
@@ -1,6 +1,6 @@
 from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import declarative_base, sessionmaker
+from contextlib import contextmanager
 import datetime
 
 # Create the base class for declarative models
@@ -9,9 +9,9 @@ Base = declarative_base()
 # Define the Resume model
 class Resume(Base):
     __tablename__ = 'resumes'
-    
+
     id = Column(Integer, primary_key=True)
-    user_id = Column(String(100))
+    user_id = Column(String(100), index=True)
     job_role = Column(String(100))
     content = Column(Text)
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
@@ -20,49 +20,83 @@ class Resume(Base):
 # Define the Analysis model
 class Analysis(Base):
     __tablename__ = 'analyses'
-    
+
     id = Column(Integer, primary_key=True)
-    resume_id = Column(Integer)
+    resume_id = Column(Integer, index=True)
     analysis_data = Column(Text)  # Store JSON data
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
 
 class DatabaseManager:
+    """
+    SQLite store for resumes and analyses.
+
+    Every operation runs in its own short-lived session, so one manager can be
+    shared by Streamlit's script threads. Objects are returned detached with
+    their attributes already loaded.
+    """
+
     def __init__(self, db_path='resume_data.db'):
-        self.engine = create_engine(f'sqlite:///{db_path}')
+        self.engine = create_engine(
+            f'sqlite:///{db_path}',
+            connect_args={'check_same_thread': False}
+        )
         Base.metadata.create_all(self.engine)
-        Session = sessionmaker(bind=self.engine)
-        self.session = Session()
-    
+        # create_all skips tables that already exist, so add indexes missing
+        # from databases created before they were declared
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(self.engine, checkfirst=True)
+        self.Session = sessionmaker(bind=self.engine, expire_on_commit=False)
+
+    @contextmanager
+    def session_scope(self):
+        """Provide a transactional scope around a single operation."""
+        session = self.Session()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
     def save_resume(self, user_id, job_role, content):
         resume = Resume(
             user_id=user_id,
             job_role=job_role,
             content=content
         )
-        self.session.add(resume)
-        self.session.commit()
-        return resume.id
-    
+        with self.session_scope() as session:
+            session.add(resume)
+            session.flush()
+            return resume.id
+
     def get_resume(self, resume_id):
-        return self.session.query(Resume).filter(Resume.id == resume_id).first()
-    
+        with self.session_scope() as session:
+            return session.get(Resume, resume_id)
+
     def get_user_resumes(self, user_id):
-        return self.session.query(Resume).filter(Resume.user_id == user_id).all()
-    
+        with self.session_scope() as session:
+            return session.query(Resume).filter(Resume.user_id == user_id).all()
+
     def save_analysis(self, resume_id, analysis_data):
         analysis = Analysis(
             resume_id=resume_id,
             analysis_data=analysis_data
         )
-        self.session.add(analysis)
-        self.session.commit()
-        return analysis.id
-    
+        with self.session_scope() as session:
+            session.add(analysis)
+            session.flush()
+            return analysis.id
+
     def get_analysis(self, analysis_id):
-        return self.session.query(Analysis).filter(Analysis.id == analysis_id).first()
-    
+        with self.session_scope() as session:
+            return session.get(Analysis, analysis_id)
+
     def get_resume_analyses(self, resume_id):
-        return self.session.query(Analysis).filter(Analysis.resume_id == resume_id).all()
-    
+        with self.session_scope() as session:
+            return session.query(Analysis).filter(Analysis.resume_id == resume_id).all()
+
     def close(self):
-        self.session.close()
+        self.engine.dispose()
@@ -1,43 +1,171 @@
+import json
+import os
+import threading
+from contextlib import contextmanager
 import pandas as pd
 from datetime import datetime
 
+from utils.logger import setup_logger
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = setup_logger(__name__)
+
 class ExcelManager:
-    def __init__(self):
-        self.excel_file = "resume_data.xlsx"
-    
+    """
+    Stores resume records in an append-only JSON Lines file.
+
+    Each save appends a single line under an exclusive file lock instead of
+    rewriting a whole workbook, so inserts are O(1) and safe with several
+    writer processes. Reads stream the file line by line. Excel is kept as an
+    on-demand export format via export_to_excel().
+
+    A per-user index maps user_id to the byte offsets of that user's lines.
+    It is extended incrementally from the last indexed offset, so a user's
+    resumes are read with one seek per record instead of a full scan.
+
+    A writer that crashed mid-line leaves a broken line behind. The next
+    append starts on a fresh line, and readers skip the broken one with a
+    warning.
+    """
+
+    def __init__(self, store_file="resume_data.jsonl", excel_file="resume_data.xlsx"):
+        self.store_file = store_file
+        self.excel_file = excel_file
+        self._user_index = {}
+        self._indexed_bytes = 0
+        self._index_lock = threading.Lock()
+        self._import_legacy_workbook()
+
+    @contextmanager
+    def _locked(self, mode, exclusive):
+        """Open the store file holding an exclusive (writers) or shared (readers) lock."""
+        encoding = None if "b" in mode else "utf-8"
+        with open(self.store_file, mode, encoding=encoding) as f:
+            if fcntl:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+                try:
+                    yield f
+                finally:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            elif exclusive:
+                # msvcrt only has exclusive byte-range locks; lock the first byte
+                # as a mutex. Readers skip the lock and ignore partial lines.
+                position = f.tell()
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                f.seek(position)
+                try:
+                    yield f
+                finally:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                yield f
+
+    def _import_legacy_workbook(self):
+        """One-time import of a resume_data.xlsx written by the old Excel backend."""
+        if os.path.exists(self.store_file) or not os.path.exists(self.excel_file):
+            return
+        try:
+            df = pd.read_excel(self.excel_file)
+        except Exception as e:
+            print(f"Error importing legacy Excel data: {str(e)}")
+            return
+        records = df.astype(object).where(df.notna(), None).to_dict(orient="records")
+        self._append(json.dumps(record, default=str) + "\n" for record in records)
+
+    def _append(self, lines):
+        """Append complete lines in one locked write, after terminating any broken last line."""
+        data = "".join(lines).encode("utf-8")
+        with self._locked("ab+", exclusive=True) as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell():
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    data = b"\n" + data
+            f.write(data)
+            f.flush()
+
     def save_resume_data(self, user_id, job_role, content, analysis_data=None):
         try:
-            # Try to read existing Excel file
-            try:
-                df = pd.read_excel(self.excel_file)
-            except FileNotFoundError:
-                df = pd.DataFrame()
-            
-            # Create new data entry
             new_data = {
                 'user_id': user_id,
                 'job_role': job_role,
                 'content': content,
-                'analysis_data': str(analysis_data) if analysis_data else None,
+                'analysis_data': analysis_data,
                 'created_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             }
-            
-            # Append new data
-            df = pd.concat([df, pd.DataFrame([new_data])], ignore_index=True)
-            
-            # Save to Excel
-            df.to_excel(self.excel_file, index=False)
+            line = json.dumps(new_data, default=str) + "\n"
+
+            # A single write of one complete line per save
+            self._append([line])
             return True
         except Exception as e:
-            print(f"Error saving to Excel: {str(e)}")
+            print(f"Error saving resume data: {str(e)}")
             return False
-    
-    def get_all_resumes(self):
+
+    def iter_resumes(self):
+        """Lazily yield stored resume records, oldest first."""
+        if not os.path.exists(self.store_file):
+            return
+        with self._locked("r", exclusive=False) as f:
+            for line in f:
+                # Skip a trailing line that a concurrent writer has not finished
+                if not line.endswith("\n"):
+                    break
+                record = self._parse(line)
+                if record is not None:
+                    yield record
+
+    def _parse(self, line):
+        """Decode one stored line; None, with a warning, for a line broken by a crashed writer."""
         try:
-            return pd.read_excel(self.excel_file)
-        except FileNotFoundError:
-            return pd.DataFrame()
-    
+            return json.loads(line)
+        except json.JSONDecodeError as e:
+            logger.warning("Skipping malformed line in %s: %s", self.store_file, e)
+            return None
+
+    def get_all_resumes(self):
+        return pd.DataFrame(list(self.iter_resumes()))
+
+    def _refresh_index(self, f):
+        """Index any lines appended since the last refresh. Caller holds _index_lock."""
+        size = os.fstat(f.fileno()).st_size
+        if size < self._indexed_bytes:
+            # The store was replaced or truncated; rebuild from scratch
+            self._user_index = {}
+            self._indexed_bytes = 0
+
+        f.seek(self._indexed_bytes)
+        offset = self._indexed_bytes
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            record = self._parse(line)
+            if record is not None:
+                self._user_index.setdefault(record.get('user_id'), []).append(offset)
+            offset += len(line)
+        self._indexed_bytes = offset
+
     def get_user_resumes(self, user_id):
-        df = self.get_all_resumes()
-        return df[df['user_id'] == user_id]
+        if not os.path.exists(self.store_file):
+            return pd.DataFrame()
+
+        records = []
+        with self._index_lock, self._locked("rb", exclusive=False) as f:
+            self._refresh_index(f)
+            for offset in self._user_index.get(user_id, []):
+                f.seek(offset)
+                records.append(json.loads(f.readline()))
+        return pd.DataFrame(records)
+
+    def export_to_excel(self, path=None):
+        """Write all stored resumes to an Excel workbook and return its path."""
+        path = path or self.excel_file
+        self.get_all_resumes().to_excel(path, index=False)
+        return path
@@ -1,34 +1,141 @@
+import atexit
+import json
 import logging
-import sys
+import logging.handlers
 import os
+import queue
+import sys
+import threading
+from datetime import datetime, timezone
+
+# Logging is configured from the environment:
+#   LOG_LEVEL         minimum level for application loggers (default INFO)
+#   LOG_DIR/LOG_FILE  log file location (default logs/app.log)
+#   LOG_FORMAT        "text" (default) or "json" for one JSON object per line
+#   LOG_ROTATION      "size" (default) or "time"
+#   LOG_MAX_BYTES     size rotation threshold (default 10 MB)
+#   LOG_ROTATE_WHEN   time rotation interval, as for TimedRotatingFileHandler (default midnight)
+#   LOG_BACKUP_COUNT  rotated files kept (default 5)
+#   LOG_CONSOLE       set to 0 to disable the stdout handler
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Attributes every LogRecord has; anything else was passed through `extra=`
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+class JSONFormatter(logging.Formatter):
+    """Formats records as single-line JSON objects, including `extra` fields."""
+
+    def format(self, record):
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "module": record.module,
+            "line": record.lineno,
+            "thread": record.threadName,
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc_info"] = record.exc_text
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        return json.dumps(entry, default=str)
+
+def _env_int(name, default):
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        return default
+
+def _env_level(name, default="INFO"):
+    """A logging level name from the environment; `default` when it is not a known level"""
+    level = os.getenv(name, default).strip().upper()
+    return level if isinstance(logging.getLevelName(level), int) else default
+
+def _build_handlers():
+    """The handlers run by the background listener, configured from the environment."""
+    log_dir = os.getenv("LOG_DIR", "logs")
+    os.makedirs(log_dir, exist_ok=True)
+    path = os.path.join(log_dir, os.getenv("LOG_FILE", "app.log"))
+    backups = _env_int("LOG_BACKUP_COUNT", 5)
+
+    if os.getenv("LOG_ROTATION", "size").lower() == "time":
+        file_handler = logging.handlers.TimedRotatingFileHandler(
+            path, when=os.getenv("LOG_ROTATE_WHEN", "midnight"), backupCount=backups, encoding="utf-8"
+        )
+    else:
+        file_handler = logging.handlers.RotatingFileHandler(
+            path, maxBytes=_env_int("LOG_MAX_BYTES", 10 * 1024 * 1024), backupCount=backups, encoding="utf-8"
+        )
+
+    if os.getenv("LOG_FORMAT", "text").lower() == "json":
+        formatter = JSONFormatter()
+    else:
+        formatter = logging.Formatter(TEXT_FORMAT)
+
+    handlers = [file_handler]
+    if os.getenv("LOG_CONSOLE", "1") != "0":
+        handlers.append(logging.StreamHandler(sys.stdout))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    return handlers
+
+# One queue for the process. QueueHandler.prepare() merges each message with
+# its args in the calling thread; timestamps, JSON encoding and I/O happen on
+# the listener's background thread.
+_log_queue = queue.SimpleQueue()
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_listener = None
+_lock = threading.Lock()
+_atexit_registered = False
+
+def _ensure_listener():
+    """Start the background writer if it is not running."""
+    global _listener, _atexit_registered
+    if _listener is None:
+        with _lock:
+            if _listener is None:
+                _listener = logging.handlers.QueueListener(
+                    _log_queue, *_build_handlers(), respect_handler_level=True
+                )
+                _listener.start()
+                if not _atexit_registered:
+                    atexit.register(shutdown_logging)
+                    _atexit_registered = True
+
+def shutdown_logging():
+    """
+    Flush queued records and stop the background writer.
+
+    Records logged afterwards wait on the queue until the next
+    setup_logger() call starts a writer with the current configuration.
+    """
+    global _listener
+    with _lock:
+        if _listener is not None:
+            _listener.stop()
+            for handler in _listener.handlers:
+                handler.close()
+            _listener = None
 
 def setup_logger(name=__name__):
     """
     Configure and return a logger instance.
-    """
-    # Create logs directory if it doesn't exist
-    if not os.path.exists('logs'):
-        os.makedirs('logs')
 
+    Records are put on a queue and written by a background thread, so the
+    calling thread never waits on file or console I/O. Use %-style arguments
+    (logger.debug("Saved %s", resume_id)) so messages below the logger's
+    level are never formatted.
+    """
+    _ensure_listener()
     logger = logging.getLogger(name)
-    
-    # Only add handlers if the logger doesn't have them already
-    if not logger.handlers:
-        logger.setLevel(logging.INFO)
-        
-        # Create formatters
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        
-        # File Handler
-        file_handler = logging.FileHandler('logs/app.log')
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-        
-        # Console Handler
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
-        
+
+    # Only add the handler if the logger doesn't have it already
+    if _queue_handler not in logger.handlers:
+        logger.setLevel(_env_level("LOG_LEVEL"))
+        logger.addHandler(_queue_handler)
+
     return logger
@@ -0,0 +1,200 @@
+import bisect
+import functools
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Histogram bucket upper bounds in seconds, from fast DB reads to LLM calls
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+METRIC_PREFIX = "smart_resume_operation"
+
+class Histogram:
+    """Cumulative-bucket latency histogram for one operation."""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.errors = 0
+        self.max = 0.0
+
+    def observe(self, seconds, error=False):
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+        if error:
+            self.errors += 1
+
+    def quantile(self, q):
+        """Estimate a quantile by interpolating inside its bucket."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            if seen + bucket_count >= rank and bucket_count:
+                lower = self.buckets[i - 1] if i else 0.0
+                upper = self.buckets[i] if i < len(self.buckets) else self.max
+                return lower + (upper - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+        return self.max
+
+class MetricsRegistry:
+    """
+    Thread-safe set of per-operation histograms.
+
+    Operations are timed with timed(), which works as a decorator or a
+    context manager. Exceptions are counted as errors and re-raised.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name, seconds, error=False):
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = Histogram(self.buckets)
+            histogram.observe(seconds, error)
+
+    def timed(self, name):
+        return _Timer(self, name)
+
+    def snapshot(self):
+        """Per-operation summary, in milliseconds, sorted by total time spent"""
+        with self._lock:
+            rows = [
+                {
+                    "operation": name,
+                    "count": h.count,
+                    "errors": h.errors,
+                    "total_ms": round(h.sum * 1000, 2),
+                    "avg_ms": round(h.sum / h.count * 1000, 2) if h.count else 0.0,
+                    "p50_ms": round(h.quantile(0.5) * 1000, 2),
+                    "p95_ms": round(h.quantile(0.95) * 1000, 2),
+                    "max_ms": round(h.max * 1000, 2),
+                }
+                for name, h in self._histograms.items()
+            ]
+        return sorted(rows, key=lambda row: -row["total_ms"])
+
+    def to_prometheus(self):
+        """The histograms in the Prometheus text exposition format"""
+        lines = [
+            f"# HELP {METRIC_PREFIX}_duration_seconds Time spent in instrumented operations.",
+            f"# TYPE {METRIC_PREFIX}_duration_seconds histogram",
+        ]
+        errors = [
+            f"# HELP {METRIC_PREFIX}_errors_total Instrumented operations that raised an exception.",
+            f"# TYPE {METRIC_PREFIX}_errors_total counter",
+        ]
+        with self._lock:
+            for name in sorted(self._histograms):
+                h = self._histograms[name]
+                label = name.replace("\\", "\\\\").replace('"', '\\"')
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets + ("+Inf",), h.counts):
+                    cumulative += bucket_count
+                    lines.append(f'{METRIC_PREFIX}_duration_seconds_bucket{{operation="{label}",le="{bound}"}} {cumulative}')
+                lines.append(f'{METRIC_PREFIX}_duration_seconds_sum{{operation="{label}"}} {h.sum:.6f}')
+                lines.append(f'{METRIC_PREFIX}_duration_seconds_count{{operation="{label}"}} {h.count}')
+                errors.append(f'{METRIC_PREFIX}_errors_total{{operation="{label}"}} {h.errors}')
+        return "\n".join(lines + errors) + "\n"
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+
+class _Timer:
+    """Times a block (`with timed(...)`) or every call of a function (`@timed(...)`)."""
+
+    def __init__(self, registry, name):
+        self.registry = registry
+        self.name = name
+        self._starts = threading.local()
+
+    def __enter__(self):
+        stack = getattr(self._starts, "stack", None)
+        if stack is None:
+            stack = self._starts.stack = []
+        stack.append(time.perf_counter())
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        start = self._starts.stack.pop()
+        self.registry.observe(self.name, time.perf_counter() - start, error=exc_type is not None)
+        return False
+
+    def __call__(self, func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            error = True
+            try:
+                result = func(*args, **kwargs)
+                error = False
+                return result
+            finally:
+                self.registry.observe(self.name, time.perf_counter() - start, error=error)
+        return wrapper
+
+REGISTRY = MetricsRegistry()
+
+def timed(name):
+    """Record the duration of an operation in the process-wide registry"""
+    return REGISTRY.timed(name)
+
+def get_metrics_snapshot():
+    return REGISTRY.snapshot()
+
+def render_prometheus():
+    return REGISTRY.to_prometheus()
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = render_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+_server = None
+_server_lock = threading.Lock()
+
+def start_metrics_server(port=None, host="0.0.0.0"):
+    """
+    Serve /metrics for Prometheus on a background thread.
+
+    The port defaults to the METRICS_PORT environment variable; without it
+    no server is started. Safe to call on every rerun.
+    """
+    global _server
+    port = port if port is not None else os.getenv("METRICS_PORT")
+    if port in (None, ""):
+        return None
+    with _server_lock:
+        if _server is None:
+            try:
+                _server = ThreadingHTTPServer((host, int(port)), _MetricsHandler)
+            except OSError as e:
+                logger.warning("Could not start metrics server on port %s: %s", port, e)
+                return None
+            threading.Thread(target=_server.serve_forever, name="metrics-server", daemon=True).start()
+            logger.info("Serving metrics on http://%s:%s/metrics", host, _server.server_address[1])
+    return _server
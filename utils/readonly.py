@@ -0,0 +1,10 @@
+"""Read-only views of module-level catalogue data"""
+from types import MappingProxyType
+
+def freeze(value):
+    """Recursively turn dicts into MappingProxyType and lists into tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
@@ -8,6 +8,7 @@ from docx.oxml.ns import nsdecls
 from io import BytesIO
 import tempfile
 import traceback
+from utils.metrics import timed
 
 class ResumeBuilder:
     def __init__(self):
@@ -192,6 +193,7 @@ class ResumeBuilder:
         # Return original text for now - replace with actual AI call
         return text
     
+    @timed("docx.generate_resume")
     def generate_resume(self, data):
         """Generate a resume based on the provided data and template"""
         try:
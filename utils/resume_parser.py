@@ -2,6 +2,7 @@ import PyPDF2
 import docx
 import re
 from io import BytesIO
+from utils.metrics import timed
 
 class ResumeParser:
     def __init__(self):
@@ -29,6 +30,7 @@ class ResumeParser:
             print(f"Error extracting text from DOCX: {e}")
             return ""
             
+    @timed("resume_parser.extract_text")
     def extract_text(self, file):
         file_content = file.read()
         file.seek(0)  # Reset file pointer
@@ -53,6 +55,7 @@ class ResumeParser:
                 skills.append(skill)
         return list(set(skills))  # Return unique skills
 
+    @timed("resume_parser.parse")
     def parse(self, file):
         text = self.extract_text(file)
         
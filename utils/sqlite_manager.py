@@ -0,0 +1,123 @@
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+DEFAULT_POOL_SIZE = 5
+DEFAULT_BUSY_TIMEOUT = 5.0
+
+class SQLiteConnectionManager:
+    """
+    Thread-safe pool of SQLite connections for one database file.
+
+    Connections are opened once and reused. Each is switched to WAL journaling
+    so readers never block the writer, and given a busy timeout so concurrent
+    writers wait for the lock instead of failing with "database is locked".
+    The schema script runs once, when the manager is created.
+    """
+
+    def __init__(self, db_path, schema=None, pool_size=DEFAULT_POOL_SIZE, busy_timeout=DEFAULT_BUSY_TIMEOUT):
+        self.db_path = db_path
+        self.pool_size = pool_size
+        self.busy_timeout = busy_timeout
+        self._pool = queue.LifoQueue(maxsize=pool_size)
+        self._created = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        if schema:
+            with self.connection() as conn:
+                conn.executescript(schema)
+
+    def _connect(self):
+        # isolation_level=None leaves transaction control to transaction()
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.busy_timeout,
+            isolation_level=None,
+            check_same_thread=False
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout * 1000)}")
+        return conn
+
+    def _acquire(self):
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if self._created < self.pool_size:
+                self._created += 1
+                try:
+                    return self._connect()
+                except Exception:
+                    self._created -= 1
+                    raise
+
+        # Pool exhausted: wait for another thread to hand a connection back
+        return self._pool.get(timeout=self.busy_timeout)
+
+    @contextmanager
+    def connection(self):
+        """Borrow a pooled connection for the duration of the block."""
+        conn = self._acquire()
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
+
+    @contextmanager
+    def transaction(self):
+        """
+        Borrow a connection inside a write transaction.
+
+        BEGIN IMMEDIATE takes the write lock up front, so two writers queue on
+        the busy timeout instead of deadlocking on a lock upgrade.
+        """
+        with self.connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def close(self):
+        """Close every idle pooled connection."""
+        while True:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+            with self._lock:
+                self._created -= 1
+
+_managers = {}
+_managers_lock = threading.Lock()
+
+def get_connection_manager(db_path, schema=None, **kwargs):
+    """
+    Return the process-wide manager for `db_path`, creating it on first use.
+
+    The schema only runs when the manager is created, so callers constructed
+    on every Streamlit rerun do not repeat their CREATE TABLE statements.
+    """
+    key = os.path.abspath(db_path)
+    manager = _managers.get(key)
+    if manager is None:
+        with _managers_lock:
+            manager = _managers.get(key)
+            if manager is None:
+                manager = SQLiteConnectionManager(db_path, schema=schema, **kwargs)
+                _managers[key] = manager
+    return manager
@@ -1,6 +1,6 @@
 import streamlit as st
+import logging
 import traceback
-from config.database import save_resume_data
 from ui_components import (
     render_personal_info_form, render_summary_form,
     render_experience_form, render_projects_form, 
@@ -8,10 +8,18 @@ from ui_components import (
     render_certifications_form  # ADD THIS IMPORT
 )
 from utils.logger import setup_logger
-from services.latex_generator import generate_latex_resume
+from services.container import GENERATE_RESUME_JOB, get_job_queue
+from services.job_queue import FAILED, FINISHED
 
 logger = setup_logger(__name__)
 
+# Seconds between status checks while a generation job runs
+JOB_POLL_SECONDS = 2
+
+def _section_sizes(data):
+    """Entry counts per resume section, for debug logs without the personal data itself"""
+    return {key: len(value) if isinstance(value, (list, dict, str)) else value for key, value in data.items()}
+
 def render_builder(builder):
     st.title("Resume Builder 📝")
     st.write("Create your professional resume")
@@ -61,13 +69,14 @@ def render_builder(builder):
     # Generate Resume button
     if st.button("Generate Resume 📄", type="primary"):
         logger.info("Validating form data...")
-        logger.debug(f"Session state form data: {st.session_state.form_data}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Form data sections: %s", _section_sizes(st.session_state.form_data))
         
         # Get the current values from form
         current_name = st.session_state.form_data['personal_info']['full_name'].strip()
         current_email = st.session_state.email_input if 'email_input' in st.session_state else ''
         
-        logger.info(f"Generating resume for: {current_name}")
+        logger.info("Generating resume for: %s", current_name)
         
         # Validate required fields
         if not current_name:
@@ -85,66 +94,97 @@ def render_builder(builder):
         # Update email in form data one final time
         st.session_state.form_data['personal_info']['email'] = current_email
         
-        # Show progress
-        with st.spinner(f'🤖 Generating {selected_template} resume for {job_role} role with AI...'):
-            try:
-                logger.info("Preparing resume data...")
-                # Prepare resume data with current form values
-                resume_data = {
-                    "personal_info": st.session_state.form_data['personal_info'],
-                    "summary": st.session_state.form_data.get('summary', '').strip(),
-                    "experience": st.session_state.form_data.get('experiences', []),
-                    "education": st.session_state.form_data.get('education', []),
-                    "projects": st.session_state.form_data.get('projects', []),
-                    "skills": st.session_state.form_data.get('skills_categories', {}),
-                    "certifications": st.session_state.form_data.get('certifications', []),  # ADD THIS
-                    "template": selected_template,
-                    "job_role": job_role.strip(),
-                    "experience_type": "professional"
-                }
-                
-                logger.debug(f"Resume data prepared: {resume_data}")
-                
-                try:
-                    # Generate LaTeX code using Groq API
-                    st.info(f"🎨 Generating {selected_template} resume tailored for {job_role} role...")
-                    latex_code = generate_latex_resume(resume_data, selected_template, job_role.strip())
-                    
-                    logger.info("LaTeX code received from Groq")
-                    
-                    # Store LaTeX code in session state for preview/download
-                    st.session_state['generated_latex'] = latex_code
-                    st.session_state['job_role'] = job_role.strip()
-                    
-                    # Save to database
-                    try:
-                        save_resume_data(resume_data)
-                        logger.info("Resume data saved to database")
-                    except Exception as db_error:
-                        logger.warning(f"Failed to save to database: {str(db_error)}")
-                    
-                    # Success message
-                    st.success(f"✅ Resume generated successfully for {job_role} role with Groq AI!")
-                    
-                    # Display LaTeX code in an expander
-                    with st.expander("📝 View Generated LaTeX Code"):
-                        st.code(latex_code, language='latex')
-                    
-                    # Download button for LaTeX file
-                    st.download_button(
-                        label="Download LaTeX Code (.tex) 📥",
-                        data=latex_code,
-                        file_name=f"{current_name.replace(' ', '_')}_{job_role.replace(' ', '_')}_resume.tex",
-                        mime="text/plain"
-                    )
-                    
-                    st.info("💡 Tip: You can compile this LaTeX code using Overleaf or a local LaTeX compiler to generate a PDF.")
+        try:
+            logger.info("Preparing resume data...")
+            # Prepare resume data with current form values
+            resume_data = {
+                "personal_info": st.session_state.form_data['personal_info'],
+                "summary": st.session_state.form_data.get('summary', '').strip(),
+                "experience": st.session_state.form_data.get('experiences', []),
+                "education": st.session_state.form_data.get('education', []),
+                "projects": st.session_state.form_data.get('projects', []),
+                "skills": st.session_state.form_data.get('skills_categories', {}),
+                "certifications": st.session_state.form_data.get('certifications', []),  # ADD THIS
+                "template": selected_template,
+                "job_role": job_role.strip(),
+                "experience_type": "professional"
+            }
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Resume data prepared: %s", _section_sizes(resume_data))
+            
+            # Generation runs on a background worker, so it survives reruns and
+            # leaving the page; the job id is all the session keeps
+            job_id = get_job_queue().submit(GENERATE_RESUME_JOB, {
+                "resume_data": resume_data,
+                "template": selected_template,
+                "job_role": job_role.strip()
+            })
+            st.session_state['resume_job'] = {
+                "id": job_id,
+                "name": current_name,
+                "template": selected_template,
+                "job_role": job_role.strip()
+            }
                     
-                except Exception as groq_error:
-                    logger.error(f"Error calling Groq API: {str(groq_error)}", exc_info=True)
-                    st.error(f"❌ Error generating resume with Groq: {str(groq_error)}")
-                    st.info("Please check your GROQ_API_KEY in the .env file")
-                        
-            except Exception as e:
-                logger.error(f"Error preparing resume data: {str(e)}", exc_info=True)
-                st.error(f"❌ Error preparing resume data: {str(e)}")
\ No newline at end of file
+        except Exception as e:
+            logger.error("Error preparing resume data: %s", e, exc_info=True)
+            st.error(f"❌ Error starting resume generation: {str(e)}")
+            return
+    
+    if 'resume_job' in st.session_state:
+        render_resume_job(st.session_state['resume_job'])
+
+def render_resume_job(job_info):
+    """Progress of the session's generation job while it runs, then its result"""
+    job = get_job_queue().get(job_info['id'])
+    if job is None:
+        del st.session_state['resume_job']
+        return
+    
+    if job['status'] not in FINISHED:
+        render_job_progress(job_info)
+        return
+    
+    if job['status'] == FAILED:
+        del st.session_state['resume_job']
+        st.error(f"❌ Error generating resume with Groq: {job['error']}")
+        st.info("Please check your GROQ_API_KEY in the .env file")
+        return
+    
+    latex_code = job['result']['latex']
+    current_name = job_info['name']
+    job_role = job_info['job_role']
+    
+    # Store LaTeX code in session state for preview/download
+    st.session_state['generated_latex'] = latex_code
+    st.session_state['job_role'] = job_role
+    
+    # Success message
+    st.success(f"✅ Resume generated successfully for {job_role} role with Groq AI!")
+    
+    # Display LaTeX code in an expander
+    with st.expander("📝 View Generated LaTeX Code"):
+        st.code(latex_code, language='latex')
+    
+    # Download button for LaTeX file
+    st.download_button(
+        label="Download LaTeX Code (.tex) 📥",
+        data=latex_code,
+        file_name=f"{current_name.replace(' ', '_')}_{job_role.replace(' ', '_')}_resume.tex",
+        mime="text/plain"
+    )
+    
+    st.info("💡 Tip: You can compile this LaTeX code using Overleaf or a local LaTeX compiler to generate a PDF.")
+
+@st.fragment(run_every=JOB_POLL_SECONDS)
+def render_job_progress(job_info):
+    """Reruns on its own every few seconds; reruns the whole page once the job is done"""
+    job = get_job_queue().get(job_info['id'])
+    if job is None or job['status'] in FINISHED:
+        st.rerun()
+    
+    st.info(
+        f"🤖 Generating {job_info['template']} resume for {job_info['job_role']} role with AI... "
+        "You can keep editing or leave this page; the resume will be here when you come back."
+    )
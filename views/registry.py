@@ -0,0 +1,93 @@
+"""Lazy page registry: view modules are imported when their page is first rendered"""
+import importlib
+import sys
+import threading
+import time
+from typing import Callable, Dict, List, NamedTuple, Tuple
+
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+class ImportRecord(NamedTuple):
+    module: str
+    seconds: float
+    imported_at: float
+
+_import_log: List[ImportRecord] = []
+_import_lock = threading.RLock()
+
+def import_module(module_name: str):
+    """
+    Import a module, recording how long it took on first import.
+
+    Modules that are already loaded are returned from sys.modules without
+    a record, so the log only holds real import costs.
+    """
+    module = sys.modules.get(module_name)
+    if module is not None:
+        return module
+    with _import_lock:
+        module = sys.modules.get(module_name)
+        if module is not None:
+            return module
+        start = time.perf_counter()
+        module = importlib.import_module(module_name)
+        seconds = time.perf_counter() - start
+        _import_log.append(ImportRecord(module_name, seconds, time.time()))
+    logger.info("Imported %s in %.1f ms", module_name, seconds * 1000)
+    return module
+
+def get_import_stats() -> List[Dict]:
+    """Lazy imports performed so far, slowest first"""
+    return [
+        {"module": r.module, "ms": round(r.seconds * 1000, 2), "imported_at": r.imported_at}
+        for r in sorted(_import_log, key=lambda r: -r.seconds)
+    ]
+
+def lazy_callable(module_name: str, attr: str) -> Callable:
+    """A function that imports `module_name` and calls its `attr` on first use"""
+    def call(*args, **kwargs):
+        return getattr(import_module(module_name), attr)(*args, **kwargs)
+    call.__name__ = attr
+    call.__qualname__ = f"lazy {module_name}.{attr}"
+    return call
+
+class Page(NamedTuple):
+    module: str
+    attr: str
+    # Returns the render function's arguments; called at render time
+    args: Callable[[], Tuple]
+
+class PageRegistry:
+    """
+    Maps page names to the view function that renders them.
+
+    Pages are registered by module path and function name; nothing is
+    imported until render() is called for the page. Registration order is
+    kept, so the registry can drive the sidebar navigation.
+    """
+
+    def __init__(self):
+        self._pages: Dict[str, Page] = {}
+
+    def register(self, name: str, module: str, attr: str, args: Callable[[], Tuple] = None):
+        self._pages[name] = Page(module, attr, args or tuple)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._pages
+
+    def names(self) -> List[str]:
+        return list(self._pages)
+
+    def resolve(self, name: str) -> Callable:
+        page = self._pages[name]
+        return getattr(import_module(page.module), page.attr)
+
+    def render(self, name: str):
+        page = self._pages[name]
+        return self.resolve(name)(*page.args())
+
+    def renderers(self) -> Dict[str, Callable]:
+        """{page name: zero-argument render function}, importing nothing up front"""
+        return {name: (lambda name=name: self.render(name)) for name in self._pages}